@@ -92,8 +92,10 @@ def _build_verification_rows(verifications):
         "workspace_hygiene":    "Workspace Hygiene",
         "python_syntax":        "Python Syntax",
         "ant_boundary":         "A.N.T Boundary",
+        "import_cycles":        "Import Cycles",
         "pipeline_integrity":   "Pipeline Integrity",
         "architecture_links":   "Architecture Links",
+        "code_references":      "Code References",
         "filesystem_integrity": "Filesystem Integrity",
         "python_packages":      "Python Packages",
         "schema_validation":    "Schema Validation",
@@ -157,12 +159,18 @@ def _extract_details(category, tool_data):
     elif category == "ant_boundary":
         return "Layer boundaries respected"
 
+    elif category == "import_cycles":
+        return "No import cycles"
+
     elif category == "pipeline_integrity":
         return "All tools registered"
 
     elif category == "architecture_links":
         return "No broken architecture links"
 
+    elif category == "code_references":
+        return "All code references resolve"
+
     return "OK"
 
 
@@ -274,10 +282,19 @@ def _render_failure_state(data):
         
     lines.append("")
     
+    lines.extend(_failure_footer_lines(data.get("verifications", {})))
+    
+    return "\n".join(lines)
+
+
+def _failure_footer_lines(verifications):
+    """Error details, impact and remediation shared by full and streamed output"""
+    lines = []
+
     # Print error details
     has_errors = False
-    for category, tool_data in data.get("verifications", {}).items():
-        if tool_data.get("status") not in ["ready", "healthy"]:
+    for category, tool_data in verifications.items():
+        if tool_data.get("status") not in ["ready", "healthy", "skipped"]:
             error_details = _extract_error_details(category, tool_data)
             if error_details:
                 if not has_errors:
@@ -299,7 +316,7 @@ def _render_failure_state(data):
     lines.append("")
     
     # Remediation
-    remediation_steps = _extract_remediation(data.get("verifications", {}))
+    remediation_steps = _extract_remediation(verifications)
     if remediation_steps:
         lines.append(formatter.lime("Required Actions:"))
         lines.append("")
@@ -309,8 +326,8 @@ def _render_failure_state(data):
     lines.append("")
     lines.append(formatter.error_indicator("Resolve errors before proceeding"))
     lines.append("")
-    
-    return "\n".join(lines)
+
+    return lines
 
 
 def _count_failures(verifications):
@@ -318,7 +335,7 @@ def _count_failures(verifications):
     count = 0
     for tool_data in verifications.values():
         status = tool_data.get("status", "")
-        if status not in ["ready", "healthy", "degraded"]:
+        if status not in ["ready", "healthy", "degraded", "skipped"]:
             count += 1
     return count
 
@@ -404,6 +421,14 @@ def _extract_error_details(category, tool_data):
             first = violations[0]
             details.append(f"First error: {first.get('import')} in {first.get('file')}:{first.get('line')}")
 
+    elif category == "import_cycles":
+        violations = tool_data.get("results", {}).get("violations", [])
+        count = len(violations)
+        details.append(f"{count} import cycle(s) detected")
+        if violations:
+            first = violations[0]
+            details.append(f"First cycle: {' -> '.join(first.get('cycle', []))}")
+
     elif category == "pipeline_integrity":
         violations = tool_data.get("results", {}).get("violations", [])
         count = len(violations)
@@ -420,6 +445,14 @@ def _extract_error_details(category, tool_data):
             first = violations[0]
             details.append(f"First error: {first.get('broken_link')} in {first.get('file')}:{first.get('line')}")
 
+    elif category == "code_references":
+        violations = tool_data.get("results", {}).get("violations", [])
+        count = len(violations)
+        details.append(f"{count} stale code reference(s) detected")
+        if violations:
+            first = violations[0]
+            details.append(f"First error: {first.get('reference')} in {first.get('file')}:{first.get('line')}")
+
     return details
 
 
@@ -430,7 +463,7 @@ def _extract_remediation(verifications):
     for category, tool_data in verifications.items():
         status = tool_data.get("status", "")
 
-        if status not in ["ready", "healthy", "degraded"]:
+        if status not in ["ready", "healthy", "degraded", "skipped"]:
             if category == "local_dependencies":
                 if not tool_data.get("python_version", {}).get("meets_requirement"):
                     steps.append("Upgrade Python to version 3.8 or higher")
@@ -480,6 +513,124 @@ def _extract_remediation(verifications):
     return steps
 
 
+# ============================================================================
+# STREAMING RENDERING
+# ============================================================================
+
+def render_verification_stream(events):
+    """
+    Render orchestrator NDJSON events incrementally.
+    
+    Each tool line is yielded the moment its finish event arrives, so a
+    slow tool never hides results that are already known. Only failed or
+    degraded tool results are retained, for the closing summary.
+    
+    Args:
+        events: Iterable of event dicts or NDJSON lines (orchestrator --stream)
+        
+    Yields:
+        str: Formatted terminal output chunks
+    """
+    failed = {}
+    degraded = {}
+    
+    for event in events:
+        if isinstance(event, str):
+            if not event.strip():
+                continue
+            event = json.loads(event)
+        
+        kind = event.get("event")
+        
+        if kind == "plan":
+            lines = [""]
+            lines.append(formatter.create_banner("GLAIDO OMNI-NEXUS — ENGINEERING VERIFICATION CORE", width=70))
+            lines.append("")
+            lines.append(formatter.kv_pair("Tools Scheduled", str(len(event.get("execution_order", []))), align=18))
+            lines.append("")
+            yield "\n".join(lines)
+        
+        elif kind == "finish":
+            category = event.get("category", "unknown")
+            tool_data = event.get("result", {})
+            status = tool_data.get("status", "unknown")
+            
+            if status == "degraded":
+                degraded[category] = tool_data
+            elif status not in ["ready", "healthy", "skipped"]:
+                failed[category] = tool_data
+            
+            status_line = _format_tool_status_line(category, tool_data)
+            yield f"{status_line} {formatter.dim('—')} {_extract_details(category, tool_data)}"
+        
+        elif kind == "complete":
+            yield _render_stream_summary(event.get("overall_status", "not_ready"), failed, degraded)
+
+
+def _render_stream_summary(overall_status, failed, degraded):
+    """Closing summary for a streamed run, built from retained problem tools only"""
+    lines = [""]
+    
+    if overall_status == "ready":
+        lines.append(formatter.kv_pair("Overall Status", "READY", align=18))
+        lines.append(formatter.kv_pair("System Ready", "Yes", align=18))
+        lines.append("")
+        lines.append(formatter.success_indicator("System is operational and ready for use"))
+        lines.append("")
+        return "\n".join(lines)
+    
+    if degraded and not failed:
+        lines.append(formatter.kv_pair("Overall Status", "OPERATIONAL (with warnings)", align=18))
+        lines.append(formatter.kv_pair("System Ready", "Yes (degraded)", align=18))
+        lines.append("")
+        lines.append(formatter.lime("Advisories:"))
+        lines.append("")
+        for warning in _extract_warnings(degraded):
+            lines.append(formatter.warning_indicator(warning))
+        lines.append("")
+        lines.append(formatter.info_indicator("System operational but review recommended"))
+        lines.append("")
+        return "\n".join(lines)
+    
+    lines.append(formatter.kv_pair("Overall Status", formatter.red("NOT READY"), align=18))
+    lines.append(formatter.kv_pair("System Ready", formatter.red("No"), align=18))
+    lines.append(formatter.kv_pair("Critical Failures", str(_count_failures(failed)), align=18))
+    lines.append("")
+    lines.extend(_failure_footer_lines(failed))
+    
+    return "\n".join(lines)
+
+
+# ============================================================================
+# WATCH MODE RENDERING
+# ============================================================================
+
+CLEAR_SCREEN = "\033[2J\033[H"
+
+
+def render_watch_frame(verification_json, rerun, duration_ms):
+    """
+    Render one frame of the live watch table.
+    
+    Args:
+        verification_json: Current merged orchestrator report
+        rerun: Categories re-verified for this frame
+        duration_ms: Wall time of the re-verification
+        
+    Returns:
+        str: Screen-clearing frame ready to print
+    """
+    lines = [CLEAR_SCREEN + render_verification_results(verification_json)]
+    
+    labels = ", ".join(category.replace("_", " ").title() for category in rerun) or "nothing"
+    lines.append(formatter.kv_pair("Re-verified", f"{labels} ({duration_ms:.0f} ms)", align=18))
+    lines.append(formatter.kv_pair("Updated at", datetime.now().strftime("%H:%M:%S"), align=18))
+    lines.append("")
+    lines.append(formatter.info_indicator("Watching for changes (Ctrl+C to stop)"))
+    
+    return "\n".join(lines)
+
+
 # ============================================================================
 # UTILITY FUNCTIONS
 # ============================================================================
@@ -493,8 +644,10 @@ def _format_tool_status_line(category, tool_data, show_warnings=False, show_erro
         "workspace_hygiene":    "Workspace Hygiene",
         "python_syntax":        "Python Syntax",
         "ant_boundary":         "A.N.T Boundary",
+        "import_cycles":        "Import Cycles",
         "pipeline_integrity":   "Pipeline Integrity",
         "architecture_links":   "Architecture Links",
+        "code_references":      "Code References",
         "filesystem_integrity": "Filesystem Integrity",
         "python_packages":      "Python Packages",
         "schema_validation":    "Schema Validation",
@@ -509,6 +662,8 @@ def _format_tool_status_line(category, tool_data, show_warnings=False, show_erro
         indicator = formatter.success_indicator(status.upper())
     elif status == "degraded":
         indicator = formatter.warning_indicator(status.upper())
+    elif status == "skipped":
+        indicator = formatter.info_indicator(status.upper())
     else:
         indicator = formatter.error_indicator(status.upper())
     
@@ -12,9 +12,14 @@ import io
 if sys.platform == "win32":
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
+import os
 import json
 from pathlib import Path
+import time
 import argparse
+import itertools
+import tempfile
+import threading
 import subprocess
 
 # Add modules to path
@@ -174,66 +179,324 @@ def cmd_route(args):
         error("Invalid JSON task data", service="cli")
 
 
+# Seconds allowed before the orchestrator announces its plan, and on top of
+# the summed per-tool budgets it announces
+VERIFY_STARTUP_TIMEOUT = 30
+VERIFY_GRACE_SECONDS = 10
+
+
+def _read_orchestrator_events(stream, report, raw_lines):
+    """
+    Parse NDJSON events from the orchestrator as they arrive.
+    
+    Finished tool results are folded into report for the engine snapshot;
+    lines that are not valid JSON are kept in raw_lines for diagnostics.
+    """
+    for line in stream:
+        if not line.strip():
+            continue
+        try:
+            event = json.loads(line)
+        except json.JSONDecodeError:
+            raw_lines.append(line.rstrip("\n"))
+            continue
+        
+        kind = event.get("event")
+        if kind == "finish":
+            report["verifications"][event["category"]] = event["result"]
+        elif kind == "complete":
+            report["orchestrator"] = event.get("orchestrator", "verification_orchestrator")
+            report["overall_status"] = event.get("overall_status", "not_ready")
+            report["execution_order"] = event.get("execution_order", [])
+            report["budget_overruns"] = event.get("budget_overruns", [])
+        
+        yield event
+
+
+def cmd_verify_watch(args):
+    """Re-run only the affected verification tools whenever files change."""
+    workspace_root = Path(__file__).resolve().parents[1]
+    if str(workspace_root) not in sys.path:
+        sys.path.insert(0, str(workspace_root))
+    
+    from navigation.orchestrator import verification_orchestrator as orchestrator
+    from navigation.orchestrator.change_watcher import watch_changes
+    
+    options = {
+        "isolated": args.isolated, "jobs": args.jobs, "use_cache": not args.no_cache, "fail_fast": args.fail_fast
+    }
+    if args.max_violations is not None:
+        os.environ[orchestrator.MAX_VIOLATIONS_ENV] = str(args.max_violations)
+    
+    started = time.perf_counter()
+    report = orchestrator.run_verification(**options)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    print(verification_renderer.render_watch_frame(report, report["execution_order"], elapsed_ms), flush=True)
+    
+    for modified, added, removed in watch_changes(workspace_root):
+        changed = set(orchestrator.categories_for_changes(modified, added, removed))
+        # Fail-fast skips, timeouts and crashes say nothing about the tree: re-run them too
+        rerun = [
+            category for category in report["execution_order"]
+            if category in changed or not orchestrator.reusable(report["verifications"].get(category, {}))
+        ]
+        
+        started = time.perf_counter()
+        partial = orchestrator.run_verification(only=rerun, **options)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        
+        results = dict(report["verifications"])
+        results.update(partial["verifications"])
+        report = orchestrator.build_report(results, report["execution_order"], partial["budget_overruns"])
+        print(verification_renderer.render_watch_frame(report, rerun, elapsed_ms), flush=True)
+
+
+def _verify_via_daemon(args, workspace):
+    """
+    Stream a verification run from a running daemon.
+    
+    Returns:
+        The folded report, or None when no daemon answered
+    """
+    if str(workspace) not in sys.path:
+        sys.path.insert(0, str(workspace))
+    
+    from navigation.orchestrator import verification_daemon
+    from navigation.orchestrator.verification_orchestrator import TIMEOUT_CEILING
+    
+    socket_path = verification_daemon.get_socket_path(workspace)
+    if not verification_daemon.daemon_supported() or not socket_path.exists():
+        return None
+    
+    options = {"isolated": args.isolated, "use_cache": not args.no_cache, "fail_fast": args.fail_fast}
+    if args.jobs is not None:
+        options["jobs"] = args.jobs
+    
+    # The daemon enforces per-tool budgets, so no single tool keeps the
+    # stream silent for longer than the largest budget it can be given
+    lines = verification_daemon.request(
+        {"command": "verify", "options": options},
+        socket_path,
+        timeout=TIMEOUT_CEILING + VERIFY_GRACE_SECONDS
+    )
+    try:
+        first = next(lines)
+    except (OSError, StopIteration):
+        return None  # Stale socket: fall back to local execution
+    
+    report = {"verifications": {}}
+    raw_lines = []
+    try:
+        events = _read_orchestrator_events(itertools.chain([first], lines), report, raw_lines)
+        for chunk in verification_renderer.render_verification_stream(events):
+            print(chunk, flush=True)
+    except OSError as e:
+        error(f"Lost connection to verification daemon: {e}", service="cli")
+        sys.exit(1)
+    
+    if "overall_status" not in report:
+        error("Verification daemon ended without a completion event", service="cli")
+        if raw_lines:
+            print("Raw output:")
+            print("\n".join(raw_lines))
+        sys.exit(1)
+    
+    return report
+
+
+def _build_engine_snapshot(report):
+    """Omega Extension: Build Engine Snapshot"""
+    try:
+        # Add root to path so we can import navigation
+        workspace_root = Path(__file__).resolve().parents[1]
+        if str(workspace_root) not in sys.path:
+            sys.path.insert(0, str(workspace_root))
+            
+        from navigation.intelligence.engine_status import build_engine_snapshot
+        build_engine_snapshot(json.dumps(report))
+    except Exception:
+        pass # Silently fail if components are unreachable during snapshot building
+
+
 def cmd_verify(args):
     """Run system verification."""
+    if args.watch:
+        if args.since:
+            error("--since cannot be combined with --watch", service="cli")
+            sys.exit(2)
+        return cmd_verify_watch(args)
+    
     # Get workspace root
     workspace = Path(__file__).resolve().parents[1]
+    
+    # The daemon answers for the whole tree with default options; scoped
+    # and capped runs stay local
+    if not args.no_daemon and not args.since and args.max_violations is None:
+        report = _verify_via_daemon(args, workspace)
+        if report is not None:
+            _build_engine_snapshot(report)
+            sys.exit(0 if report["overall_status"] == "ready" else 1)
+    
     orchestrator_path = workspace / "navigation" / "orchestrator" / "verification_orchestrator.py"
     
     if not orchestrator_path.exists():
         error(f"Orchestrator not found: {orchestrator_path}", service="cli")
         return
     
+    # Run verification orchestrator in streaming mode
+    command = [sys.executable, str(orchestrator_path), "--stream"]
+    if args.isolated:
+        command.append("--isolated")
+    if args.jobs is not None:
+        command.extend(["--jobs", str(args.jobs)])
+    if args.no_cache:
+        command.append("--no-cache")
+    if args.fail_fast:
+        command.append("--fail-fast")
+    if args.since:
+        command.extend(["--since", args.since])
+    if args.max_violations is not None:
+        command.extend(["--max-violations", str(args.max_violations)])
+    
     try:
-        # Run verification orchestrator
-        result = subprocess.run(
-            [sys.executable, str(orchestrator_path)],
-            capture_output=True,
-            text=True,
-            timeout=120
-        )
-        
-        # Parse JSON output
-        try:
-            verification_data = json.loads(result.stdout)
+        with tempfile.TemporaryFile(mode="w+", encoding="utf-8") as stderr_file:
+            process = subprocess.Popen(
+                command,
+                stdout=subprocess.PIPE,
+                stderr=stderr_file,
+                text=True,
+                encoding="utf-8",
+                bufsize=1
+            )
+            timed_out = threading.Event()
+            watchdog = {"timer": None, "seconds": VERIFY_STARTUP_TIMEOUT}
+            
+            def _expire():
+                timed_out.set()
+                process.kill()
+            
+            def _arm(seconds):
+                if watchdog["timer"] is not None:
+                    watchdog["timer"].cancel()
+                watchdog["seconds"] = seconds
+                watchdog["timer"] = threading.Timer(seconds, _expire)
+                watchdog["timer"].start()
+            
+            def _budgeted(events):
+                # The plan event carries the sum of per-tool budgets: the
+                # whole run can never legitimately take longer than that.
+                for event in events:
+                    if event.get("event") == "plan" and event.get("budget_seconds"):
+                        _arm(event["budget_seconds"] + VERIFY_GRACE_SECONDS)
+                    yield event
             
-            # Omega Extension: Build Engine Snapshot
+            _arm(VERIFY_STARTUP_TIMEOUT)
+            
+            report = {"verifications": {}}
+            raw_lines = []
             try:
-                # Add root to path so we can import navigation
-                workspace_root = Path(__file__).resolve().parents[1]
-                if str(workspace_root) not in sys.path:
-                    sys.path.insert(0, str(workspace_root))
-                    
-                from navigation.intelligence.engine_status import build_engine_snapshot
-                build_engine_snapshot(result.stdout)
-            except Exception:
-                pass # Silently fail if components are unreachable during snapshot building
-                
-        except json.JSONDecodeError as e:
-            error(f"Failed to parse orchestrator output: {e}", service="cli")
-            if result.stdout:
-                print("Raw output:")
-                print(result.stdout)
-            if result.stderr:
-                print("Errors:")
-                print(result.stderr)
-            return
+                # Render each tool as soon as the orchestrator reports it
+                events = _budgeted(_read_orchestrator_events(process.stdout, report, raw_lines))
+                for chunk in verification_renderer.render_verification_stream(events):
+                    print(chunk, flush=True)
+                returncode = process.wait()
+            finally:
+                watchdog["timer"].cancel()
+            
+            if timed_out.is_set():
+                error(f"Verification timeout (exceeded {watchdog['seconds']:.0f} seconds)", service="cli")
+                sys.exit(1)
+            
+            if "overall_status" not in report:
+                error("Orchestrator ended without a completion event", service="cli")
+                if raw_lines:
+                    print("Raw output:")
+                    print("\n".join(raw_lines))
+                stderr_file.seek(0)
+                stderr_output = stderr_file.read()
+                if stderr_output:
+                    print("Errors:")
+                    print(stderr_output)
+                sys.exit(1)
         
-        # Render results using display contract
-        output = verification_renderer.render_verification_results(verification_data)
-        print(output)
+        _build_engine_snapshot(report)
         
         # Exit with orchestrator status
-        sys.exit(result.returncode)
+        sys.exit(returncode)
         
-    except subprocess.TimeoutExpired:
-        error("Verification timeout (exceeded 120 seconds)", service="cli")
-        sys.exit(1)
     except Exception as e:
         error(f"Verification failed: {e}", service="cli")
         sys.exit(1)
 
 
+def cmd_daemon(args):
+    """Start, stop or inspect the verification daemon."""
+    workspace = Path(__file__).resolve().parents[1]
+    if str(workspace) not in sys.path:
+        sys.path.insert(0, str(workspace))
+    
+    from navigation.orchestrator import verification_daemon
+    
+    if not verification_daemon.daemon_supported():
+        error("Verification daemon requires Unix domain sockets", service="cli")
+        sys.exit(1)
+    
+    socket_path = verification_daemon.get_socket_path(workspace)
+    
+    def _request(command):
+        try:
+            for line in verification_daemon.request({"command": command}, socket_path, timeout=5):
+                return json.loads(line)
+        except (OSError, json.JSONDecodeError):
+            pass
+        return None
+    
+    if args.daemon_command == "status":
+        status = _request("status")
+        if status is None:
+            info("Verification daemon is not running", service="cli")
+            return
+        print(header("VERIFICATION DAEMON"))
+        print(separator())
+        print(bullet(f"PID: {status['pid']}"))
+        print(bullet(f"Uptime: {status['uptime_seconds']}s"))
+        print(bullet(f"Requests served: {status['requests_served']}"))
+        print(bullet(f"Tracked files: {status['tracked_files']}"))
+        print(bullet(f"Results in memory: {len(status['cached_results'])}"))
+    
+    elif args.daemon_command == "stop":
+        if _request("shutdown") is None:
+            info("Verification daemon is not running", service="cli")
+        else:
+            success("Verification daemon stopped", service="cli")
+    
+    elif args.daemon_command == "start":
+        status = _request("status")
+        if status is not None:
+            info(f"Verification daemon already running (pid {status['pid']})", service="cli")
+            return
+        
+        daemon_path = workspace / "navigation" / "orchestrator" / "verification_daemon.py"
+        subprocess.Popen(
+            [sys.executable, str(daemon_path), "serve"],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True
+        )
+        
+        deadline = time.monotonic() + VERIFY_STARTUP_TIMEOUT
+        while time.monotonic() < deadline:
+            status = _request("status")
+            if status is not None:
+                success(f"Verification daemon started (pid {status['pid']})", service="cli")
+                return
+            time.sleep(0.1)
+        
+        error("Verification daemon did not start", service="cli")
+        sys.exit(1)
+
+
 def main():
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -269,8 +532,21 @@ def main():
     
     # verify command
     parser_verify = subparsers.add_parser("verify", help="Run system verification")
+    parser_verify.add_argument("--isolated", action="store_true", help="Run each tool in its own interpreter process")
+    parser_verify.add_argument("--jobs", type=int, help="Maximum number of tools to run concurrently")
+    parser_verify.add_argument("--no-cache", action="store_true", help="Ignore cached tool results")
+    parser_verify.add_argument("--fail-fast", action="store_true", help="Stop after the first failing tool")
+    parser_verify.add_argument("--watch", action="store_true", help="Re-verify affected tools whenever files change")
+    parser_verify.add_argument("--since", metavar="REV", help="Only check files changed since a git revision")
+    parser_verify.add_argument("--no-daemon", action="store_true", help="Run locally even if a verification daemon is running")
+    parser_verify.add_argument("--max-violations", type=int, metavar="N", help="Stop each scanner after N violations")
     parser_verify.set_defaults(func=cmd_verify)
     
+    # daemon command
+    parser_daemon = subparsers.add_parser("daemon", help="Manage the verification daemon")
+    parser_daemon.add_argument("daemon_command", choices=["start", "stop", "status"], help="Daemon subcommand")
+    parser_daemon.set_defaults(func=cmd_daemon)
+    
     args = parser.parse_args()
     
     if not args.command:
@@ -22,6 +22,7 @@ class PipelineState:
     overall_status: str
     execution_order: List[str]
     verifications: Dict[str, Any]
+    budget_overruns: List[str] = field(default_factory=list)
 
 @dataclass
 class StructureGraph:
@@ -46,6 +47,7 @@ class EngineSnapshot:
                 "overall_status": self.pipeline_state.overall_status,
                 "execution_order": self.pipeline_state.execution_order,
                 "verifications": self.pipeline_state.verifications,
+                "budget_overruns": self.pipeline_state.budget_overruns,
             },
             "metrics": {
                 "integrity_score": self.metrics.integrity_score,
@@ -64,7 +64,8 @@ def consume_orchestrator_output(raw_output: str) -> EngineSnapshot:
         orchestrator=pipeline_data.get("orchestrator", "unknown"),
         overall_status=pipeline_data.get("overall_status", "not_ready"),
         execution_order=pipeline_data.get("execution_order", []),
-        verifications=pipeline_data.get("verifications", {})
+        verifications=pipeline_data.get("verifications", {}),
+        budget_overruns=pipeline_data.get("budget_overruns", [])
     )
     
     metrics = calculate_integrity(pipeline_data)
@@ -10,6 +10,7 @@ from datetime import datetime, timezone
 import json
 from typing import Dict, List, Set, Any
 from navigation.intelligence.contracts import StructureGraph
+from tools.core.workspace_index import get_index
 
 def get_workspace_root() -> Path:
     return Path(__file__).resolve().parents[2]
@@ -35,28 +36,24 @@ def analyze_structure() -> StructureGraph:
         "Output Determinism (CLI JSON rendering)"
     ]
     
-    # Exclude common ignores
-    excludes = {".git", "__pycache__", "venv", ".glaido"}
-    
-    for path in workspace.rglob("*"):
-        if any(part in excludes for part in path.parts):
+    # Common ignores (.git, __pycache__, venv, .glaido, ...) are pruned by the index
+    for entry in get_index(workspace).entries:
+        if entry.pruned:
             continue
             
-        if path.is_file():
+        if not entry.is_dir:
             total_files += 1
-            if path.suffix == ".py":
+            if entry.path.endswith(".py"):
                 # Check layer
-                rel_parts = path.relative_to(workspace).parts
-                if len(rel_parts) > 1:
-                    layer = rel_parts[0]
-                    if layer in layer_counts:
-                        layer_counts[layer] += 1
-                    
-                    if len(rel_parts) > 2:
-                        # Consider subdirectories as modules (e.g. tools/core, navigation/intelligence)
-                        modules.add(f"{rel_parts[0]}/{rel_parts[1]}")
+                rel_parts = entry.path.split("/")
+                if entry.layer in layer_counts:
+                    layer_counts[entry.layer] += 1
+                
+                if len(rel_parts) > 2:
+                    # Consider subdirectories as modules (e.g. tools/core, navigation/intelligence)
+                    modules.add(f"{rel_parts[0]}/{rel_parts[1]}")
                         
-        elif path.is_dir():
+        else:
             total_directories += 1
 
     return StructureGraph(
@@ -3,9 +3,10 @@ System Memory
 Offline-first file-based JSON state storage for the intelligence engine.
 """
 
+import os
 import json
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from navigation.intelligence.contracts import EngineSnapshot
 
 def get_memory_file_path() -> Path:
@@ -35,6 +36,42 @@ def read_latest_snapshot() -> Optional[Dict[str, Any]]:
     except (json.JSONDecodeError, OSError):
         return None
 
+# Samples kept per tool category in the duration history
+DURATION_HISTORY_LIMIT = 50
+
+def get_duration_history_path() -> Path:
+    """Get the path to the per-tool duration history JSON file."""
+    return get_memory_file_path().parent / "duration_history.json"
+
+def read_duration_history() -> Dict[str, List[float]]:
+    """Read recorded wall-clock durations (ms) per tool category, oldest first."""
+    history_path = get_duration_history_path()
+    if not history_path.exists():
+        return {}
+
+    try:
+        with open(history_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (json.JSONDecodeError, OSError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+def record_durations(durations: Dict[str, float]) -> None:
+    """Append one run's durations (ms) to the history, keeping the newest samples."""
+    if not durations:
+        return
+
+    history = read_duration_history()
+    for category, duration_ms in durations.items():
+        samples = history.get(category, []) + [duration_ms]
+        history[category] = samples[-DURATION_HISTORY_LIMIT:]
+
+    history_path = get_duration_history_path()
+    temp_path = history_path.with_suffix(".json.tmp")
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(history, f, indent=2, sort_keys=True)
+    os.replace(temp_path, history_path)
+
 def run_check() -> Dict[str, Any]:
     """Validate system memory offline access."""
     start_time = time.time()
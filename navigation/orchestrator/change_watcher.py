@@ -0,0 +1,80 @@
+"""
+Change Watcher
+
+Cheap polling change detection for watch mode. A scan records
+(mtime_ns, size) for every file in a fresh workspace index, so it prunes
+the same directories as every scanner; diffing two scans yields the
+modified, added and removed paths. No file contents are read.
+
+git_changes() answers the same question against a git revision instead
+of a previous scan, for verify --since.
+"""
+
+import time
+import subprocess
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+from tools.core.workspace_index import get_index
+
+# Seconds between scans; sleeping in between keeps idle CPU near zero
+DEFAULT_POLL_INTERVAL = 0.5
+
+Scan = Dict[str, Tuple[int, int]]
+
+
+def scan_workspace(workspace: Path) -> Scan:
+    """Map every workspace-relative POSIX path to its (mtime_ns, size)."""
+    return {entry.path: (entry.mtime_ns, entry.size) for entry in get_index(workspace).entries if not entry.is_dir}
+
+
+def diff_scans(previous: Scan, current: Scan) -> Tuple[List[str], List[str], List[str]]:
+    """Return sorted (modified, added, removed) paths between two scans."""
+    modified = sorted(p for p, meta in current.items() if p in previous and previous[p] != meta)
+    added = sorted(p for p in current if p not in previous)
+    removed = sorted(p for p in previous if p not in current)
+    return modified, added, removed
+
+
+def git_changes(workspace: Path, revision: str) -> Tuple[List[str], List[str]]:
+    """
+    Paths that differ between a git revision and the working tree.
+
+    Untracked files that are not ignored count as changed.
+
+    Returns:
+        (changed, deleted) as sorted workspace-relative POSIX paths
+
+    Raises:
+        ValueError: git is unavailable or the revision cannot be resolved
+    """
+    def git(*args):
+        try:
+            completed = subprocess.run(
+                ["git", *args], cwd=workspace, capture_output=True, text=True, encoding="utf-8"
+            )
+        except OSError as e:
+            raise ValueError(f"git unavailable: {e}")
+        if completed.returncode != 0:
+            raise ValueError(completed.stderr.strip() or f"git {args[0]} failed")
+        return [entry for entry in completed.stdout.split("\0") if entry]
+
+    # --relative keeps paths workspace-relative even inside a larger repository
+    entries = git("diff", "--name-status", "--no-renames", "--relative", "-z", revision, "--")
+    changed, deleted = set(), set()
+    for status, path in zip(entries[::2], entries[1::2]):
+        (deleted if status == "D" else changed).add(path)
+    changed.update(git("ls-files", "--others", "--exclude-standard", "-z"))
+    return sorted(changed), sorted(deleted)
+
+
+def watch_changes(workspace: Path, interval: float = DEFAULT_POLL_INTERVAL) -> Iterator[Tuple[List[str], List[str], List[str]]]:
+    """Poll the workspace forever, yielding each non-empty (modified, added, removed) diff."""
+    previous = scan_workspace(workspace)
+    while True:
+        time.sleep(interval)
+        current = scan_workspace(workspace)
+        changes = diff_scans(previous, current)
+        previous = current
+        if any(changes):
+            yield changes
@@ -0,0 +1,465 @@
+"""
+Distributed Verification
+
+Coordinator/worker mode for verifying one workspace across several
+machines. The coordinator listens on TCP and hands out jobs; workers
+connect to it, authenticate with a shared token and pull one job at a
+time, so faster hosts naturally take more work.
+
+A job is either a whole tool or, for tools in SHARDABLE_TOOLS, one shard
+of its file list. Shards are merged back with the tool's merge_shards(),
+so the final report has exactly the shape of a local run. Jobs are only
+released once every shard of their prerequisites has finished.
+
+Workers never run arbitrary code: a job names a registered category (and
+workspace-relative files), and the worker resolves the tool itself.
+Every worker must have a checkout of the same revision; files are
+addressed relative to it.
+
+Protocol: newline-delimited JSON over TCP.
+  worker -> {"type": "hello", "token": ...}
+  coordinator -> {"type": "job", "job_id", "category", "files", "timeout"}
+  worker -> {"type": "result", "job_id", "output"}
+  coordinator -> {"type": "shutdown"}
+"""
+
+import os
+import sys
+import hmac
+import json
+import time
+import socket
+import secrets
+import threading
+import subprocess
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from navigation.orchestrator import verification_orchestrator as orchestrator
+from navigation.orchestrator.result_cache import ResultCache, get_cache_dir
+from navigation.orchestrator.worker_pool import kill_process_group, process_group_options
+from navigation.intelligence.system_memory import read_duration_history
+# Importable once the orchestrator has put tools/core on sys.path
+from base_tool_contract import tool_settings
+
+DEFAULT_COORDINATOR_HOST = "127.0.0.1"
+DEFAULT_COORDINATOR_PORT = 7745
+
+# Files per python_syntax shard
+DEFAULT_SHARD_SIZE = 100
+
+# Seconds the coordinator waits with no worker connected before failing
+# the remaining jobs
+DEFAULT_WORKER_WAIT = 30
+
+# Attempts per job before it is reported as failed (a worker vanishing
+# mid-job gives its job to another worker)
+MAX_JOB_ATTEMPTS = 2
+
+TOKEN_ENV = "GLAIDO_DISTRIBUTED_TOKEN"
+
+
+def parse_address(address):
+    """Split HOST:PORT; a bare port binds the default host."""
+    host, _, port = address.rpartition(":")
+    return host or DEFAULT_COORDINATOR_HOST, int(port)
+
+
+def _send(stream, message):
+    stream.write(json.dumps(message, sort_keys=True, default=str) + "\n")
+    stream.flush()
+
+
+def _receive(stream):
+    line = stream.readline()
+    if not line:
+        raise ConnectionError("Connection closed")
+    return json.loads(line)
+
+
+def plan_jobs(workspace, execution_order, shard_size=DEFAULT_SHARD_SIZE):
+    """
+    Split the run into jobs.
+
+    Returns:
+        (jobs, shard_counts): jobs in execution order, and the number of
+        jobs each category was split into
+    """
+    tool_root = orchestrator.get_workspace_root()
+    target = None if workspace == tool_root else workspace
+    jobs = []
+    shard_counts = {}
+
+    for category in execution_order:
+        files = None
+        if category in orchestrator.SHARDABLE_TOOLS:
+            module = orchestrator._load_tool_module(tool_root / orchestrator.VERIFICATION_TOOLS[category][0])
+            with tool_settings(orchestrator._tool_environment(target)):
+                root = module.get_workspace_root()
+                files = [path.relative_to(root).as_posix() for path in module.collect_files(root)]
+
+        if files:
+            shards = [files[i:i + shard_size] for i in range(0, len(files), shard_size)]
+        else:
+            shards = [None]
+
+        shard_counts[category] = len(shards)
+        for index, shard in enumerate(shards):
+            jobs.append({
+                "job_id": f"{category}:{index}",
+                "category": category,
+                "shard": index,
+                "files": shard,
+                "attempts": 0
+            })
+    return jobs, shard_counts
+
+
+class _JobBoard:
+    """Thread-safe job queue that respects the verification DAG."""
+
+    def __init__(self, jobs, shard_counts, execution_order):
+        self.condition = threading.Condition()
+        self.queue = list(jobs)
+        self.shard_counts = shard_counts
+        scheduled = set(execution_order)
+        self.prerequisites = {
+            category: set(orchestrator.VERIFICATION_TOOLS[category][1]) & scheduled
+            for category in execution_order
+        }
+        self.outputs = {category: {} for category in execution_order}
+        self.finished = set()
+        self.started = set()
+        self.workers = 0
+        self.idle_since = time.monotonic()
+
+    def all_finished(self):
+        return len(self.finished) == len(self.outputs)
+
+    def take(self):
+        """Block until a job is ready; None once every category finished."""
+        with self.condition:
+            while True:
+                if self.all_finished():
+                    return None
+                for job in self.queue:
+                    if self.prerequisites[job["category"]] <= self.finished:
+                        self.queue.remove(job)
+                        job["attempts"] += 1
+                        return job
+                self.condition.wait()
+
+    def first_start(self, category):
+        """True exactly once per category, when its first job is handed out."""
+        with self.condition:
+            if category in self.started:
+                return False
+            self.started.add(category)
+            return True
+
+    def complete(self, job, output):
+        """Record a job's output; returns the category's shard outputs when it is done."""
+        with self.condition:
+            category = job["category"]
+            self.outputs[category][job["shard"]] = output
+            done = None
+            if len(self.outputs[category]) == self.shard_counts[category]:
+                self.finished.add(category)
+                done = [self.outputs[category][i] for i in range(self.shard_counts[category])]
+            self.condition.notify_all()
+            return done
+
+    def retry(self, job, reason):
+        """Requeue a job whose worker failed; returns shard outputs if it gave up."""
+        with self.condition:
+            if job["attempts"] < MAX_JOB_ATTEMPTS:
+                self.queue.insert(0, job)
+                self.condition.notify_all()
+                return None
+        return self.complete(job, orchestrator._execution_error(reason))
+
+    def fail_remaining(self, reason):
+        """Give up on every queued job (no workers left)."""
+        with self.condition:
+            jobs, self.queue = self.queue, []
+        return [(job, self.complete(job, orchestrator._execution_error(reason))) for job in jobs]
+
+    def worker_joined(self):
+        with self.condition:
+            self.workers += 1
+
+    def worker_left(self):
+        with self.condition:
+            self.workers -= 1
+            self.idle_since = time.monotonic()
+            self.condition.notify_all()
+
+
+def merge_outputs(category, outputs, tool_root):
+    """Fold one category's shard outputs into a single tool result."""
+    if len(outputs) == 1:
+        return outputs[0]
+
+    failed = [output for output in outputs if not output.get("executed")]
+    if failed:
+        return failed[0]
+
+    module = orchestrator._load_tool_module(tool_root / orchestrator.VERIFICATION_TOOLS[category][0])
+    merged = module.merge_shards(outputs)
+    merged["exit_code"] = 0 if merged.get("status") == "ready" else 1
+    merged["executed"] = True
+
+    budgets = [output["budget"] for output in outputs if "budget" in output]
+    if budgets:
+        merged["budget"] = {
+            "timeout_ms": budgets[0]["timeout_ms"],
+            "elapsed_ms": max(budget["elapsed_ms"] for budget in budgets),
+            "exceeded": any(budget["exceeded"] for budget in budgets)
+        }
+    return merged
+
+
+def run_distributed_verification(
+    address=f"{DEFAULT_COORDINATOR_HOST}:{DEFAULT_COORDINATOR_PORT}",
+    token=None,
+    local_workers=0,
+    shard_size=DEFAULT_SHARD_SIZE,
+    use_cache=True,
+    on_event=None,
+    workspace=None,
+    worker_wait=DEFAULT_WORKER_WAIT,
+):
+    """
+    Coordinate a verification run across connected workers.
+
+    Args:
+        address: HOST:PORT to listen on (port 0 picks a free port)
+        token: Shared secret workers must present (default: TOKEN_ENV,
+            else a random token printed to stderr for remote workers)
+        local_workers: Worker processes to start on this host
+        shard_size: Files per shard for SHARDABLE_TOOLS
+        use_cache: Reuse stored results for tools whose inputs are unchanged
+        on_event: Optional callback receiving run_verification() events
+        workspace: Workspace to verify (default: the tree the tools live in)
+        worker_wait: Seconds to wait with no worker connected before
+            failing the remaining jobs
+
+    Returns:
+        dict: Standard orchestrator report
+    """
+    tool_root = orchestrator.get_workspace_root()
+    workspace = Path(workspace).resolve() if workspace is not None else tool_root
+    token = token or os.environ.get(TOKEN_ENV)
+    if not token:
+        token = secrets.token_hex(16)
+        print(f"Worker token: {token}", file=sys.stderr)
+
+    history = read_duration_history()
+    execution_order = orchestrator.build_execution_order()
+    budgets = {
+        category: orchestrator.derive_tool_timeout(history.get(category, []))
+        for category in execution_order
+    }
+    emit_lock = threading.Lock()
+
+    def emit(event):
+        if on_event is not None:
+            with emit_lock:
+                on_event(event)
+
+    emit({
+        "event": "plan",
+        "execution_order": execution_order,
+        "budget_seconds": round(sum(budgets.values()), 2)
+    })
+
+    results = {}
+    cache = ResultCache(get_cache_dir(tool_root)) if use_cache else None
+    keys = orchestrator._cache_keys(tool_root, workspace, execution_order) if cache else {}
+    for category, key in keys.items():
+        cached = cache.get(key)
+        if cached is not None:
+            cached["cached"] = True
+            results[category] = cached
+            emit({"event": "start", "category": category})
+            emit({"event": "finish", "category": category, "result": cached})
+
+    pending = [category for category in execution_order if category not in results]
+    jobs, shard_counts = plan_jobs(workspace, pending, shard_size)
+    board = _JobBoard(jobs, shard_counts, pending)
+
+    def finish(category, outputs):
+        result = merge_outputs(category, outputs, tool_root)
+        results[category] = result
+        if category in keys and orchestrator.reusable(result):
+            cache.put(keys[category], result)
+        emit({"event": "finish", "category": category, "result": result})
+
+    def serve(connection):
+        connection.settimeout(DEFAULT_WORKER_WAIT)
+        with connection, connection.makefile("rw", encoding="utf-8") as stream:
+            try:
+                hello = _receive(stream)
+            except (OSError, ValueError):
+                return
+            if hello.get("type") != "hello" or not hmac.compare_digest(str(hello.get("token", "")), token):
+                _send(stream, {"type": "error", "error": "Invalid worker token"})
+                return
+
+            board.worker_joined()
+            try:
+                while True:
+                    job = board.take()
+                    if job is None:
+                        _send(stream, {"type": "shutdown"})
+                        return
+                    if board.first_start(job["category"]):
+                        emit({"event": "start", "category": job["category"]})
+
+                    timeout = budgets[job["category"]]
+                    try:
+                        _send(stream, {
+                            "type": "job",
+                            "job_id": job["job_id"],
+                            "category": job["category"],
+                            "files": job["files"],
+                            "timeout": timeout
+                        })
+                        # The worker enforces the budget; allow it time to report
+                        connection.settimeout(timeout + DEFAULT_WORKER_WAIT)
+                        reply = _receive(stream)
+                        if reply.get("job_id") != job["job_id"]:
+                            raise ValueError("Reply for the wrong job")
+                    except (OSError, ValueError) as e:
+                        outputs = board.retry(job, f"Worker failed: {e}")
+                        if outputs is not None:
+                            finish(job["category"], outputs)
+                        return
+
+                    outputs = board.complete(job, reply["output"])
+                    if outputs is not None:
+                        finish(job["category"], outputs)
+            except OSError:
+                return
+            finally:
+                board.worker_left()
+
+    host, port = parse_address(address)
+    server = socket.create_server((host, port))
+    server.settimeout(0.5)
+    port = server.getsockname()[1]
+    stopped = threading.Event()
+
+    def accept():
+        while not stopped.is_set():
+            try:
+                connection, _ = server.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                return  # Server closed
+            threading.Thread(target=serve, args=(connection,), daemon=True).start()
+
+    threading.Thread(target=accept, daemon=True).start()
+
+    workers = []
+    worker_env = dict(os.environ, **{TOKEN_ENV: token})
+    if workspace != tool_root:
+        worker_env[orchestrator.WORKSPACE_ENV] = str(workspace)
+    for _ in range(local_workers):
+        workers.append(subprocess.Popen(
+            [sys.executable, str(Path(orchestrator.__file__).resolve()), "--worker", f"{host}:{port}"],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            env=worker_env,
+            **process_group_options()
+        ))
+
+    try:
+        with board.condition:
+            while not board.all_finished():
+                if board.workers == 0 and time.monotonic() - board.idle_since > worker_wait:
+                    break
+                board.condition.wait(timeout=1)
+        for job, outputs in board.fail_remaining("No verification workers connected"):
+            if outputs is not None:
+                finish(job["category"], outputs)
+
+        # Let connected workers receive their shutdown before the server goes away
+        deadline = time.monotonic() + 5
+        with board.condition:
+            while board.workers and time.monotonic() < deadline:
+                board.condition.wait(timeout=0.1)
+    finally:
+        stopped.set()
+        server.close()
+        for process in workers:
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                kill_process_group(process)
+
+    budget_overruns = [
+        category for category in pending
+        if results.get(category, {}).get("budget", {}).get("exceeded")
+    ]
+    report = orchestrator.build_report(results, execution_order, budget_overruns)
+    emit({
+        "event": "complete",
+        "orchestrator": report["orchestrator"],
+        "overall_status": report["overall_status"],
+        "execution_order": execution_order,
+        "budget_overruns": budget_overruns
+    })
+    return report
+
+
+def run_worker(address, token=None, workspace=None):
+    """
+    Serve jobs from a coordinator until it sends shutdown.
+
+    Returns:
+        bool: True on a clean shutdown, False if rejected or disconnected
+
+    Args:
+        address: Coordinator HOST:PORT
+        token: Shared secret (default: TOKEN_ENV)
+        workspace: This host's checkout (default: the tree the tools live in)
+    """
+    tool_root = orchestrator.get_workspace_root()
+    token = token or os.environ.get(TOKEN_ENV, "")
+    workspace = workspace or os.environ.get(orchestrator.WORKSPACE_ENV)
+
+    try:
+        return _serve_coordinator(address, token, workspace, tool_root)
+    except (OSError, ValueError) as e:
+        print(f"Worker stopped: {e}", file=sys.stderr)
+        return False
+
+
+def _serve_coordinator(address, token, workspace, tool_root):
+    with socket.create_connection(parse_address(address)) as connection:
+        with connection.makefile("rw", encoding="utf-8") as stream:
+            _send(stream, {"type": "hello", "token": token})
+            while True:
+                message = _receive(stream)
+                if message.get("type") == "shutdown":
+                    return True
+                if message.get("type") != "job":
+                    raise ValueError(message.get("error", "Unexpected coordinator message"))
+
+                category = message.get("category")
+                if category not in orchestrator.VERIFICATION_TOOLS:
+                    output = orchestrator._execution_error(f"Unknown verification category: {category}")
+                else:
+                    files = message.get("files") if category in orchestrator.SHARDABLE_TOOLS else None
+                    output = orchestrator.run_verification_tool(
+                        tool_root / orchestrator.VERIFICATION_TOOLS[category][0],
+                        isolated=False,
+                        timeout=message.get("timeout", orchestrator.DEFAULT_TOOL_TIMEOUT),
+                        workspace=workspace,
+                        check_kwargs={"files": files} if files is not None else None
+                    )
+                _send(stream, {"type": "result", "job_id": message["job_id"], "output": output})
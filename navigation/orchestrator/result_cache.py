@@ -0,0 +1,154 @@
+"""
+Verification Result Cache
+
+Content-addressed store for tool run_check() results under .glaido/cache.
+A cache key hashes the tool's own source together with every input file
+the tool declares, so an entry can only be reused when nothing the tool
+reads has changed. Entries are evicted least-recently-used once the cache
+exceeds its size cap.
+"""
+
+import os
+import sys
+import json
+import hashlib
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from tools.core.workspace_index import WorkspaceIndex, glob_to_regex
+
+# Bump when the key derivation or entry layout changes
+CACHE_FORMAT_VERSION = 2
+
+DEFAULT_MAX_BYTES = 4 * 1024 * 1024
+
+def get_cache_dir(workspace: Path) -> Path:
+    """Get the cache directory for a workspace."""
+    return workspace / ".glaido" / "cache"
+
+
+def list_workspace(index: WorkspaceIndex) -> Tuple[List[str], List[str]]:
+    """
+    Split a workspace index into the paths input globs expand against.
+
+    Returns:
+        (files, directories) as sorted workspace-relative POSIX paths
+    """
+    files = sorted(entry.path for entry in index.entries if not entry.is_dir)
+    directories = sorted(entry.path for entry in index.entries if entry.is_dir)
+    return files, directories
+
+
+def match_paths(paths: Iterable[str], patterns: Iterable[str]) -> List[str]:
+    """Return the sorted subset of paths matched by any of the globs."""
+    regexes = [glob_to_regex(p) for p in patterns]
+    return sorted(p for p in paths if any(r.match(p) for r in regexes))
+
+
+def _hash_file(path: Path, memo: Optional[Dict[Path, str]] = None) -> str:
+    if memo is not None and path in memo:
+        return memo[path]
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            digest.update(block)
+    if memo is not None:
+        memo[path] = digest.hexdigest()
+    return digest.hexdigest()
+
+
+def compute_key(
+    workspace: Path,
+    category: str,
+    tool_path: Path,
+    inputs: Dict[str, List[str]],
+    listing: Tuple[List[str], List[str]],
+    variant: str = "",
+    hashes: Optional[Dict[Path, str]] = None,
+) -> str:
+    """
+    Derive the content address for one tool run.
+
+    Args:
+        workspace: Workspace root (part of the key: results may embed paths)
+        category: Tool category
+        tool_path: Tool source file
+        inputs: {"content": [globs], "listing": [globs]}. Content inputs are
+            hashed byte for byte; listing inputs only contribute their paths
+            (for tools that care whether a file exists, not what it holds).
+        listing: Output of list_workspace()
+        variant: Options that change the tool's output for the same inputs
+            (e.g. a violation cap); empty for a default run
+        hashes: Optional path -> digest memo shared by the keys of one run,
+            so a file several tools declare is read once
+    """
+    files, directories = listing
+    digest = hashlib.sha256()
+    digest.update(f"v{CACHE_FORMAT_VERSION}\0{workspace}\0{category}\0{sys.version}\0".encode("utf-8"))
+    digest.update(_hash_file(tool_path, hashes).encode("ascii"))
+    if variant:
+        digest.update(f"\0v:{variant}".encode("utf-8"))
+
+    for relative in match_paths(files, inputs.get("content", [])):
+        digest.update(f"\0c:{relative}\0{_hash_file(workspace / relative, hashes)}".encode("utf-8"))
+
+    for relative in match_paths(files + directories, inputs.get("listing", [])):
+        digest.update(f"\0l:{relative}".encode("utf-8"))
+
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """Size-capped, LRU-evicted store of tool results keyed by content address."""
+
+    def __init__(self, cache_dir: Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[dict]:
+        """Return the stored result for key, or None on a miss."""
+        entry = self._entry_path(key)
+        try:
+            with open(entry, "r", encoding="utf-8") as f:
+                result = json.load(f)
+            # Touch on hit: mtime order is the LRU order
+            os.utime(entry, None)
+            return result
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def put(self, key: str, result: dict) -> None:
+        """Store a result, then evict old entries beyond the size cap."""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            entry = self._entry_path(key)
+            temp = entry.with_suffix(f".{os.getpid()}.tmp")
+            with open(temp, "w", encoding="utf-8") as f:
+                json.dump(result, f, sort_keys=True)
+            os.replace(temp, entry)
+            self.evict()
+        except OSError:
+            pass  # Caching is an optimisation; never fail a run over it
+
+    def evict(self) -> None:
+        """Remove least-recently-used entries until the cache fits its cap."""
+        entries = []
+        for entry in self.cache_dir.glob("*.json"):
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                entry.unlink()
+                total -= size
+            except OSError:
+                pass
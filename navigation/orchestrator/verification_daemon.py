@@ -0,0 +1,228 @@
+"""
+Verification Daemon
+
+Long-running verification server on a Unix domain socket.
+The daemon keeps tool modules imported, the last workspace scan
+(mtime_ns, size per file) and the last result of every tool in memory;
+parsed files are served from the persistent parse cache (parse_cache.py)
+rather than held as trees. A verify request re-runs only the tools whose declared
+inputs changed since the previous request, plus the environment probes
+that declare no inputs; everything else is answered from memory.
+
+Only results that executed and were not skipped are kept, the same rule
+the result cache applies: a timeout, crash or fail-fast skip is re-run on
+the next request.
+
+Connections are served one at a time; a client that sends nothing for
+CLIENT_TIMEOUT seconds is dropped so it cannot block the daemon.
+
+Protocol: the client sends one JSON request line, the daemon answers
+with NDJSON lines and closes the connection.
+- {"command": "verify", "options": {...}} -> orchestrator --stream events
+- {"command": "status"}                   -> one status object
+- {"command": "shutdown"}                 -> one acknowledgement
+
+Usage:
+  python navigation/orchestrator/verification_daemon.py serve
+"""
+
+import os
+import sys
+import json
+import time
+import socket
+from pathlib import Path
+from typing import Iterator, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from navigation.orchestrator import verification_orchestrator as orchestrator
+from navigation.orchestrator.change_watcher import diff_scans, scan_workspace
+from navigation.intelligence.system_memory import read_duration_history
+
+# Options a client may forward to run_verification()
+VERIFY_OPTIONS = {"isolated", "jobs", "use_cache", "fail_fast"}
+
+# Seconds an accepted connection may stay silent before it is dropped
+CLIENT_TIMEOUT = 10
+
+
+def get_socket_path(workspace: Optional[Path] = None) -> Path:
+    """Get the daemon socket path for a workspace."""
+    workspace = workspace or orchestrator.get_workspace_root()
+    return workspace / ".glaido" / "verifyd.sock"
+
+
+def daemon_supported() -> bool:
+    """Unix domain sockets are required."""
+    return hasattr(socket, "AF_UNIX")
+
+
+def request(payload: dict, socket_path: Optional[Path] = None, timeout: Optional[float] = None) -> Iterator[str]:
+    """
+    Send one request to a running daemon and yield its response lines.
+
+    Raises:
+        OSError: No daemon is listening (missing socket, refused connection)
+    """
+    if not daemon_supported():
+        raise OSError("Unix domain sockets are not available on this platform")
+
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    client.settimeout(timeout)
+    try:
+        client.connect(str(socket_path or get_socket_path()))
+        client.sendall((json.dumps(payload) + "\n").encode("utf-8"))
+        with client.makefile("r", encoding="utf-8") as stream:
+            for line in stream:
+                yield line
+    finally:
+        client.close()
+
+
+class VerificationDaemon:
+    """Serves verify/status/shutdown requests, one connection at a time."""
+
+    def __init__(self, socket_path: Path):
+        self.socket_path = Path(socket_path)
+        self.workspace = orchestrator.get_workspace_root()
+        self.started_at = time.time()
+        self.requests_served = 0
+        self.scan = None
+        self.results = {}
+        self.running = False
+
+    def serve_forever(self):
+        """Bind the socket and handle requests until a shutdown request."""
+        self._remove_stale_socket()
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(str(self.socket_path))
+        os.chmod(self.socket_path, 0o600)
+        server.listen()
+        self.running = True
+
+        try:
+            while self.running:
+                connection, _ = server.accept()
+                connection.settimeout(CLIENT_TIMEOUT)
+                with connection, connection.makefile("rw", encoding="utf-8") as stream:
+                    self._handle(stream)
+        finally:
+            server.close()
+            try:
+                self.socket_path.unlink()
+            except OSError:
+                pass
+
+    def _remove_stale_socket(self):
+        if not self.socket_path.exists():
+            return
+        try:
+            for _ in request({"command": "status"}, self.socket_path, timeout=1):
+                pass
+        except OSError:
+            self.socket_path.unlink()  # Left behind by a daemon that died
+            return
+        raise RuntimeError(f"A daemon is already serving {self.socket_path}")
+
+    def _handle(self, stream):
+        def send(message):
+            stream.write(json.dumps(message, sort_keys=True) + "\n")
+            stream.flush()
+
+        try:
+            payload = json.loads(stream.readline() or "{}")
+            command = payload.get("command")
+            if command == "verify":
+                self._verify(payload.get("options", {}), send)
+            elif command == "status":
+                send(self.status())
+            elif command == "shutdown":
+                self.running = False
+                send({"status": "stopping"})
+            else:
+                send({"status": "error", "error": f"Unknown command: {command}"})
+            self.requests_served += 1
+        except (OSError, ValueError) as e:
+            try:
+                send({"status": "error", "error": str(e)})
+            except OSError:
+                pass  # Client went away
+
+    def status(self) -> dict:
+        return {
+            "status": "running",
+            "pid": os.getpid(),
+            "uptime_seconds": round(time.time() - self.started_at, 2),
+            "requests_served": self.requests_served,
+            "tracked_files": len(self.scan or {}),
+            "cached_results": sorted(self.results),
+        }
+
+    def _verify(self, options, send):
+        """Stream a verify run, re-running only tools affected since the last one."""
+        options = {key: value for key, value in options.items() if key in VERIFY_OPTIONS}
+        execution_order = orchestrator.build_execution_order()
+
+        current = scan_workspace(self.workspace)
+        if self.scan is None or not options.get("use_cache", True):
+            rerun = list(execution_order)
+        else:
+            changed = set(orchestrator.categories_for_changes(*diff_scans(self.scan, current)))
+            # categories_for_changes() always includes the input-less probes
+            rerun = [
+                category for category in execution_order
+                if category in changed or category not in self.results
+            ]
+        self.scan = current
+
+        history = read_duration_history()
+        send({
+            "event": "plan",
+            "execution_order": execution_order,
+            "budget_seconds": round(sum(
+                orchestrator.derive_tool_timeout(history.get(category, []))
+                for category in rerun
+            ), 2)
+        })
+
+        for category in execution_order:
+            if category not in rerun:
+                result = dict(self.results[category], cached=True)
+                send({"event": "start", "category": category})
+                send({"event": "finish", "category": category, "result": result})
+
+        def relay(event):
+            # plan/complete describe the subset; the daemon reports the whole run
+            if event["event"] in ("start", "finish"):
+                send(event)
+
+        partial = orchestrator.run_verification(only=rerun, on_event=relay, **options)
+        for category, result in partial["verifications"].items():
+            if orchestrator.reusable(result):
+                self.results[category] = result
+            else:
+                self.results.pop(category, None)
+
+        results = dict(self.results, **partial["verifications"])
+        report = orchestrator.build_report(results, execution_order, partial["budget_overruns"])
+        send({
+            "event": "complete",
+            "orchestrator": report["orchestrator"],
+            "overall_status": report["overall_status"],
+            "execution_order": execution_order,
+            "budget_overruns": report["budget_overruns"]
+        })
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2 or sys.argv[1] != "serve":
+        print("Usage: verification_daemon.py serve", file=sys.stderr)
+        sys.exit(2)
+    if not daemon_supported():
+        print("Unix domain sockets are not available on this platform", file=sys.stderr)
+        sys.exit(1)
+
+    VerificationDaemon(get_socket_path()).serve_forever()
@@ -1,123 +1,1001 @@
 """
 Verification Orchestrator
 
-Minimal orchestrator that sequentially runs all verification tools.
+Minimal orchestrator that runs all verification tools in dependency order.
 Derived from: architecture/sops/link_verification_protocol.md
 
 This orchestrator contains NO decision logic, routing trees, or priority systems.
-It simply runs tools in sequence and aggregates results.
+It simply runs tools as their prerequisites complete and aggregates results.
+Tools without a dependency between them run concurrently; the report and
+execution_order are always built in the fixed topological order, never in
+completion order.
+
+Execution modes:
+- In-process (default): each tool module is imported and its run_check()
+  is called directly behind a fault barrier and timeout.
+- Isolated (opt-in): each tool runs in a separate interpreter process.
+  Use for untrusted tools. During a pipeline run those processes come from
+  a warm worker pool (worker_pool.py); a standalone call without a pool
+  falls back to a fresh subprocess whose stdout JSON is parsed.
+
+Tools that declare their inputs in TOOL_INPUTS are served from the result
+cache (.glaido/cache) when neither their source nor those inputs changed.
+
+Fail-fast mode orders ready tools by their recorded durations (cheapest
+first) and stops scheduling after the first failure; tools that never ran
+are reported as skipped.
+
+verify --since REV limits SCOPABLE_TOOLS to the paths git reports as
+changed since REV; tools whose verdict is global still run in full.
+
+Each tool's timeout is derived from its duration history (p99 x
+TIMEOUT_MULTIPLIER, clamped to [TIMEOUT_FLOOR, TIMEOUT_CEILING]). Tools
+that exceed it are reported as timed out and listed under
+budget_overruns. Isolated tools are killed together with their process
+group; a thread cannot be killed, so an in-process tool that overruns
+keeps running in the background until it returns, and its result is
+discarded. Run tools that may hang or spawn processes with --isolated.
+
+Batch mode (run_batch_verification) verifies other checkouts with this
+tree's tools: WORKSPACE_ENV tells each tool which workspace to inspect,
+and every workspace shares one warm worker pool.
+
+Coordinator mode (--coordinator, distributed_verification.py) spreads a
+run over TCP-connected workers, splitting SHARDABLE_TOOLS into file
+shards; --worker HOST:PORT turns this script into such a worker.
 """
 
+import os
 import sys
 import json
+import math
+import time
+import uuid
+import argparse
+import importlib
+import threading
 import subprocess
 from pathlib import Path
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from navigation.orchestrator.change_watcher import git_changes
+from navigation.orchestrator.result_cache import ResultCache, compute_key, get_cache_dir, list_workspace, match_paths
+from navigation.orchestrator.worker_pool import WarmWorkerPool, kill_process_group, process_group_options
+from navigation.intelligence.system_memory import read_duration_history, read_latest_snapshot, record_durations
+
+# Tools import their shared helpers by bare name; use the same module objects
+sys.path.append(str(Path(__file__).resolve().parents[2] / "tools" / "core"))
+from base_tool_contract import tool_settings
+from workspace_index import get_index
+
+# Per-tool execution budget (seconds) until a tool has enough history
+DEFAULT_TOOL_TIMEOUT = 30
+
+# Adaptive budget: p99 of recorded durations x multiplier, clamped (seconds)
+TIMEOUT_MULTIPLIER = 4
+TIMEOUT_FLOOR = 5
+TIMEOUT_CEILING = 600
+TIMEOUT_MIN_SAMPLES = 5
+
+# Tools whose file list can be split into shards for distributed runs.
+# Such a tool exposes collect_files(root), run_check(files=...) and
+# merge_shards(reports).
+SHARDABLE_TOOLS = {"python_syntax"}
+
+# Tools that can verify only changed files (run_check(files=...)) for
+# verify --since: category -> whether a deleted path forces a full run.
+# Deleting a file can break links in documents nobody touched.
+SCOPABLE_TOOLS = {
+    "python_syntax": False,
+    "ant_boundary": False,
+    "architecture_links": True,
+}
+
+# Scopable tools whose verdict on unchanged files depends on the content of
+# changed ones: a changed path matching these globs forces a full run.
+# A document edited since REV may have lost a heading that #fragment links
+# in untouched documents point at; its anchors at REV are not known here.
+SCOPE_WIDENING_INPUTS = {
+    "architecture_links": ["**/*.md"],
+}
+
+# Checker code: the shared helpers and rule files scanners load from
+# tools/core. When it changed since REV, new checker logic must see the
+# whole tree, so every scopable tool runs in full.
+CHECKER_SOURCES = ["tools/core/**"]
+
+# Environment variable naming the workspace a tool should inspect;
+# unset means the tree the tool itself lives in
+WORKSPACE_ENV = "GLAIDO_WORKSPACE_ROOT"
+
+# Environment variable carrying the pipeline run id (see
+# tools/core/workspace_index.py)
+RUN_ID_ENV = "GLAIDO_RUN_ID"
+
+# Tools that parse Python through tools/core/ast_store.py. When they run
+# sequentially in one process, AST_CONSUMERS_ENV announces those still to
+# come so each file is parsed once and its tree kept only while needed.
+AST_CONSUMERS = {"python_syntax", "ant_boundary", "orphaned_tools"}
+AST_CONSUMERS_ENV = "GLAIDO_AST_CONSUMERS"
+
+# Environment variable capping the violations each scanner reports
+# (--max-violations); see tools/core/base_tool_contract.py. Set for the
+# whole process, so in-process, isolated and pooled tools all inherit it.
+MAX_VIOLATIONS_ENV = "GLAIDO_MAX_VIOLATIONS"
+
+# Tools that stop scanning at the cap; their cached results depend on it
+VIOLATION_CAPPED_TOOLS = {"python_syntax", "ant_boundary", "architecture_links", "code_references"}
+
+# Verification DAG: category -> (tool path, prerequisite categories)
+# Declaration order breaks ties, which keeps execution_order stable.
+VERIFICATION_TOOLS = {
+    "local_dependencies":   ("tools/core/local_dependency_check.py",       []),
+    "workspace_hygiene":    ("tools/core/workspace_hygiene_check.py",      ["local_dependencies"]),
+    "python_syntax":        ("tools/core/python_syntax_check.py",          ["local_dependencies"]),
+    "ant_boundary":         ("tools/core/ant_boundary_enforcer.py",        ["python_syntax"]),
+    "orphaned_tools":       ("tools/core/orphaned_tool_verifier.py",       ["python_syntax"]),
+    "import_cycles":        ("tools/core/import_cycle_check.py",           ["python_syntax"]),
+    "architecture_links":   ("tools/core/architecture_link_validator.py",  ["local_dependencies"]),
+    "code_references":      ("tools/core/code_reference_check.py",         ["python_syntax"]),
+    "filesystem_integrity": ("tools/core/filesystem_integrity_check.py",   ["local_dependencies"]),
+    "python_packages":      ("tools/core/python_package_check.py",         ["local_dependencies"]),
+    "schema_validation":    ("tools/core/schema_validator_stub.py",        ["python_syntax"]),
+    "agent_registry":       ("tools/agents/registry_readiness_check.py",   ["local_dependencies"]),
+}
+
+# Declared inputs for result caching: category -> workspace-relative globs.
+# "content" files are hashed; "listing" globs only contribute paths.
+# Tools whose verdict depends on the environment rather than on file
+# contents (interpreter modules, whether directories are writable) declare
+# no inputs and are never cached. Writing an advisory cache of what a tool
+# read (parse cache, import graph, reference index) does not count: the
+# result still follows from the declared inputs.
+TOOL_INPUTS = {
+    "python_syntax": {
+        "content": ["tools/**/*.py", "navigation/**/*.py", "cli/**/*.py", "architect_enhanced.py"],
+    },
+    "ant_boundary": {
+        # Layers are globs in the rules file and may name any directory
+        "content": ["tools/core/ant_boundary_rules.json", "**/*.py"],
+    },
+    "orphaned_tools": {
+        # Reachability spans every module the entry points can import
+        "content": ["**/*.py"],
+    },
+    "import_cycles": {
+        # A module anywhere can capture a bare name a scoped module imports
+        "content": ["**/*.py"],
+    },
+    "architecture_links": {
+        # Fragment links reach the headings of any markdown document
+        "content": ["**/*.md", "tools/core/workspace_index.py", "tools/core/base_tool_contract.py", "tools/core/anchor_index.py"],
+        "listing": ["**"],
+    },
+    "code_references": {
+        "content": [
+            "architecture/**/*.md", "**/*.py", "tools/core/code_reference_exemptions.json",
+            "tools/core/workspace_index.py", "tools/core/base_tool_contract.py",
+            "tools/core/parse_cache.py", "tools/core/anchor_index.py",
+        ],
+    },
+    "schema_validation": {
+        # The stub imports base_tool_contract; validator.py imports the logger
+        "content": [
+            "tools/core/validator.py", "tools/core/base_tool_contract.py", "tools/utilities/logger.py",
+            "architecture/specifications/data_schemas.md",
+        ],
+    },
+}
 
 
 def get_workspace_root():
-    """Get workspace root directory"""
+    """Get workspace root directory (where the tools live)"""
     return Path(__file__).resolve().parents[2]
 
 
-def run_verification_tool(tool_path):
+def _tool_environment(workspace=None, run_id=None, ast_consumers=None):
     """
-    Execute a verification tool and return its JSON output.
-    
-    Args:
-        tool_path: Path to the verification tool
-        
-    Returns:
-        dict: Parsed JSON output from tool
+    Settings that tell a tool what to inspect and which run it belongs to.
+
+    Isolated runs receive them as environment variables; in-process runs
+    as thread-local settings (see _run_tool_in_process).
+    """
+    env = {}
+    if workspace is not None:
+        env[WORKSPACE_ENV] = str(workspace)
+    if run_id is not None:
+        env[RUN_ID_ENV] = run_id
+    if ast_consumers is not None:
+        env[AST_CONSUMERS_ENV] = ",".join(ast_consumers)
+    return env
+
+
+def _execution_error(message):
+    """Build the orchestrator-side result for a tool that did not complete"""
+    return {
+        "category": "unknown",
+        "status": "error",
+        "executed": False,
+        "error": message
+    }
+
+
+# Source mtime of each tool module when it was (re)imported
+_loaded_tool_mtimes = {}
+
+
+def _load_tool_module(tool_path):
+    """
+    Import a tool module by its path inside the workspace.
+
+    Long-lived callers (watch mode) see edited tools: a module whose
+    source changed since it was imported is reloaded.
     """
+    workspace = get_workspace_root()
+    if str(workspace) not in sys.path:
+        sys.path.insert(0, str(workspace))
+
+    tool_path = Path(tool_path).resolve()
+    name = ".".join(tool_path.relative_to(workspace).with_suffix("").parts)
+    mtime = tool_path.stat().st_mtime_ns
+
+    module = sys.modules.get(name)
+    if module is not None and _loaded_tool_mtimes.get(name) != mtime:
+        module = importlib.reload(module)
+    elif module is None:
+        module = importlib.import_module(name)
+
+    _loaded_tool_mtimes[name] = mtime
+    return module
+
+
+def _run_tool_isolated(tool_path, timeout, workspace=None, run_id=None):
+    """Run a tool in a fresh interpreter and parse its stdout JSON"""
+    env = dict(os.environ, **_tool_environment(workspace, run_id))
     try:
-        result = subprocess.run(
+        process = subprocess.Popen(
             [sys.executable, str(tool_path)],
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             text=True,
-            timeout=30
+            env=env,
+            **process_group_options()
         )
+        try:
+            stdout, _ = process.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            # Take down anything the tool spawned, not just the tool itself
+            kill_process_group(process)
+            process.communicate()
+            return _execution_error("Tool execution timeout")
         
         # Parse JSON output
-        output = json.loads(result.stdout)
+        output = json.loads(stdout)
         
         # Add execution metadata
-        output["exit_code"] = result.returncode
+        output["exit_code"] = process.returncode
         output["executed"] = True
         
         return output
         
-    except subprocess.TimeoutExpired:
-        return {
-            "category": "unknown",
-            "status": "error",
-            "executed": False,
-            "error": "Tool execution timeout"
-        }
     except json.JSONDecodeError as e:
-        return {
-            "category": "unknown",
-            "status": "error",
-            "executed": False,
-            "error": f"Invalid JSON output: {str(e)}"
-        }
+        return _execution_error(f"Invalid JSON output: {str(e)}")
     except Exception as e:
-        return {
-            "category": "unknown",
-            "status": "error",
-            "executed": False,
-            "error": str(e)
-        }
+        return _execution_error(str(e))
 
 
-def run_sequential_verification():
+def _run_tool_in_process(tool_path, timeout, workspace=None, check_kwargs=None, run_id=None, ast_consumers=None):
     """
-    Run all verification tools in sequential order.
-    No decision logic - just linear execution.
+    Import a tool and call run_check() directly.
+
+    The call runs on a daemon thread so a hung tool cannot stall the
+    pipeline past its timeout, and every exception (including SystemExit)
+    is contained the same way a crashed subprocess would be. A thread that
+    outlives its timeout cannot be stopped: it finishes in the background
+    and its result is dropped.
+
+    Workspace, run id and AST consumers reach the tool as thread-local
+    settings (base_tool_contract.tool_settings), never through os.environ,
+    so overlapping or abandoned runs cannot see each other's values.
     """
-    workspace = get_workspace_root()
+    outcome = {}
 
-    # Finalized Pipeline Execution Order
-    tools = [
-        ("local_dependencies",    workspace / "tools/core/local_dependency_check.py"),
-        ("workspace_hygiene",     workspace / "tools/core/workspace_hygiene_check.py"),
-        ("python_syntax",         workspace / "tools/core/python_syntax_check.py"),
-        ("ant_boundary",          workspace / "tools/core/ant_boundary_enforcer.py"),
-        ("orphaned_tools",        workspace / "tools/core/orphaned_tool_verifier.py"),
-        ("architecture_links",    workspace / "tools/core/architecture_link_validator.py"),
-        ("filesystem_integrity",  workspace / "tools/core/filesystem_integrity_check.py"),
-        ("python_packages",       workspace / "tools/core/python_package_check.py"),
-        ("schema_validation",     workspace / "tools/core/schema_validator_stub.py"),
-        ("agent_registry",        workspace / "tools/agents/registry_readiness_check.py"),
-    ]
-    
-    # Execute each tool sequentially
-    results = {}
-    for category, tool_path in tools:
-        results[category] = run_verification_tool(tool_path)
+    def _invoke():
+        try:
+            module = _load_tool_module(tool_path)
+            with tool_settings(_tool_environment(workspace, run_id, ast_consumers)):
+                outcome["output"] = module.run_check(**(check_kwargs or {}))
+        except BaseException as e:  # fault barrier: nothing escapes a tool
+            outcome["error"] = e
+
+    worker = threading.Thread(target=_invoke, name=f"tool:{Path(tool_path).stem}", daemon=True)
+    worker.start()
+    worker.join(timeout)
+
+    if worker.is_alive():
+        return _execution_error("Tool execution timeout")
+    if "error" in outcome:
+        exc = outcome["error"]
+        return _execution_error(f"{type(exc).__name__}: {exc}")
+
+    output = outcome["output"]
+    if not isinstance(output, dict):
+        return _execution_error(f"Invalid tool output: expected dict, got {type(output).__name__}")
+
+    # Mirror the metadata the isolated path derives from the exit code
+    output = dict(output)
+    output["exit_code"] = 0 if output.get("status") == "ready" else 1
+    output["executed"] = True
+
+    return output
+
+
+def run_verification_tool(tool_path, isolated=False, timeout=DEFAULT_TOOL_TIMEOUT, pool=None, workspace=None,
+                          check_kwargs=None, run_id=None, ast_consumers=None):
+    """
+    Execute a verification tool and return its JSON output.
     
+    Args:
+        tool_path: Path to the verification tool
+        isolated: Run the tool in a separate interpreter process
+        timeout: Seconds before the tool is reported as timed out
+        pool: Optional WarmWorkerPool serving isolated runs
+        workspace: Workspace to inspect (default: the tool's own tree)
+        check_kwargs: Keyword arguments for run_check(); not supported by
+            one-shot isolated subprocesses
+        run_id: Identifies the pipeline run; tools in one process share
+            per-run state such as the workspace index while it is unchanged
+        ast_consumers: AST_CONSUMERS categories sharing this process for
+            the rest of the run (in-process runs only)
+        
+    Returns:
+        dict: Parsed JSON output from tool
+    """
+    if isolated and pool is None and check_kwargs:
+        raise ValueError("check_kwargs require in-process or pooled execution")
+
+    started = time.perf_counter()
+    if isolated and pool is not None:
+        output = pool.run(tool_path, timeout, workspace, check_kwargs, run_id)
+    elif isolated:
+        output = _run_tool_isolated(tool_path, timeout, workspace, run_id)
+    else:
+        output = _run_tool_in_process(tool_path, timeout, workspace, check_kwargs, run_id, ast_consumers)
+
+    if timeout is not None:
+        elapsed = time.perf_counter() - started
+        output["budget"] = {
+            "timeout_ms": round(timeout * 1000, 2),
+            "elapsed_ms": round(elapsed * 1000, 2),
+            "exceeded": elapsed >= timeout
+        }
+
+    return output
+
+
+def derive_tool_timeout(samples):
+    """
+    Timeout (seconds) for a tool given its recorded wall-clock durations (ms).
+
+    Falls back to DEFAULT_TOOL_TIMEOUT until TIMEOUT_MIN_SAMPLES runs exist.
+    """
+    if len(samples) < TIMEOUT_MIN_SAMPLES:
+        return DEFAULT_TOOL_TIMEOUT
+
+    ordered = sorted(samples)
+    # Nearest-rank percentile
+    p99_ms = ordered[max(0, math.ceil(0.99 * len(ordered)) - 1)]
+    return min(TIMEOUT_CEILING, max(TIMEOUT_FLOOR, p99_ms * TIMEOUT_MULTIPLIER / 1000))
+
+
+def build_execution_order(tools=VERIFICATION_TOOLS, costs=None):
+    """
+    Topologically sort the verification DAG.
+
+    Ties are broken by declaration order, so the result depends only on
+    the DAG definition and never on how long any tool takes.
+
+    Args:
+        tools: Verification DAG
+        costs: Optional category -> expected duration. When given, the
+            cheapest ready tool goes first; tools without a recorded cost
+            go after those with one, then declaration order decides.
+
+    Raises:
+        ValueError: On unknown prerequisites or dependency cycles
+    """
+    for category, (_, prerequisites) in tools.items():
+        unknown = [dep for dep in prerequisites if dep not in tools]
+        if unknown:
+            raise ValueError(f"{category} depends on unknown tools: {', '.join(unknown)}")
+
+    order = []
+    placed = set()
+    while len(order) < len(tools):
+        ready = [
+            category for category, (_, prerequisites) in tools.items()
+            if category not in placed and all(dep in placed for dep in prerequisites)
+        ]
+        if not ready:
+            blocked = [category for category in tools if category not in placed]
+            raise ValueError(f"Dependency cycle among tools: {', '.join(blocked)}")
+        if costs is not None:
+            ready.sort(key=lambda category: costs.get(category, float("inf")))
+        # Take one node at a time so declaration order decides ties
+        order.append(ready[0])
+        placed.add(ready[0])
+
+    return order
+
+
+def default_jobs(tool_count):
+    """Worker count sized to the machine, never more than there are tools"""
+    return max(1, min(tool_count, os.cpu_count() or 1))
+
+
+def estimate_tool_costs(history):
+    """
+    Expected duration (ms) per category for fail-fast ordering.
+
+    Uses the median of the recorded wall-clock history, falling back to
+    the duration_ms each tool reported in the latest engine snapshot.
+    """
+    costs = {}
+    snapshot = read_latest_snapshot() or {}
+    verifications = snapshot.get("pipeline_state", {}).get("verifications", {})
+    for category, result in verifications.items():
+        duration = result.get("metrics", {}).get("duration_ms")
+        if isinstance(duration, (int, float)):
+            costs[category] = duration
+
+    for category, samples in history.items():
+        if samples:
+            costs[category] = sorted(samples)[len(samples) // 2]
+    return costs
+
+
+def _passed(result):
+    """A tool passes when it ran and reported a healthy status"""
+    return result.get("executed", False) and result.get("status") in ["ready", "healthy"]
+
+
+def reusable(result):
+    """A result may be served again only if its tool ran and was not skipped"""
+    return bool(result.get("executed")) and result.get("status") != "skipped"
+
+
+def _skipped(category, reason):
+    """Result recorded for a tool fail-fast never scheduled"""
+    return {
+        "category": category,
+        "status": "skipped",
+        "executed": False,
+        "message": f"Skipped: {reason}"
+    }
+
+
+def _collect(future):
+    """Unwrap a scheduled tool result, containing executor-level failures"""
+    try:
+        return future.result()
+    except Exception as e:
+        return _execution_error(f"Tool worker failed: {e}")
+
+
+def _run_dag(executor, tool_root, target, run_id, execution_order, isolated, pool, budgets, scopes, on_start,
+             on_finish, should_stop):
+    """Submit each tool as soon as all of its prerequisites have finished"""
+    scheduled = set(execution_order)
+    waiting = {
+        category: set(VERIFICATION_TOOLS[category][1]) & scheduled
+        for category in execution_order
+    }
+    running = {}
+
+    while running or (waiting and not should_stop()):
+        if should_stop():
+            ready = []
+        else:
+            ready = [c for c in execution_order if c in waiting and not waiting[c]]
+        for category in ready:
+            del waiting[category]
+            tool_path = tool_root / VERIFICATION_TOOLS[category][0]
+            on_start(category)
+            future = executor.submit(
+                run_verification_tool, tool_path, isolated, budgets[category], pool, target,
+                scopes.get(category), run_id
+            )
+            running[future] = category
+
+        done, _ = wait(running, return_when=FIRST_COMPLETED)
+        for future in done:
+            category = running.pop(future)
+            on_finish(category, _collect(future))
+            for prerequisites in waiting.values():
+                prerequisites.discard(category)
+
+
+def categories_for_changes(modified, added, removed):
+    """
+    Map changed workspace-relative paths to the tools that must re-run.
+
+    A tool re-runs when its own source changed, when a declared content
+    input was modified, added or removed, or when a path matching one of
+    its listing globs appeared or disappeared. Tools that declare no
+    inputs (environment and registry probes) cannot tell what they read,
+    so they are always selected.
+    """
+    changed = set(modified) | set(added) | set(removed)
+    appeared_or_gone = set(added) | set(removed)
+
+    selected = []
+    for category in build_execution_order():
+        tool_source = VERIFICATION_TOOLS[category][0]
+        inputs = TOOL_INPUTS.get(category)
+        if tool_source in changed or not inputs:
+            selected.append(category)
+        elif (
+            match_paths(changed, inputs.get("content", []))
+            or match_paths(appeared_or_gone, inputs.get("listing", []))
+        ):
+            selected.append(category)
+    return selected
+
+
+def build_report(results, execution_order, budget_overruns=None):
+    """Aggregate per-tool results into the orchestrator report"""
+    results = {category: results[category] for category in execution_order if category in results}
+
     # Aggregate overall status (no complex logic, just basic check)
-    all_executed = all(r.get("executed", False) for r in results.values())
-    all_passed = all(
-        r.get("status") in ["ready", "healthy"] 
-        for r in results.values()
-    )
+    overall_status = "ready" if all(_passed(r) for r in results.values()) else "not_ready"
     
-    overall_status = "ready" if all_executed and all_passed else "not_ready"
-    
-    # Build aggregated report
-    report = {
+    return {
         "orchestrator": "verification_orchestrator",
         "overall_status": overall_status,
         "verifications": results,
-        "execution_order": [category for category, _ in tools]
+        "execution_order": execution_order,
+        "budget_overruns": budget_overruns or []
+    }
+
+
+def _cache_keys(tool_root, workspace, categories, run_id=None):
+    """
+    Content-address every cacheable tool in one workspace walk; with a
+    run id, in-process tools of that run reuse the same index.
+    """
+    cacheable = [category for category in categories if category in TOOL_INPUTS]
+    if not cacheable:
+        return {}
+
+    with tool_settings(_tool_environment(run_id=run_id)):
+        listing = list_workspace(get_index(workspace))
+    cap = os.environ.get(MAX_VIOLATIONS_ENV)
+    # Each file is hashed once per run, however many tools declare it
+    hashes = {}
+    keys = {}
+    for category in cacheable:
+        variant = f"max_violations={cap}" if cap and category in VIOLATION_CAPPED_TOOLS else ""
+        try:
+            keys[category] = compute_key(
+                workspace, category, tool_root / VERIFICATION_TOOLS[category][0],
+                TOOL_INPUTS[category], listing, variant, hashes
+            )
+        except OSError:
+            continue  # Unreadable input: run the tool rather than guess
+    return keys
+
+
+# Serialises duration-history updates from concurrent batch workspaces
+_history_lock = threading.Lock()
+
+
+def scope_to_changes(changed, deleted, execution_order):
+    """
+    run_check() keyword arguments for each tool that can be limited to
+    the changed paths; tools not returned run in full.
+    """
+    scopes = {}
+    checker_changed = bool(match_paths(changed, CHECKER_SOURCES))
+    for category in execution_order:
+        if category not in SCOPABLE_TOOLS or (deleted and SCOPABLE_TOOLS[category]):
+            continue
+        if checker_changed or VERIFICATION_TOOLS[category][0] in changed:
+            continue
+        if match_paths(changed, SCOPE_WIDENING_INPUTS.get(category, [])):
+            continue
+        scopes[category] = {"files": match_paths(changed, TOOL_INPUTS[category]["content"])}
+    return scopes
+
+
+def run_verification(isolated=False, jobs=None, use_cache=True, on_event=None, fail_fast=False, only=None,
+                     workspace=None, pool=None, since=None):
+    """
+    Run all verification tools following the dependency DAG.
+
+    Args:
+        isolated: Run every tool in its own interpreter process
+        jobs: Concurrent tool limit (defaults to the machine's CPU count)
+        use_cache: Reuse stored results for tools whose inputs are unchanged
+        on_event: Optional callback receiving progress events as dicts:
+            plan (execution_order), start (category), finish (category,
+            result) and complete (overall_status). Events arrive in
+            completion order; the returned report does not.
+        fail_fast: Run cheapest tools first and stop scheduling after the
+            first failure; unscheduled tools are reported as skipped
+        only: Optional categories to run; prerequisites outside this set
+            are treated as already satisfied
+        workspace: Workspace to verify (default: the tree the tools live in)
+        pool: Optional shared WarmWorkerPool; implies isolated and is left
+            open for the caller to close
+        since: Optional (changed, deleted) workspace-relative paths, e.g.
+            from change_watcher.git_changes(). SCOPABLE_TOOLS then verify
+            only those paths and bypass the cache; other tools run in full.
+    """
+    tool_root = get_workspace_root()
+    workspace = Path(workspace).resolve() if workspace is not None else tool_root
+    # Tools inspect their own tree unless told otherwise
+    target = None if workspace == tool_root else workspace
+    isolated = isolated or pool is not None
+    # Lets tools sharing a process reuse per-run state (workspace index)
+    run_id = uuid.uuid4().hex
+    history = read_duration_history()
+    execution_order = build_execution_order(costs=estimate_tool_costs(history) if fail_fast else None)
+    if only is not None:
+        execution_order = [category for category in execution_order if category in only]
+    budgets = {category: derive_tool_timeout(history.get(category, [])) for category in execution_order}
+    emit = on_event or (lambda event: None)
+    emit({
+        "event": "plan",
+        "execution_order": execution_order,
+        "budget_seconds": round(sum(budgets.values()), 2)
+    })
+
+    scopes = scope_to_changes(*since, execution_order) if since is not None else {}
+
+    results = {}
+    failures = []
+    cache = ResultCache(get_cache_dir(tool_root)) if use_cache else None
+    # A scoped result only covers some files, so it must never be stored
+    cacheable = [category for category in execution_order if category not in scopes]
+    keys = _cache_keys(tool_root, workspace, cacheable, run_id) if cache else {}
+
+    def on_start(category):
+        emit({"event": "start", "category": category})
+
+    def on_finish(category, result):
+        results[category] = result
+        if not _passed(result):
+            failures.append(category)
+        # Only completed runs are reusable; timeouts and crashes must re-run
+        if category in keys and reusable(result) and not result.get("cached"):
+            cache.put(keys[category], result)
+        if category in scopes and result.get("executed"):
+            result["scope"] = {"changed_files": len(scopes[category]["files"])}
+        emit({"event": "finish", "category": category, "result": result})
+
+    def should_stop():
+        return fail_fast and bool(failures)
+
+    for category, key in keys.items():
+        cached = cache.get(key)
+        if cached is not None:
+            cached["cached"] = True
+            on_start(category)
+            on_finish(category, cached)
+
+    pending = [category for category in execution_order if category not in results]
+    jobs = default_jobs(len(pending)) if jobs is None else max(1, jobs)
+
+    owns_pool = pool is None and isolated and bool(pending)
+    if owns_pool:
+        pool = WarmWorkerPool(
+            size=min(jobs, len(pending)),
+            preload=[tool_root / VERIFICATION_TOOLS[category][0] for category in pending]
+        )
+
+    try:
+        if jobs == 1 or len(pending) <= 1:
+            # Sequential in-process tools share one interpreter, so they can share parsed trees
+            ast_consumers = None if isolated else [c for c in pending if c in AST_CONSUMERS]
+            for category in pending:
+                if should_stop():
+                    break
+                on_start(category)
+                on_finish(category, run_verification_tool(
+                    tool_root / VERIFICATION_TOOLS[category][0],
+                    isolated=isolated, timeout=budgets[category], pool=pool, workspace=target,
+                    check_kwargs=scopes.get(category), run_id=run_id, ast_consumers=ast_consumers
+                ))
+        else:
+            # Isolated tools already run in worker processes, so threads suffice
+            # to overlap them; in-process tools need real processes for CPU parallelism.
+            executor_class = ThreadPoolExecutor if isolated else ProcessPoolExecutor
+            with executor_class(max_workers=jobs) as executor:
+                _run_dag(
+                    executor, tool_root, target, run_id, pending, isolated, pool, budgets, scopes,
+                    on_start, on_finish, should_stop
+                )
+    finally:
+        if owns_pool:
+            pool.close()
+
+    for category in execution_order:
+        if category not in results:
+            on_finish(category, _skipped(category, f"fail-fast stopped after {failures[0]} failed"))
+
+    # Feed this run's wall-clock times back into the budget history;
+    # an overrun is recorded at its budget so the next budget can grow.
+    # Scoped runs are not representative of a full run and are left out.
+    measured = {
+        category: result["budget"]["elapsed_ms"]
+        for category, result in results.items()
+        if "budget" in result and category in pending and category not in scopes
     }
+    budget_overruns = [
+        category for category in pending
+        if results[category].get("budget", {}).get("exceeded")
+    ]
+    try:
+        with _history_lock:
+            record_durations(measured)
+    except OSError:
+        pass  # History is advisory; never fail a run over it
+    
+    # build_report() restores topological order, regardless of completion order
+    report = build_report(results, execution_order, budget_overruns)
+    overall_status = report["overall_status"]
+
+    emit({
+        "event": "complete",
+        "orchestrator": report["orchestrator"],
+        "overall_status": overall_status,
+        "execution_order": execution_order,
+        "budget_overruns": budget_overruns
+    })
     
     return report
 
 
+def run_batch_verification(workspaces, max_parallel=None, use_cache=True, on_event=None, fail_fast=False):
+    """
+    Verify several workspaces with this tree's tools.
+
+    Up to max_parallel workspaces are verified at once, each running its
+    tools one at a time through a single shared warm worker pool, so total
+    concurrency never exceeds max_parallel tool processes.
+
+    Args:
+        workspaces: Workspace root directories
+        max_parallel: Concurrent workspace limit (defaults to CPU count)
+        use_cache: Reuse stored results for tools whose inputs are unchanged
+        on_event: Optional callback receiving run_verification() events,
+            each tagged with its "workspace"
+        fail_fast: Stop each workspace after its first failing tool
+
+    Returns:
+        dict: Aggregated report with a per-workspace breakdown
+    """
+    tool_root = get_workspace_root()
+    workspaces = list(dict.fromkeys(Path(w).resolve() for w in workspaces))
+    max_parallel = default_jobs(len(workspaces)) if max_parallel is None else max(1, max_parallel)
+    emit_lock = threading.Lock()
+
+    def verify(workspace):
+        if not workspace.is_dir():
+            return {
+                "orchestrator": "verification_orchestrator",
+                "overall_status": "not_ready",
+                "verifications": {},
+                "execution_order": [],
+                "budget_overruns": [],
+                "error": f"Workspace not found: {workspace}"
+            }
+
+        def tagged(event):
+            if on_event is not None:
+                with emit_lock:
+                    on_event(dict(event, workspace=str(workspace)))
+
+        return run_verification(
+            jobs=1, use_cache=use_cache, on_event=tagged,
+            fail_fast=fail_fast, workspace=workspace, pool=pool
+        )
+
+    reports = {}
+    preload = [tool_root / tool_path for tool_path, _ in VERIFICATION_TOOLS.values()]
+    with WarmWorkerPool(size=min(max_parallel, max(1, len(workspaces))), preload=preload) as pool:
+        with ThreadPoolExecutor(max_workers=max_parallel) as executor:
+            futures = {executor.submit(verify, workspace): workspace for workspace in workspaces}
+            for future in futures:
+                reports[str(futures[future])] = future.result()
+
+    ready = sum(1 for report in reports.values() if report["overall_status"] == "ready")
+    return {
+        "orchestrator": "verification_orchestrator",
+        "overall_status": "ready" if ready == len(reports) else "not_ready",
+        "summary": {
+            "workspaces": len(reports),
+            "ready": ready,
+            "not_ready": len(reports) - ready
+        },
+        "workspaces": reports
+    }
+
+
+def run_sequential_verification(isolated=False):
+    """
+    Run all verification tools one at a time in topological order.
+
+    Args:
+        isolated: Run every tool in its own interpreter process
+    """
+    return run_verification(isolated=isolated, jobs=1)
+
+
+def parse_args(argv=None):
+    """Parse orchestrator command-line options"""
+    parser = argparse.ArgumentParser(description="Run all verification tools")
+    parser.add_argument(
+        "--isolated",
+        action="store_true",
+        help="Run each tool in its own interpreter process (for untrusted tools)"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Maximum number of tools to run concurrently (default: CPU count)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Run every tool even if a cached result for its inputs exists"
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Emit one NDJSON event per line as tools start and finish"
+    )
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Run cheapest tools first and stop after the first failure"
+    )
+    parser.add_argument(
+        "--since",
+        metavar="REV",
+        help="Limit file-based tools to paths changed since this git revision"
+    )
+    parser.add_argument(
+        "--max-violations",
+        type=int,
+        metavar="N",
+        help="Stop each scanner after N violations and report the total as a lower bound"
+    )
+    parser.add_argument(
+        "--workspace",
+        action="append",
+        default=None,
+        help="Verify this workspace instead (repeatable; produces a batch report)"
+    )
+    parser.add_argument(
+        "--workspace-file",
+        help="File listing workspace roots to verify, one per line"
+    )
+    parser.add_argument(
+        "--max-parallel",
+        type=int,
+        default=None,
+        help="Maximum number of workspaces verified concurrently in batch mode"
+    )
+    parser.add_argument(
+        "--coordinator",
+        nargs="?",
+        const="127.0.0.1:7745",
+        help="Distribute the run to connected workers, listening on HOST:PORT (default 127.0.0.1:7745)"
+    )
+    parser.add_argument(
+        "--local-workers",
+        type=int,
+        default=0,
+        help="Worker processes to start on this host in coordinator mode"
+    )
+    parser.add_argument(
+        "--shard-size",
+        type=int,
+        default=None,
+        help="Files per python_syntax shard in coordinator mode"
+    )
+    parser.add_argument(
+        "--worker",
+        metavar="HOST:PORT",
+        help="Serve jobs for the coordinator at HOST:PORT (token from GLAIDO_DISTRIBUTED_TOKEN)"
+    )
+    args = parser.parse_args(argv)
+    if args.coordinator:
+        # Workers run their jobs one at a time, in-process and unscoped
+        unsupported = {
+            "--fail-fast": args.fail_fast,
+            "--since": args.since is not None,
+            "--isolated": args.isolated,
+            "--jobs": args.jobs is not None,
+        }
+        for flag, given in unsupported.items():
+            if given:
+                parser.error(f"{flag} is not supported with --coordinator")
+    return args
+
+
+def _print_event(event):
+    """Write one NDJSON event and flush so consumers see it immediately"""
+    sys.stdout.write(json.dumps(event, sort_keys=True) + "\n")
+    sys.stdout.flush()
+
+
 if __name__ == "__main__":
-    result = run_sequential_verification()
-    print(json.dumps(result, indent=2, sort_keys=True))
+    args = parse_args()
+    if args.max_violations is not None:
+        if args.max_violations < 1:
+            print("--max-violations must be at least 1", file=sys.stderr)
+            sys.exit(2)
+        os.environ[MAX_VIOLATIONS_ENV] = str(args.max_violations)
+
+    if args.worker:
+        from navigation.orchestrator.distributed_verification import run_worker
+        workspace = args.workspace[0] if args.workspace else None
+        sys.exit(0 if run_worker(args.worker, workspace=workspace) else 1)
+
+    if args.coordinator:
+        from navigation.orchestrator import distributed_verification
+        result = distributed_verification.run_distributed_verification(
+            address=args.coordinator,
+            local_workers=args.local_workers,
+            shard_size=args.shard_size or distributed_verification.DEFAULT_SHARD_SIZE,
+            use_cache=not args.no_cache,
+            on_event=_print_event if args.stream else None,
+            workspace=args.workspace[0] if args.workspace else None
+        )
+        if not args.stream:
+            print(json.dumps(result, indent=2, sort_keys=True))
+        sys.exit(0 if result["overall_status"] == "ready" else 1)
+
+    workspaces = list(args.workspace or [])
+    if args.workspace_file:
+        with open(args.workspace_file, "r", encoding="utf-8") as f:
+            workspaces.extend(line.strip() for line in f if line.strip() and not line.startswith("#"))
+
+    if workspaces:
+        result = run_batch_verification(
+            workspaces,
+            max_parallel=args.max_parallel,
+            use_cache=not args.no_cache,
+            on_event=_print_event if args.stream else None,
+            fail_fast=args.fail_fast
+        )
+        if not args.stream:
+            print(json.dumps(result, indent=2, sort_keys=True))
+        sys.exit(0 if result["overall_status"] == "ready" else 1)
+
+    since = None
+    if args.since:
+        try:
+            since = git_changes(get_workspace_root(), args.since)
+        except ValueError as e:
+            print(f"Cannot resolve --since {args.since}: {e}", file=sys.stderr)
+            sys.exit(2)
+
+    result = run_verification(
+        isolated=args.isolated,
+        jobs=args.jobs,
+        use_cache=not args.no_cache,
+        on_event=_print_event if args.stream else None,
+        fail_fast=args.fail_fast,
+        since=since
+    )
+    if not args.stream:
+        print(json.dumps(result, indent=2, sort_keys=True))
     
     # Exit with status
     sys.exit(0 if result["overall_status"] == "ready" else 1)
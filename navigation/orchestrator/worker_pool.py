@@ -0,0 +1,236 @@
+"""
+Warm Worker Pool
+
+Pre-started interpreter processes for isolated tool execution.
+Each worker imports json, ast, pathlib and the tool modules once, then
+serves tool jobs sent as JSON lines over its stdin/stdout pipes. A crash
+or hang only takes down that worker, exactly like the one-shot
+subprocess path, but interpreter startup is paid once per worker instead
+of once per tool.
+
+Workers are recycled after a fixed number of jobs, or as soon as their
+peak resident memory exceeds the configured ceiling. A worker found dead
+when a job is dispatched is replaced before the job is sent.
+"""
+
+import os
+import sys
+import json
+import queue
+import signal
+import threading
+import subprocess
+from pathlib import Path
+from typing import Iterable, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+# Jobs served before a worker is replaced
+DEFAULT_MAX_JOBS = 50
+
+# Peak RSS (MiB) above which a worker is replaced after its current job
+DEFAULT_MAX_RSS_MB = 256
+
+
+def _peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process in MiB, where measurable."""
+    try:
+        import resource
+    except ImportError:
+        return None  # Windows: memory ceiling not enforced
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def process_group_options() -> dict:
+    """Popen keyword arguments that start the child as its own process group."""
+    if os.name == "posix":
+        return {"start_new_session": True}
+    return {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+
+
+def kill_process_group(process: subprocess.Popen) -> None:
+    """Kill a child started with process_group_options() and anything it spawned."""
+    if process.poll() is not None:
+        return
+    try:
+        if os.name == "posix":
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+    except (ProcessLookupError, PermissionError):
+        process.kill()
+
+
+def _worker_error(message: str) -> dict:
+    return {
+        "category": "unknown",
+        "status": "error",
+        "executed": False,
+        "error": message
+    }
+
+
+class _Worker:
+    """One warm interpreter and the pipes used to talk to it."""
+
+    def __init__(self, preload: Iterable[str]):
+        self.jobs = 0
+        self.process = subprocess.Popen(
+            [sys.executable, str(Path(__file__).resolve()), "--worker", *preload],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+            **process_group_options(),
+        )
+        # A reader thread turns the blocking pipe into a queue we can time out on
+        self._replies = queue.Queue()
+        threading.Thread(target=self._read_replies, daemon=True).start()
+        self.peak_rss_mb = 0.0
+
+    def _read_replies(self):
+        for line in self.process.stdout:
+            self._replies.put(line)
+        self._replies.put(None)  # EOF: worker exited
+
+    def alive(self) -> bool:
+        return self.process.poll() is None
+
+    def request(self, tool_path, timeout, workspace=None, check_kwargs=None, run_id=None) -> dict:
+        """Send one job and wait for its reply, killing the worker on timeout."""
+        self.jobs += 1
+        job = {
+            "tool_path": str(tool_path),
+            "workspace": str(workspace) if workspace is not None else None,
+            "check_kwargs": check_kwargs,
+            "run_id": run_id
+        }
+        try:
+            self.process.stdin.write(json.dumps(job) + "\n")
+            self.process.stdin.flush()
+        except OSError as e:
+            return _worker_error(f"Tool worker unavailable: {e}")
+
+        try:
+            line = self._replies.get(timeout=timeout)
+        except queue.Empty:
+            self.kill()
+            return _worker_error("Tool execution timeout")
+
+        if line is None:
+            code = self.process.wait()
+            return _worker_error(f"Tool worker exited unexpectedly (exit code {code})")
+
+        try:
+            reply = json.loads(line)
+        except json.JSONDecodeError as e:
+            self.kill()
+            return _worker_error(f"Invalid JSON output: {str(e)}")
+
+        self.peak_rss_mb = reply.get("peak_rss_mb") or 0.0
+        return reply["output"]
+
+    def kill(self):
+        kill_process_group(self.process)
+        self.process.wait()
+
+    def close(self):
+        """Ask the worker to exit by closing its job pipe."""
+        try:
+            self.process.stdin.close()
+            self.process.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            self.kill()
+
+
+class WarmWorkerPool:
+    """
+    Fixed-size pool of warm tool workers.
+
+    Safe to share between threads: each run() checks out one idle worker
+    for the duration of a single job.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        preload: Iterable = (),
+        max_jobs: int = DEFAULT_MAX_JOBS,
+        max_rss_mb: float = DEFAULT_MAX_RSS_MB,
+    ):
+        self.preload = [str(p) for p in preload]
+        self.max_jobs = max_jobs
+        self.max_rss_mb = max_rss_mb
+        self._idle = queue.Queue()
+        for _ in range(max(1, size)):
+            self._idle.put(_Worker(self.preload))
+
+    def _needs_recycling(self, worker: _Worker) -> bool:
+        return (
+            not worker.alive()
+            or worker.jobs >= self.max_jobs
+            or (self.max_rss_mb and worker.peak_rss_mb > self.max_rss_mb)
+        )
+
+    def run(self, tool_path, timeout, workspace=None, check_kwargs=None, run_id=None) -> dict:
+        """Run one tool on an idle worker and return its result."""
+        worker = self._idle.get()
+        try:
+            # A worker can die while idle (OOM killer, stray signal)
+            if not worker.alive():
+                worker.kill()
+                worker = _Worker(self.preload)
+            return worker.request(tool_path, timeout, workspace, check_kwargs, run_id)
+        finally:
+            if self._needs_recycling(worker):
+                worker.close()
+                worker = _Worker(self.preload)
+            self._idle.put(worker)
+
+    def close(self):
+        """Stop every worker."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _worker_main(preload):
+    """Serve tool jobs from stdin until the pipe closes."""
+    # Tools must not be able to corrupt the reply channel with stray prints
+    channel = sys.stdout
+    sys.stdout = sys.stderr
+
+    import ast  # noqa: F401 — warm the modules every tool needs
+    import pathlib  # noqa: F401
+    from navigation.orchestrator import verification_orchestrator as orchestrator
+
+    for tool_path in preload:
+        try:
+            orchestrator._load_tool_module(tool_path)
+        except BaseException:
+            pass  # The job itself will report the failure
+
+    for line in sys.stdin:
+        job = json.loads(line)
+        # The parent enforces the timeout by killing this process
+        output = orchestrator.run_verification_tool(
+            job["tool_path"], isolated=False, timeout=None,
+            workspace=job.get("workspace"), check_kwargs=job.get("check_kwargs"), run_id=job.get("run_id")
+        )
+        channel.write(json.dumps({"output": output, "peak_rss_mb": _peak_rss_mb()}, default=str) + "\n")
+        channel.flush()
+
+
+if __name__ == "__main__" and len(sys.argv) > 1 and sys.argv[1] == "--worker":
+    _worker_main(sys.argv[2:])
@@ -9,10 +9,13 @@ import sys
 import json
 from pathlib import Path
 
+sys.path.append(str(Path(__file__).resolve().parents[1] / "core"))
+from base_tool_contract import get_workspace_root
+
 
 def get_registry_path():
     """Get path to agent registry"""
-    workspace = Path(__file__).resolve().parents[2]
+    workspace = get_workspace_root()
     return workspace / "agents" / "_registry.json"
 
 
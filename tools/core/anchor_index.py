@@ -0,0 +1,189 @@
+"""
+Tool: Anchor Index
+Purpose: Heading anchors of markdown documents for fragment link checks
+Category: core
+
+Every heading gets the anchor GitHub renders for it: inline links reduced
+to their text, HTML tags dropped, lower-cased, characters other than
+letters, digits, '_', '-' and spaces removed, spaces turned into '-', and
+repeated slugs numbered '-1', '-2', ... Explicit <a name="..."> and
+id="..." anchors count too; headings inside fenced code blocks do not.
+
+Heading slugs are matched case-insensitively, explicit anchors exactly as
+written (Anchors.resolves).
+
+Anchors are cached per document under .glaido/anchor_cache, one file per
+verified workspace, validated by a hash of the document's content, so a
+document's headings are only scanned again after its text changed.
+Documents that no longer exist are dropped whenever the file is rewritten.
+"""
+
+import os
+import re
+import sys
+import json
+import hashlib
+import threading
+from pathlib import Path
+from typing import Dict, FrozenSet, List, NamedTuple, Tuple
+
+sys.path.append(str(Path(__file__).parent))
+from base_tool_contract import get_workspace_root, workspace_key
+
+CACHE_FORMAT_VERSION = 2
+
+ATX_HEADING = re.compile(r"^ {0,3}#{1,6}(?:[ \t]+(.*?))?(?:[ \t]+#+)?[ \t]*$")
+SETEXT_UNDERLINE = re.compile(r"^ {0,3}(?:=+|-+)[ \t]*$")
+FENCE = re.compile(r"^ {0,3}(`{3,}|~{3,})")
+INLINE_LINK = re.compile(r"!?\[([^\]]*)\]\([^)]*\)")
+HTML_TAG = re.compile(r"<[^>]+>")
+HTML_ANCHOR = re.compile(r"""<a\s[^>]*?(?:name|id)\s*=\s*["']([^"']+)["']""", re.IGNORECASE)
+NOT_SLUG = re.compile(r"[^\w\- ]")
+
+
+class Anchors(NamedTuple):
+    headings: FrozenSet[str]    # Lower-case slugs
+    explicit: FrozenSet[str]    # <a name>/id values, case preserved
+
+    def resolves(self, fragment: str) -> bool:
+        """Whether a decoded #fragment names one of these anchors."""
+        return fragment in self.explicit or fragment.lower() in self.headings
+
+
+NO_ANCHORS = Anchors(frozenset(), frozenset())
+
+
+def slugify(heading: str) -> str:
+    """Anchor GitHub generates for one heading's text (before de-duplication)."""
+    text = INLINE_LINK.sub(r"\1", heading)
+    text = HTML_TAG.sub("", text)
+    return NOT_SLUG.sub("", text.strip().lower()).replace(" ", "-")
+
+
+def extract_anchors(content: str) -> Tuple[List[str], List[str]]:
+    """(heading slugs, explicit anchors) of one document in order of appearance."""
+    anchors = []
+    explicit = []
+    seen: Dict[str, int] = {}
+    fence = None
+    previous = ""
+
+    def add(slug):
+        count = seen.get(slug, 0)
+        seen[slug] = count + 1
+        anchors.append(slug if count == 0 else f"{slug}-{count}")
+
+    for line in content.split("\n"):
+        opening = FENCE.match(line)
+        if fence is not None:
+            if opening and opening.group(1)[0] == fence[0] and len(opening.group(1)) >= len(fence):
+                fence = None
+            previous = ""
+            continue
+        if opening:
+            fence = opening.group(1)
+            previous = ""
+            continue
+
+        heading = ATX_HEADING.match(line)
+        if heading:
+            add(slugify(heading.group(1) or ""))
+            line = ""  # Never the text of a setext heading
+        elif SETEXT_UNDERLINE.match(line) and previous.strip():
+            add(slugify(previous))
+            line = ""
+
+        explicit.extend(HTML_ANCHOR.findall(line))
+        previous = line
+
+    return anchors, explicit
+
+
+def content_hash(content: str) -> str:
+    return hashlib.blake2b(content.encode("utf-8", "surrogatepass"), digest_size=16).hexdigest()
+
+
+def get_cache_path(workspace: Path) -> Path:
+    """Cache file for one workspace, under the tools' own tree."""
+    return (Path(__file__).resolve().parents[2] / ".glaido" / "anchor_cache" / f"v{CACHE_FORMAT_VERSION}"
+            / f"{workspace_key(workspace)}.json")
+
+
+class AnchorCache:
+    """Anchors keyed by absolute document path, validated by content hash."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.entries: Dict[str, list] = None    # path -> [content hash, heading slugs, explicit anchors]
+        self.dirty: Dict[str, list] = {}
+        self.lock = threading.Lock()
+
+    def _read(self) -> Dict[str, list]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+            return entries if isinstance(entries, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _entries(self) -> Dict[str, list]:
+        if self.entries is None:
+            self.entries = self._read()
+        return self.entries
+
+    def anchors(self, path, content: str = None) -> Anchors:
+        """
+        Anchors of a document, read from disk unless its content is given.
+        Missing or unreadable documents have none.
+        """
+        key = os.path.normpath(os.fspath(path))
+        if content is None:
+            try:
+                with open(key, "r", encoding="utf-8") as f:
+                    content = f.read()
+            except (OSError, UnicodeDecodeError):
+                return NO_ANCHORS
+
+        digest = content_hash(content)
+        with self.lock:
+            entry = self._entries().get(key)
+        if entry is not None and entry[0] == digest:
+            headings, explicit = entry[1], entry[2]
+        else:
+            headings, explicit = extract_anchors(content)
+            with self.lock:
+                self.entries[key] = self.dirty[key] = [digest, headings, explicit]
+
+        return Anchors(frozenset(headings), frozenset(explicit))
+
+    def flush(self):
+        """Merge new entries into the file; concurrent writers keep each other's work."""
+        with self.lock:
+            if not self.dirty:
+                return
+            entries = self._read()
+            entries.update(self.dirty)
+            entries = {key: entry for key, entry in entries.items() if os.path.exists(key)}
+            self.dirty = {}
+            self.entries = entries
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            partial = self.path.with_name(f"{self.path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(partial, "w", encoding="utf-8") as f:
+                json.dump(entries, f, sort_keys=True)
+            os.replace(partial, self.path)
+        except OSError:
+            pass  # The cache is advisory; a read-only checkout simply re-scans
+
+
+_lock = threading.Lock()
+_caches: Dict[Path, AnchorCache] = {}
+
+
+def get_cache() -> AnchorCache:
+    """Process-wide anchor cache for the workspace under verification."""
+    workspace = get_workspace_root()
+    with _lock:
+        if workspace not in _caches:
+            _caches[workspace] = AnchorCache(get_cache_path(workspace))
+        return _caches[workspace]
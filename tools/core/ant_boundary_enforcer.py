@@ -1,65 +1,131 @@
 #!/usr/bin/env python3
 import sys
 import json
-import ast
 import time
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import NamedTuple
 
-def get_workspace_root() -> Path:
-    return Path(__file__).resolve().parents[2]
+sys.path.append(str(Path(__file__).parent))
+from workspace_index import get_index, glob_to_regex
+import ast_store
+from base_tool_contract import ScanProgress, collect_violations, describe_total, get_max_violations, get_workspace_root
 
-def check_layer(workspace: Path, layer_path: str, forbidden_imports: list) -> list:
-    violations = []
-    layer_dir = workspace / layer_path
-    if not layer_dir.exists():
-        return violations
-        
-    for py_file in layer_dir.rglob("*.py"):
-        try:
-            with open(py_file, 'r', encoding='utf-8') as f:
-                tree = ast.parse(f.read(), filename=str(py_file))
-                
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Import):
-                    for alias in node.names:
-                        for forbidden in forbidden_imports:
-                            if alias.name == forbidden or alias.name.startswith(f"{forbidden}."):
-                                violations.append({
-                                    "file": str(py_file.relative_to(workspace)),
-                                    "line": node.lineno,
-                                    "import": alias.name,
-                                    "forbidden": forbidden
-                                })
-                elif isinstance(node, ast.ImportFrom):
-                    if node.module:
-                        for forbidden in forbidden_imports:
-                            if node.module == forbidden or node.module.startswith(f"{forbidden}."):
-                                violations.append({
-                                    "file": str(py_file.relative_to(workspace)),
-                                    "line": node.lineno,
-                                    "import": node.module,
-                                    "forbidden": forbidden
-                                })
-        except Exception:
-            pass # Gracefully handle unparseable files
-    return violations
+# Declarative boundary rules: layer glob -> forbidden module prefixes
+RULES_FILE = Path(__file__).parent / "ant_boundary_rules.json"
 
-def run_check():
+class BoundaryRule(NamedTuple):
+    name: str
+    layer: str              # Workspace-relative glob ("**" spans directories)
+    forbidden: tuple        # Dotted module prefixes
+    reason: str
+
+def load_rules(path: Path = RULES_FILE) -> list:
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    rules = []
+    for i, raw in enumerate(data.get("rules", [])):
+        if not isinstance(raw.get("layer"), str) or not isinstance(raw.get("forbidden"), list):
+            raise ValueError(f"{path.name}: rule {i} needs a 'layer' glob and a 'forbidden' list")
+        rules.append(BoundaryRule(raw.get("name", f"rule-{i}"), raw["layer"], tuple(raw["forbidden"]), raw.get("reason", "")))
+    return rules
+
+class CompiledRules:
+    """
+    Rules compiled for one pass per file.
+
+    Forbidden prefixes live in a trie keyed by dotted module component, so
+    matching an import costs one step per component of its name no matter
+    how many rules exist. Each trie node lists the (rule, prefix) pairs
+    ending there; an import matches every pair on its path, which is
+    exactly "module == prefix or module starts with prefix + '.'".
+    """
+
+    def __init__(self, rules: list):
+        self.rules = rules
+        self.trie = {}      # component -> (children, [(rule index, prefix)])
+        for index, rule in enumerate(rules):
+            for prefix in rule.forbidden:
+                children, ends = None, None
+                level = self.trie
+                for part in prefix.split("."):
+                    children, ends = level.setdefault(part, ({}, []))
+                    level = children
+                ends.append((index, prefix))
+
+        # Rules sharing a layer glob share one compiled pattern
+        self.layers = {}
+        for index, rule in enumerate(rules):
+            self.layers.setdefault(rule.layer, (glob_to_regex(rule.layer), []))[1].append(index)
+
+    def applicable(self, path: str) -> set:
+        """Indexes of the rules whose layer contains a workspace-relative path."""
+        indexes = set()
+        for pattern, rule_indexes in self.layers.values():
+            if pattern.match(path):
+                indexes.update(rule_indexes)
+        return indexes
+
+    def matches(self, module: str):
+        """(rule index, prefix) for every forbidden prefix module equals or lies under."""
+        level = self.trie
+        for part in module.split("."):
+            node = level.get(part)
+            if node is None:
+                return
+            level, ends = node
+            yield from ends
+
+def scanned_files(workspace: Path, compiled: CompiledRules, files: list = None) -> list:
+    """Workspace-relative .py files at least one rule applies to."""
+    if files is None:
+        candidates = [entry.path for entry in get_index(workspace).files(suffix=".py")]
+    else:
+        # Scoped run: only the given workspace-relative files
+        candidates = [f for f in files if f.endswith(".py") and (workspace / f).is_file()]
+    return [path for path in candidates if compiled.applicable(path)]
+
+def iter_violations(workspace: Path, paths: list, compiled: CompiledRules, store, progress=None):
+    """Yield forbidden imports file by file in one pass over each file's imports."""
+    for path in paths:
+        applicable = compiled.applicable(path)
+        violations = []
+        # Unparseable files are python_syntax's concern; they import nothing here
+        for record in store.summary(workspace / path).imports:
+            if record.level is not None and not record.module:
+                continue  # "from . import x"
+            for index, prefix in compiled.matches(record.module):
+                if index in applicable:
+                    violations.append({
+                        "file": str(Path(path)),
+                        "line": record.line,
+                        "import": record.module,
+                        "forbidden": prefix,
+                        "rule": compiled.rules[index].name
+                    })
+        if progress is not None:
+            progress.scanned += 1
+        yield from violations
+
+def run_check(files=None):
     start_time = time.perf_counter_ns()
     workspace = get_workspace_root()
-    violations = []
-    
-    # Rule 1: tools/ cannot import cli/
-    violations.extend(check_layer(workspace, "tools/", ["cli"]))
-    
-    # Rule 2: navigation/ cannot import cli/display/
-    violations.extend(check_layer(workspace, "navigation/", ["cli.display"]))
+    compiled = CompiledRules(load_rules())
+    if files is not None and RULES_FILE.resolve().is_relative_to(workspace):
+        # A rule change can affect any file
+        if RULES_FILE.resolve().relative_to(workspace).as_posix() in files:
+            files = None
+    paths = scanned_files(workspace, compiled, files)
+    progress = ScanProgress(len(paths))
+
+    with ast_store.consumer("ant_boundary", [workspace / path for path in paths]) as store:
+        stream = iter_violations(workspace, paths, compiled, store, progress)
+        violations, totals = collect_violations(stream, get_max_violations())
     
     duration_ms = (time.perf_counter_ns() - start_time) // 1_000_000
     
     status = "ready" if not violations else "error"
-    message = "Layer boundaries respected" if not violations else f"{len(violations)} boundary violations detected"
+    message = "Layer boundaries respected" if not violations else describe_total(totals, "boundary violations")
     
     report = {
         "category": "ant_boundary",
@@ -69,10 +135,13 @@ def run_check():
         "actionable": bool(violations),
         "remediation": "Remove cross-layer imports referencing forbidden architectural zones" if violations else None,
         "results": {
-            "violations": violations
+            "violations": violations,
+            "violation_totals": totals
         },
         "metrics": {
-            "duration_ms": duration_ms
+            "duration_ms": duration_ms,
+            "rules": len(compiled.rules),
+            "files_scanned": progress.scanned
         }
     }
     
@@ -1,59 +1,146 @@
 #!/usr/bin/env python3
+import os
 import sys
 import json
 import time
 import re
+import posixpath
+from bisect import bisect_right
 from datetime import datetime, timezone
 from pathlib import Path
+from urllib.parse import unquote
 
-def get_workspace_root() -> Path:
-    return Path(__file__).resolve().parents[2]
+sys.path.append(str(Path(__file__).parent))
+from workspace_index import get_index
+import anchor_index
+from base_tool_contract import ScanProgress, collect_violations, describe_total, get_max_violations, get_workspace_root
 
-def run_check():
+# Matches [text](path) within one line
+LINK_PATTERN = re.compile(r'\[([^\]\n]+)\]\(([^)\n]+)\)')
+NEWLINE = re.compile(r'\n')
+
+def target_exists(workspace: Path, index, md_path: str, link: str) -> bool:
+    """
+    Whether a relative link from md_path points at something.
+
+    Targets are looked up lexically in the workspace index; only links it
+    cannot vouch for (outside the workspace, absolute, through symlinks or
+    pruned directories, or really broken) are checked on disk.
+    """
+    if not link.startswith("/"):
+        target = posixpath.normpath(posixpath.join(posixpath.dirname(md_path), link))
+        if target == "." or (not target.startswith("../") and target != ".." and index.get(target) is not None):
+            return True
+    return ((workspace / md_path).parent / link).resolve().exists()
+
+class DocumentAnchors:
+    """Anchors per document for one run, each document hashed at most once."""
+
+    def __init__(self):
+        self.cache = anchor_index.get_cache()
+        self.documents = {}
+
+    def get(self, path, content: str = None) -> anchor_index.Anchors:
+        key = os.path.normpath(path)
+        if key not in self.documents:
+            self.documents[key] = self.cache.anchors(key, content)
+        return self.documents[key]
+
+def broken_links(workspace: Path, md_file: Path, index=None, anchors: DocumentAnchors = None) -> list:
+    if index is None:
+        index = get_index(workspace)
+    if anchors is None:
+        anchors = DocumentAnchors()
+    md_path = md_file.relative_to(workspace).as_posix()
+    violations = []
+    with open(md_file, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    newlines = None  # Offsets of "\n", computed for the first broken link only
+    def line_of(match):
+        nonlocal newlines
+        if newlines is None:
+            newlines = [newline.start() for newline in NEWLINE.finditer(content)]
+        return bisect_right(newlines, match.start()) + 1
+
+    for match in LINK_PATTERN.finditer(content):
+        link_path = match.group(2).strip()
+        
+        # Ignore external links, mailto, absolute files generally generated by AI
+        if link_path.startswith(("http://", "https://", "mailto:", "file://")):
+            continue
+            
+        clean_path, _, fragment = link_path.partition("#")
+        if clean_path:
+            if not target_exists(workspace, index, md_path, clean_path):
+                violations.append({
+                    "file": str(md_file.relative_to(workspace)),
+                    "line": line_of(match),
+                    "broken_link": link_path,
+                    "resolved_path_attempt": str((md_file.parent / clean_path).resolve())
+                })
+                continue
+            if not fragment or not clean_path.endswith(".md"):
+                continue # Only markdown headings are known anchors
+            target_doc = os.path.join(md_file.parent, clean_path)
+            target_anchors = anchors.get(target_doc)
+        else:
+            if not fragment:
+                continue
+            target_doc = md_file # Hash link only, points to same file
+            target_anchors = anchors.get(md_file, content)
+
+        if not target_anchors.resolves(unquote(fragment)):
+            violations.append({
+                "file": str(md_file.relative_to(workspace)),
+                "line": line_of(match),
+                "broken_link": link_path,
+                "missing_anchor": fragment,
+                "resolved_path_attempt": str(Path(target_doc).resolve())
+            })
+    return violations
+
+def iter_violations(workspace: Path, md_files: list, progress=None, anchors: DocumentAnchors = None):
+    """Yield broken links document by document, counting documents in progress."""
+    index = get_index(workspace)
+    if anchors is None:
+        anchors = DocumentAnchors()
+    for md_file in md_files:
+        try:
+            violations = broken_links(workspace, md_file, index, anchors)
+        except Exception:
+            violations = []
+        if progress is not None:
+            progress.scanned += 1
+        yield from violations
+
+def run_check(files=None):
     start_time = time.perf_counter_ns()
     workspace = get_workspace_root()
     arch_dir = workspace / "architecture"
+    anchors = DocumentAnchors()
     
-    violations = []
-    
-    # Matches [text](path)
-    link_pattern = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
-    
+    md_files = []
     if arch_dir.exists():
-        for md_file in arch_dir.rglob("*.md"):
-            try:
-                with open(md_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    
-                lines = content.splitlines()
-                for i, line in enumerate(lines):
-                    for match in link_pattern.finditer(line):
-                        link_path = match.group(2).strip()
-                        
-                        # Ignore external links, mailto, absolute files generally generated by AI
-                        if link_path.startswith(("http://", "https://", "mailto:", "file://")):
-                            continue
-                            
-                        # Remove fragment hash
-                        clean_path = link_path.split("#")[0]
-                        if not clean_path:
-                            continue # Hash link only, points to same file
-                            
-                        target_path = (md_file.parent / clean_path).resolve()
-                        
-                        if not target_path.exists():
-                            violations.append({
-                                "file": str(md_file.relative_to(workspace)),
-                                "line": i + 1,
-                                "broken_link": link_path,
-                                "resolved_path_attempt": str(target_path)
-                            })
-            except Exception:
-                pass
+        if files is None:
+            md_files = [workspace / entry.path for entry in get_index(workspace).files("architecture", suffix=".md")]
+        else:
+            # Scoped run: only the given workspace-relative docs. Deleting a
+            # file or editing a doc's headings can break links in untouched
+            # docs, so callers must pass files=None whenever anything was
+            # deleted or any markdown document changed.
+            md_files = [
+                workspace / f for f in files
+                if f.endswith(".md") and (workspace / f).is_relative_to(arch_dir) and (workspace / f).is_file()
+            ]
+
+    progress = ScanProgress(len(md_files))
+    violations, totals = collect_violations(iter_violations(workspace, md_files, progress, anchors), get_max_violations())
+    anchors.cache.flush()
                 
     duration_ms = (time.perf_counter_ns() - start_time) // 1_000_000
     status = "ready" if not violations else "error"
-    message = "No broken architecture links" if not violations else f"{len(violations)} broken links detected"
+    message = "No broken architecture links" if not violations else describe_total(totals, "broken links")
     
     report = {
         "category": "architecture_links",
@@ -61,9 +148,10 @@ def run_check():
         "timestamp": datetime.now(timezone.utc).isoformat(),
         "message": message,
         "actionable": bool(violations),
-        "remediation": "Fix relative paths in architecture documentation" if violations else None,
+        "remediation": "Fix relative paths and #anchors in architecture documentation" if violations else None,
         "results": {
-            "violations": violations
+            "violations": violations,
+            "violation_totals": totals
         },
         "metrics": {
             "duration_ms": duration_ms
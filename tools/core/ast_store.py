@@ -0,0 +1,198 @@
+"""
+Tool: AST Store
+Purpose: Parse each Python file at most once per verification run
+Category: core
+
+Static analysis tools that share a process during a run (in-process,
+sequential runs) read the same files. The orchestrator names the tools
+expected to run in GLAIDO_AST_CONSUMERS; each of them opens a consumer
+session declaring the files it will read, and every file is parsed once
+and the same tree handed to each consumer.
+
+Trees are reference counted by consumer claims: a tree is dropped as soon
+as every consumer that claimed it has taken it and no expected consumer
+is still to start. Parse failures are stored the same way and re-raised
+to each consumer, so every tool sees the identical outcome.
+
+Trees are shared: consumers must treat them as read-only.
+
+Tools that only need a file's imports, strings, symbols or parse error
+ask for summary() instead: it is served from the persistent parse cache
+(parse_cache.py) and only parses files that changed since they were
+last summarized.
+
+Without a run id, or for a consumer the orchestrator did not announce,
+sessions parse directly and retain nothing.
+"""
+
+import os
+import ast
+import sys
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Set
+
+sys.path.append(str(Path(__file__).parent))
+import parse_cache
+from parse_cache import FileSummary, parse_file
+from base_tool_contract import get_setting
+
+RUN_ID_ENV = "GLAIDO_RUN_ID"
+CONSUMERS_ENV = "GLAIDO_AST_CONSUMERS"
+
+
+class _RunStore:
+    """Trees and claims for one run."""
+
+    def __init__(self, expected: Iterable[str]):
+        self.expected: Set[str] = set(expected)
+        self.started: Set[str] = set()
+        self.trees: Dict[str, object] = {}      # path -> tree or exception
+        self.claims: Dict[str, Set[str]] = {}   # path -> consumers yet to take it
+
+    def _retained(self, key: str) -> bool:
+        return bool(self.claims.get(key)) or bool(self.expected - self.started)
+
+    def _collect(self, keys: Iterable[str]):
+        for key in list(keys):
+            if key in self.trees and not self._retained(key):
+                del self.trees[key]
+                self.claims.pop(key, None)
+
+    def start(self, consumer: str, paths: Iterable):
+        self.started.add(consumer)
+        for path in paths:
+            self.claims.setdefault(os.fspath(path), set()).add(consumer)
+        self._collect(self.trees)
+
+    def take(self, consumer: str, path) -> object:
+        key = os.fspath(path)
+        if key not in self.trees:
+            try:
+                self.trees[key] = parse_file(path)
+            except Exception as e:
+                self.trees[key] = e
+        outcome = self.trees[key]
+        self.skip(consumer, key)
+        return outcome
+
+    def skip(self, consumer: str, path):
+        """Give up a claim without taking the tree."""
+        key = os.fspath(path)
+        self.claims.get(key, set()).discard(consumer)
+        self._collect([key])
+
+    def finish(self, consumer: str):
+        for claimants in self.claims.values():
+            claimants.discard(consumer)
+        self._collect(self.trees)
+
+
+_lock = threading.Lock()
+_store: Optional[_RunStore] = None
+_store_run_id: Optional[str] = None
+
+
+def _current_store() -> Optional[_RunStore]:
+    global _store, _store_run_id
+    run_id = get_setting(RUN_ID_ENV)
+    if run_id is None:
+        return None
+    if run_id != _store_run_id:
+        consumers = [c for c in (get_setting(CONSUMERS_ENV) or "").split(",") if c]
+        _store = _RunStore(consumers)
+        _store_run_id = run_id
+    return _store
+
+
+class consumer:
+    """
+    Session for one tool's reads.
+
+        with ast_store.consumer("ant_boundary", paths) as store:
+            tree = store.parse(path)
+    """
+
+    def __init__(self, name: str, paths: Iterable = ()):
+        self.name = name
+        self.paths = list(paths)
+        self.store = None
+        self.primed: Dict[str, FileSummary] = {}
+
+    def __enter__(self):
+        with _lock:
+            store = _current_store()
+            if store is not None and self.name in store.expected:
+                store.start(self.name, self.paths)
+                self.store = store
+        return self
+
+    def parse(self, path) -> ast.AST:
+        """Tree for path; raises what parsing it raised."""
+        if self.store is None:
+            return parse_file(path)
+        with _lock:
+            outcome = self.store.take(self.name, path)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    def missing(self, paths: Iterable) -> list:
+        """Paths summary() would have to parse."""
+        cache = parse_cache.get_cache()
+        result = []
+        for path in paths:
+            key = os.fspath(path)
+            if key in self.primed:
+                continue
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue  # summary() reports it without parsing
+            if cache.get(key, stat) is None:
+                result.append(path)
+        return result
+
+    def prime(self, path, stat: Optional[os.stat_result], summary: FileSummary):
+        """Hand in a summary computed elsewhere (e.g. a worker process)."""
+        self.primed[os.fspath(path)] = summary
+        if stat is not None:
+            parse_cache.get_cache().put(os.fspath(path), stat, summary)
+
+    def summary(self, path) -> FileSummary:
+        """Cached facts for path; parse failures are reported in .error."""
+        key = os.fspath(path)
+        summary = self.primed.pop(key, None)
+        if summary is not None:
+            self.release(key)
+            return summary
+
+        cache = parse_cache.get_cache()
+        try:
+            stat = os.stat(path)
+        except OSError as e:
+            return parse_cache.failed(e)
+
+        summary = cache.get(key, stat)
+        if summary is not None:
+            self.release(key)
+            return summary
+
+        try:
+            summary = parse_cache.summarize(self.parse(path))
+        except Exception as e:
+            summary = parse_cache.failed(e)
+        cache.put(key, stat, summary)
+        return summary
+
+    def release(self, path):
+        """Declare path will not be read after all."""
+        if self.store is not None:
+            with _lock:
+                self.store.skip(self.name, os.fspath(path))
+
+    def __exit__(self, *exc_info):
+        if self.store is not None:
+            with _lock:
+                self.store.finish(self.name)
+        parse_cache.get_cache().flush()
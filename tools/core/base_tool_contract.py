@@ -3,9 +3,14 @@ Base Tool Contract
 Defines the abstract base class and type protocols for all Glaido Omni-Nexus core tools.
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+import os
 import time
+import hashlib
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime, timezone
+from pathlib import Path
 
 class CoreVerificationTool:
     """Base class defining the strict JSON contract for all verification tools."""
@@ -40,3 +45,89 @@ class CoreVerificationTool:
         Returns: (status, results_dict, message, actionable, remediation)
         """
         raise NotImplementedError("Tool must implement _execute_impl")
+
+
+# Settings the orchestrator hands an in-process tool run. They shadow the
+# process environment for the calling thread only, so a tool still running
+# after its timeout never sees or clobbers another tool's values.
+_settings: ContextVar[Dict[str, str]] = ContextVar("glaido_tool_settings", default={})
+
+
+def get_setting(name: str) -> Optional[str]:
+    """A run setting: the value handed to this thread, else the environment's."""
+    value = _settings.get().get(name)
+    return value if value is not None else os.environ.get(name)
+
+
+@contextmanager
+def tool_settings(values: Dict[str, str]):
+    """Apply settings to get_setting() calls made by this thread."""
+    token = _settings.set({**_settings.get(), **values})
+    try:
+        yield
+    finally:
+        _settings.reset(token)
+
+
+# Environment variable naming the workspace a tool inspects
+# (verification_orchestrator.py WORKSPACE_ENV); unset means this tree
+WORKSPACE_ENV = "GLAIDO_WORKSPACE_ROOT"
+
+
+def get_workspace_root() -> Path:
+    """Workspace under verification: GLAIDO_WORKSPACE_ROOT, else this tree."""
+    override = get_setting(WORKSPACE_ENV)
+    return Path(override).resolve() if override else Path(__file__).resolve().parents[2]
+
+
+def workspace_key(workspace: Path) -> str:
+    """Stable file name stem for per-workspace state kept in the tools' tree."""
+    return hashlib.blake2b(os.fsencode(Path(workspace).resolve()), digest_size=8).hexdigest()
+
+
+# Environment variable capping how many violations a scanner reports
+# (verification_orchestrator.py --max-violations); unset means no cap
+MAX_VIOLATIONS_ENV = "GLAIDO_MAX_VIOLATIONS"
+
+
+def get_max_violations() -> Optional[int]:
+    """Violation cap for this run, or None when unbounded."""
+    try:
+        limit = int(get_setting(MAX_VIOLATIONS_ENV) or "")
+    except ValueError:
+        return None
+    return limit if limit > 0 else None
+
+
+class ScanProgress:
+    """Units of work (files) a violation stream has finished, out of total."""
+
+    def __init__(self, total: int):
+        self.total = total
+        self.scanned = 0
+
+
+def collect_violations(stream: Iterator[dict],
+                       limit: Optional[int] = None) -> Tuple[List[dict], Dict[str, Any]]:
+    """
+    Drain a violation generator, closing it (and so ending the scan) once
+    `limit` violations have been collected.
+
+    Returns (violations, totals). totals["total"] is exact when the stream
+    ran to completion; after an early stop it is only a lower bound (the
+    violations found so far) and totals["exact"] is False.
+    """
+    violations = []
+    for violation in stream:
+        violations.append(violation)
+        if limit is not None and len(violations) >= limit:
+            stream.close()
+            return violations, {"reported": len(violations), "total": len(violations), "exact": False}
+    return violations, {"reported": len(violations), "total": len(violations), "exact": True}
+
+
+def describe_total(totals: Dict[str, Any], noun: str) -> str:
+    """'3 broken links detected', or a lower bound when the scan stopped early."""
+    if totals["exact"]:
+        return f"{totals['total']} {noun} detected"
+    return f"at least {totals['total']} {noun} detected (scan stopped at the violation cap)"
@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+Tool: Code Reference Check
+Purpose: Backticked code references in architecture docs must exist
+Category: core
+
+Every inline code span in architecture/**/*.md that names code is looked
+up in an inverted index of the workspace's Python modules:
+
+- module paths (`tools/core/validator.py`, `display/formatter.py`): a
+  workspace .py file with that path or path suffix
+- calls (`run_check()`, `formatter.lime()`): a top-level function, class
+  or class member, or a builtin
+- dotted names rooted in a workspace package, module or class
+  (`navigation.orchestrator.result_cache`, `FileSummary.symbols`)
+- bare identifiers that look like code, snake_case with an underscore or
+  CamelCase (`scope_to_changes`, `ReferenceIndex`): a top-level name or
+  class member, or a builtin
+
+Other bare words and bare file names are not checked. Spans rooted in
+the standard library are skipped, as are spans marked `(future)` right
+before or after them and those listed in code_reference_exemptions.json;
+JSON keys and category names that look like code go there too.
+
+The index (each module's symbols and each document's references, with
+the (mtime_ns, size) they were read at) is persisted under the tools' own
+.glaido/code_reference_index/, one file per verified workspace; a run
+re-reads only changed files.
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import builtins
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+sys.path.append(str(Path(__file__).parent))
+import parse_cache
+from anchor_index import FENCE
+from import_graph import IGNORED_PREFIXES, module_name
+from workspace_index import get_index
+from base_tool_contract import ScanProgress, collect_violations, describe_total, get_max_violations, get_workspace_root, workspace_key
+
+INDEX_FORMAT_VERSION = 2
+EXEMPTIONS_FILE = Path(__file__).parent / "code_reference_exemptions.json"
+
+CODE_SPAN = re.compile(r"`([^`\n]+)`")
+PATH_REFERENCE = re.compile(r"(?:\./)?[\w.-]+(?:/[\w.-]+)+\.py")
+CALL_REFERENCE = re.compile(r"[A-Za-z_]\w*(?:\.[A-Za-z_]\w*)*\(\)")
+DOTTED_REFERENCE = re.compile(r"[A-Za-z_]\w*(?:\.[A-Za-z_]\w*)+")
+NAME_REFERENCE = re.compile(r"_?[a-z][a-z0-9]*(?:_[a-z0-9]+)+|[A-Z][a-z0-9]+(?:[A-Z][a-z0-9]+)+")
+# `cli/display/banner.py` (future), or (future) `cli/display/banner.py`
+PLANNED_AFTER = re.compile(r"\s*\(future\)", re.IGNORECASE)
+PLANNED_BEFORE = re.compile(r"\(future\)\s*\Z", re.IGNORECASE)
+
+# `registry.json` is a file name, not the attribute json of module registry
+FILE_EXTENSIONS = {"bak", "cfg", "csv", "html", "ini", "js", "json", "lock", "log", "md", "py", "sh", "tmp", "toml", "txt", "yaml", "yml"}
+
+def get_index_path(workspace: Path) -> Path:
+    """Index file for a workspace, under the tools' own tree."""
+    return Path(__file__).resolve().parents[2] / ".glaido" / "code_reference_index" / f"{workspace_key(workspace)}.json"
+
+def classify(span: str) -> Optional[str]:
+    """Kind of code reference a code span is ("path", "call", "dotted", "name"), if any."""
+    if PATH_REFERENCE.fullmatch(span):
+        return "path"
+    if CALL_REFERENCE.fullmatch(span):
+        return "call"
+    if DOTTED_REFERENCE.fullmatch(span) and span.rpartition(".")[2] not in FILE_EXTENSIONS:
+        return "dotted"
+    if NAME_REFERENCE.fullmatch(span):
+        return "name"
+    return None
+
+def is_planned(line: str, match: "re.Match") -> bool:
+    """Whether a code span is marked (future) right before or after it."""
+    return bool(PLANNED_AFTER.match(line, match.end()) or PLANNED_BEFORE.search(line, 0, match.start()))
+
+def extract_references(content: str) -> List[list]:
+    """[span, kind, line, planned] for each code reference outside fenced blocks."""
+    references = []
+    fence = None
+    for number, line in enumerate(content.split("\n"), 1):
+        opening = FENCE.match(line)
+        if fence is not None:
+            if opening and opening.group(1)[0] == fence[0] and len(opening.group(1)) >= len(fence):
+                fence = None
+            continue
+        if opening:
+            fence = opening.group(1)
+            continue
+        for match in CODE_SPAN.finditer(line):
+            span = match.group(1).strip()
+            kind = classify(span)
+            if kind is not None:
+                references.append([span, kind, number, is_planned(line, match)])
+    return references
+
+class ReferenceIndex:
+    """Symbols of a workspace's modules and code references of its architecture docs."""
+
+    def __init__(self, workspace: Path, modules: Dict[str, dict] = None, documents: Dict[str, dict] = None):
+        self.workspace = Path(workspace)
+        # path -> {"mtime_ns", "size", "symbols"}
+        self.modules: Dict[str, dict] = modules or {}
+        # path -> {"mtime_ns", "size", "references"}
+        self.documents: Dict[str, dict] = documents or {}
+        self._invert()
+
+    @classmethod
+    def load(cls, workspace: Path) -> "ReferenceIndex":
+        """Stored index for workspace, or an empty one if missing or incompatible."""
+        try:
+            with open(get_index_path(workspace), "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return cls(workspace)
+        if not isinstance(data, dict) or data.get("version") != INDEX_FORMAT_VERSION:
+            return cls(workspace)
+        return cls(workspace, data.get("modules"), data.get("documents"))
+
+    def save(self):
+        path = get_index_path(self.workspace)
+        data = {"version": INDEX_FORMAT_VERSION, "modules": self.modules, "documents": self.documents}
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            partial = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            with open(partial, "w", encoding="utf-8") as f:
+                json.dump(data, f, sort_keys=True)
+            os.replace(partial, path)
+        except OSError:
+            pass  # Rebuilt from the parse cache next time
+
+    def update(self) -> Dict[str, int]:
+        """
+        Re-read modules and documents whose stat changed, drop deleted ones.
+
+        Returns:
+            dict: Counts of changed and removed files
+        """
+        index = get_index(self.workspace)
+        current_modules = {
+            entry.path: entry for entry in index.files(suffix=".py")
+            if not entry.path.startswith(IGNORED_PREFIXES)
+        }
+        current_documents = {entry.path: entry for entry in index.files("architecture", suffix=".md")}
+
+        changed = removed = 0
+        for records, current, read in (
+            (self.modules, current_modules, self._read_module),
+            (self.documents, current_documents, self._read_document),
+        ):
+            for path in [path for path in records if path not in current]:
+                del records[path]
+                removed += 1
+            for path, entry in current.items():
+                record = records.get(path)
+                if record is not None and record["mtime_ns"] == entry.mtime_ns and record["size"] == entry.size:
+                    continue
+                records[path] = dict(read(path), mtime_ns=entry.mtime_ns, size=entry.size)
+                changed += 1
+        parse_cache.get_cache().flush()
+
+        if changed or removed:
+            self._invert()
+        return {"changed": changed, "removed": removed}
+
+    def _read_module(self, path: str) -> dict:
+        return {"symbols": list(parse_cache.cached_summary(self.workspace / path).symbols)}
+
+    def _read_document(self, path: str) -> dict:
+        try:
+            with open(self.workspace / path, "r", encoding="utf-8") as f:
+                return {"references": extract_references(f.read())}
+        except (OSError, UnicodeDecodeError):
+            return {"references": []}
+
+    def _invert(self):
+        """Lookup tables from the per-file records."""
+        self.path_suffixes = set()      # "c.py", "b/c.py", "a/b/c.py" for a/b/c.py
+        self.names = set()              # Top-level names and member names
+        self.symbols = {}               # module -> set of its symbols ("f", "Class.member")
+        self.stems = {}                 # module file stem -> [modules]
+        self.packages = set()           # Dotted prefixes of every module
+        for path, record in self.modules.items():
+            parts = path.split("/")
+            for i in range(len(parts)):
+                self.path_suffixes.add("/".join(parts[i:]))
+            module = module_name(path)
+            symbols = set(record["symbols"])
+            self.symbols[module] = symbols
+            self.names.update(symbol.rpartition(".")[2] for symbol in symbols)
+            self.stems.setdefault(module.rpartition(".")[2], []).append(module)
+            dotted = module.split(".")
+            for i in range(1, len(dotted)):
+                self.packages.add(".".join(dotted[:i]))
+        self.qualified = {symbol for symbols in self.symbols.values() for symbol in symbols if "." in symbol}
+        self.classes = {symbol.partition(".")[0] for symbol in self.qualified}
+
+    def resolves(self, span: str, kind: str) -> bool:
+        """Whether a reference names something in the workspace (or outside it entirely)."""
+        if kind == "path":
+            return span.removeprefix("./") in self.path_suffixes
+
+        dotted = span[:-2] if kind == "call" else span
+        parts = dotted.split(".")
+        if len(parts) == 1:
+            return parts[0] in self.names or hasattr(builtins, parts[0])
+
+        head = parts[0]
+        # Fully qualified: package.module[.symbol[.member]]
+        for depth in range(len(parts), 0, -1):
+            module = ".".join(parts[:depth])
+            if module in self.symbols:
+                rest = ".".join(parts[depth:])
+                return not rest or rest in self.symbols[module]
+        if dotted in self.packages:
+            return True
+        if head in self.packages:
+            return False  # Inside a workspace package, but no such module
+        # Rooted in a module imported by its file name
+        if head in self.stems:
+            rest = ".".join(parts[1:])
+            return any(rest in self.symbols[module] for module in self.stems[head])
+        # Rooted in a class
+        if head in self.classes:
+            return ".".join(parts[:2]) in self.qualified
+        # Standard library, locals (`self.x`, `report.status`): not ours to check
+        return True
+
+def load_exemptions(path: Path = EXEMPTIONS_FILE) -> set:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return set()
+    return {entry["reference"] for entry in data.get("references", [])}
+
+def iter_violations(index: ReferenceIndex, documents: list, exemptions: set, progress=None):
+    """Yield unresolved references document by document."""
+    for path in documents:
+        for span, kind, line, planned in index.documents[path]["references"]:
+            if planned or span in exemptions or index.resolves(span, kind):
+                continue
+            yield {
+                "file": path,
+                "line": line,
+                "reference": span,
+                "kind": kind
+            }
+        if progress is not None:
+            progress.scanned += 1
+
+def run_check():
+    start_time = time.perf_counter_ns()
+    workspace = get_workspace_root()
+
+    index = ReferenceIndex.load(workspace)
+    counts = index.update()
+    if counts["changed"] or counts["removed"]:
+        index.save()
+
+    documents = sorted(index.documents)
+    progress = ScanProgress(len(documents))
+    stream = iter_violations(index, documents, load_exemptions(), progress)
+    violations, totals = collect_violations(stream, get_max_violations())
+
+    duration_ms = (time.perf_counter_ns() - start_time) // 1_000_000
+    status = "ready" if not violations else "error"
+    message = "All code references resolve" if not violations else describe_total(totals, "stale code references")
+
+    report = {
+        "category": "code_references",
+        "status": status,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "message": message,
+        "actionable": bool(violations),
+        "remediation": "Update backticked references in architecture documentation to the current code, or mark planned components (future)" if violations else None,
+        "results": {
+            "violations": violations,
+            "violation_totals": totals
+        },
+        "metrics": {
+            "duration_ms": duration_ms,
+            "modules_indexed": len(index.modules),
+            "documents_indexed": len(index.documents),
+            "references": sum(len(record["references"]) for record in index.documents.values()),
+            "files_reread": counts["changed"]
+        }
+    }
+
+    return report
+
+if __name__ == "__main__":
+    try:
+        report = run_check()
+        print(json.dumps(report, sort_keys=True))
+        sys.exit(0 if report["status"] == "ready" else 1)
+    except Exception as e:
+        fallback = {
+            "category": "code_references",
+            "status": "error",
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "message": "Critical failure in code reference check",
+            "actionable": True,
+            "remediation": "Check code_reference_check.py logic",
+            "results": {"error": str(e)}
+        }
+        print(json.dumps(fallback, sort_keys=True))
+        sys.exit(1)
@@ -11,6 +11,9 @@ import time
 from datetime import datetime, timezone
 from pathlib import Path
 
+sys.path.append(str(Path(__file__).parent))
+from base_tool_contract import get_workspace_root
+
 def _get_timestamp():
     """Return ISO 8601 timestamp with timezone"""
     return datetime.now(timezone.utc).astimezone().isoformat()
@@ -46,11 +49,6 @@ CORE_FILES = [
 ]
 
 
-def get_workspace_root():
-    """Get workspace root directory"""
-    return Path(__file__).resolve().parents[2]
-
-
 def check_directories():
     """Verify all required directories exist"""
     workspace = get_workspace_root()
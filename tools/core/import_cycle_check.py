@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+import sys
+import json
+import time
+from collections import deque
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent))
+from import_graph import get_import_graph
+from base_tool_contract import get_workspace_root
+
+# Layers whose modules are checked for cycles
+CYCLE_SCOPE = ("tools/", "navigation/", "cli/")
+
+def strongly_connected(nodes: list, successors: dict) -> list:
+    """
+    Tarjan's strongly connected components, O(V + E), without recursion.
+
+    Nodes are visited in the given order and successors in list order, so
+    the result is deterministic for sorted input. Components come out in
+    reverse topological order.
+    """
+    index = {}
+    lowlink = {}
+    stack = []
+    on_stack = set()
+    components = []
+
+    for root in nodes:
+        if root in index:
+            continue
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(successors[root]))]
+
+        while work:
+            node, children = work[-1]
+            for child in children:
+                if child not in index:
+                    index[child] = lowlink[child] = len(index)
+                    stack.append(child)
+                    on_stack.add(child)
+                    work.append((child, iter(successors[child])))
+                    break
+                if child in on_stack:
+                    lowlink[node] = min(lowlink[node], index[child])
+            else:
+                # Every successor of node is done
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+
+    return components
+
+def shortest_cycle(start: str, members: set, successors: dict) -> list:
+    """Shortest import chain from start back to itself inside one component."""
+    previous = {}
+    queue = deque([start])
+    while queue:
+        node = queue.popleft()
+        for child in successors[node]:
+            if child not in members:
+                continue
+            if child == start:
+                chain = [start]
+                while node != start:
+                    chain.append(node)
+                    node = previous[node]
+                chain.append(start)
+                return [start] + chain[1:-1][::-1] + [start]
+            if child not in previous:
+                previous[child] = node
+                queue.append(child)
+    return [start]
+
+def find_cycles(graph, deferred: bool) -> list:
+    """
+    Import cycles among in-scope modules, sorted by their first member.
+
+    With deferred=False only imports executed at import time form edges;
+    a cycle closed by an import inside a function never runs on load.
+    """
+    nodes = sorted(m for m, path in graph.modules.items() if path.startswith(CYCLE_SCOPE))
+    in_scope = set(nodes)
+    successors = {
+        node: [target for target in graph.imports_of(node, deferred=deferred) if target in in_scope]
+        for node in nodes
+    }
+
+    cycles = []
+    for component in strongly_connected(nodes, successors):
+        if len(component) < 2:
+            continue  # The graph has no self edges
+        members = sorted(component)
+        chain = shortest_cycle(members[0], set(members), successors)
+        hops = []
+        for source, target in zip(chain, chain[1:]):
+            line = min(
+                line for edge_target, line, is_deferred in graph.edges[source]
+                if edge_target == target and (deferred or not is_deferred)
+            )
+            hops.append({"file": graph.modules[source], "line": line, "import": target})
+        cycles.append({"modules": members, "cycle": chain, "imports": hops})
+    return sorted(cycles, key=lambda cycle: cycle["modules"])
+
+def run_check():
+    start_time = time.perf_counter_ns()
+    workspace = get_workspace_root()
+    graph = get_import_graph(workspace)
+
+    violations = find_cycles(graph, deferred=False)
+    # Cycles that only close through function-level imports: the usual way
+    # to break a cycle, reported for information
+    deferred_cycles = [
+        cycle for cycle in find_cycles(graph, deferred=True)
+        if cycle["modules"] not in [v["modules"] for v in violations]
+    ]
+
+    duration_ms = (time.perf_counter_ns() - start_time) // 1_000_000
+    status = "ready" if not violations else "error"
+    message = "No import cycles" if not violations else f"{len(violations)} import cycles detected"
+
+    report = {
+        "category": "import_cycles",
+        "status": status,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "message": message,
+        "actionable": bool(violations),
+        "remediation": "Break each cycle by moving the shared code into a lower module or deferring one import into the function that needs it" if violations else None,
+        "results": {
+            "violations": violations,
+            "deferred_cycles": deferred_cycles
+        },
+        "metrics": {
+            "duration_ms": duration_ms,
+            "modules": len(graph.modules),
+            "edges": sum(len(targets) for targets in graph.edges.values())
+        }
+    }
+
+    return report
+
+if __name__ == "__main__":
+    try:
+        report = run_check()
+        print(json.dumps(report, sort_keys=True))
+        sys.exit(0 if report["status"] == "ready" else 1)
+    except Exception as e:
+        fallback = {
+            "category": "import_cycles",
+            "status": "error",
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "message": "Critical failure in import cycle check",
+            "actionable": True,
+            "remediation": "Check import_cycle_check.py logic",
+            "results": {"error": str(e)}
+        }
+        print(json.dumps(fallback, sort_keys=True))
+        sys.exit(1)
@@ -0,0 +1,307 @@
+"""
+Tool: Import Graph
+Purpose: Module dependency graph shared by the import analyses
+Category: core
+
+Whole-workspace module dependency graph: one node per Python module and
+one edge per `import` / `from ... import` that resolves to a workspace
+module. Imports that resolve nowhere in the workspace (stdlib, third
+party) are kept per module as external names.
+
+Bare names are resolved the way the interpreter finds them at runtime:
+against the importing file's own directory (sys.path[0] for scripts), the
+workspace root, and every directory the file adds with sys.path.append or
+sys.path.insert, evaluated statically by parse_cache.py.
+
+The graph is persisted under the tools' own .glaido/import_graph/, one
+file per verified workspace, together with each file's (mtime_ns, size)
+and raw imports. update() re-reads only files
+whose stat changed and re-resolves their edges; adding or removing a
+module re-resolves every file, since a new module can capture a bare name
+that another file imports.
+"""
+
+import os
+import sys
+import json
+import posixpath
+from collections import deque
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+sys.path.append(str(Path(__file__).parent))
+import parse_cache
+from workspace_index import get_index
+from base_tool_contract import get_workspace_root, workspace_key
+
+GRAPH_FORMAT_VERSION = 3
+
+# Scratch space, never part of the code base
+IGNORED_PREFIXES = (".tmp/",)
+
+
+def get_graph_path(workspace: Path) -> Path:
+    """Graph file for a workspace, under the tools' own tree."""
+    return Path(__file__).resolve().parents[2] / ".glaido" / "import_graph" / f"{workspace_key(workspace)}.json"
+
+
+def module_name(path: str) -> str:
+    """Dotted module name of a workspace-relative .py path."""
+    parts = path[:-len(".py")].split("/")
+    if parts[-1] == "__init__" and len(parts) > 1:
+        parts.pop()
+    return ".".join(parts)
+
+
+class ImportGraph:
+    """Module graph of one workspace; nodes are dotted names relative to its root."""
+
+    def __init__(self, workspace: Path, files: Dict[str, dict] = None,
+                 edges: Dict[str, list] = None, external: Dict[str, list] = None):
+        self.workspace = Path(workspace)
+        # path -> {"mtime_ns", "size", "search_paths", "imports", "parse_error", "main_guard"}
+        self.files: Dict[str, dict] = files or {}
+        # module -> sorted [[target module, line, deferred], ...]
+        self.edges: Dict[str, list] = edges or {}
+        # module -> sorted unresolved top-level names
+        self.external: Dict[str, list] = external or {}
+        self._index_modules()
+
+    def _index_modules(self):
+        self.modules: Dict[str, str] = {module_name(path): path for path in sorted(self.files)}
+        self._importers: Optional[Dict[str, Set[str]]] = None
+
+    # -- persistence ---------------------------------------------------------
+
+    @classmethod
+    def load(cls, workspace: Path) -> "ImportGraph":
+        """Stored graph for workspace, or an empty one if missing or incompatible."""
+        try:
+            with open(get_graph_path(workspace), "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return cls(workspace)
+        if not isinstance(data, dict) or data.get("version") != GRAPH_FORMAT_VERSION:
+            return cls(workspace)
+        return cls(workspace, data.get("files"), data.get("edges"), data.get("external"))
+
+    def save(self):
+        path = get_graph_path(self.workspace)
+        data = {
+            "version": GRAPH_FORMAT_VERSION,
+            "files": self.files,
+            "edges": self.edges,
+            "external": self.external,
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            partial = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            with open(partial, "w", encoding="utf-8") as f:
+                json.dump(data, f, sort_keys=True)
+            os.replace(partial, path)
+        except OSError:
+            pass  # The graph is rebuilt from the parse cache next time
+
+    # -- incremental update --------------------------------------------------
+
+    def update(self) -> Dict[str, int]:
+        """
+        Bring the graph in line with the workspace.
+
+        Returns:
+            dict: Counts of changed (added or modified), removed and
+            re-resolved files
+        """
+        current = {
+            entry.path: entry
+            for entry in get_index(self.workspace).files(suffix=".py")
+            if not entry.path.startswith(IGNORED_PREFIXES)
+        }
+        removed = [path for path in self.files if path not in current]
+        added = [path for path in current if path not in self.files]
+        changed = []
+        for path, entry in current.items():
+            record = self.files.get(path)
+            if record is not None and record["mtime_ns"] == entry.mtime_ns and record["size"] == entry.size:
+                continue
+            summary = parse_cache.cached_summary(self.workspace / path)
+            self.files[path] = {
+                "mtime_ns": entry.mtime_ns,
+                "size": entry.size,
+                "search_paths": list(summary.search_paths),
+                "imports": [list(record) for record in summary.imports],
+                "parse_error": summary.error is not None,
+                "main_guard": summary.main_guard,
+            }
+            changed.append(path)
+        parse_cache.get_cache().flush()
+
+        for path in removed:
+            del self.files[path]
+            self.edges.pop(module_name(path), None)
+            self.external.pop(module_name(path), None)
+
+        if added or removed:
+            self._index_modules()
+            to_resolve = list(self.files)
+        else:
+            to_resolve = changed
+        for path in to_resolve:
+            self._resolve(path)
+        if to_resolve:
+            self._importers = None
+
+        return {"changed": len(changed), "removed": len(removed), "resolved": len(to_resolve)}
+
+    # -- resolution ----------------------------------------------------------
+
+    def _roots(self, path: str) -> List[str]:
+        """Directories a bare name is looked up in, workspace-relative ("" is the root)."""
+        directory = posixpath.dirname(path)
+        roots = {directory: None, "": None}
+        for added in self.files[path]["search_paths"]:
+            root = posixpath.normpath(posixpath.join(directory, added))
+            if root == ".":
+                root = ""
+            if not root.startswith(".."):
+                roots.setdefault(root)
+        return list(roots)
+
+    def _find(self, roots: Iterable[str], dotted: str) -> Optional[str]:
+        relative = dotted.replace(".", "/")
+        for root in roots:
+            base = f"{root}/{relative}" if root else relative
+            for candidate in (f"{base}.py", f"{base}/__init__.py"):
+                if candidate in self.files:
+                    return module_name(candidate)
+        return None
+
+    def _find_deepest(self, roots: List[str], dotted: str) -> Optional[str]:
+        """'import a.b.c' binds a, a.b and a.b.c; the edge goes to the deepest that exists."""
+        parts = dotted.split(".")
+        for depth in range(len(parts), 0, -1):
+            found = self._find(roots, ".".join(parts[:depth]))
+            if found is not None:
+                return found
+        return None
+
+    def _resolve(self, path: str):
+        source = module_name(path)
+        edges = set()
+        external = set()
+        roots = self._roots(path)
+
+        for module, line, level, names, deferred in self.files[path]["imports"]:
+            if level:
+                # Relative import: anchored at the importing package, never at sys.path
+                anchor = posixpath.dirname(path)
+                for _ in range(level - 1):
+                    anchor = posixpath.dirname(anchor)
+                lookup_roots = [anchor]
+            else:
+                lookup_roots = roots
+
+            targets = []
+            needs_module = names is None
+            if names is not None:
+                # "from pkg import mod" depends on the submodule; other names on pkg itself
+                for name in names:
+                    dotted = f"{module}.{name}" if module else name
+                    found = self._find(lookup_roots, dotted) if name != "*" else None
+                    if found is not None:
+                        targets.append(found)
+                    else:
+                        needs_module = True
+            if needs_module and module:
+                found = (self._find(lookup_roots, module) if names is not None
+                         else self._find_deepest(lookup_roots, module))
+                if found is not None:
+                    targets.append(found)
+                elif not targets and not level:
+                    external.add(module.split(".")[0])
+
+            for target in targets:
+                if target != source:
+                    edges.add((target, line, deferred))
+
+        if edges:
+            self.edges[source] = sorted(list(edge) for edge in edges)
+        else:
+            self.edges.pop(source, None)
+        if external:
+            self.external[source] = sorted(external)
+        else:
+            self.external.pop(source, None)
+
+    # -- queries -------------------------------------------------------------
+
+    def imports_of(self, module: str, deferred: bool = True) -> List[str]:
+        """
+        Workspace modules `module` imports directly, sorted.
+
+        With deferred=False only imports executed when the module itself is
+        imported count; imports inside functions are left out.
+        """
+        return sorted({
+            target for target, _, is_deferred in self.edges.get(module, [])
+            if deferred or not is_deferred
+        })
+
+    def importers_of(self, module: str) -> List[str]:
+        """Workspace modules importing `module` directly, sorted."""
+        if self._importers is None:
+            self._importers = {}
+            for source, targets in self.edges.items():
+                for target, _, _ in targets:
+                    self._importers.setdefault(target, set()).add(source)
+        return sorted(self._importers.get(module, ()))
+
+    def reachable_from(self, roots: Iterable[str]) -> Set[str]:
+        """
+        Every module reachable from roots (inclusive) along import edges,
+        breadth first. Importing a submodule runs its parent packages'
+        __init__ too, so those count as reached with it.
+        """
+        seen = set()
+        queue = deque()
+
+        def reach(module):
+            while module and module not in seen:
+                if module in self.modules:
+                    seen.add(module)
+                    queue.append(module)
+                module = module.rpartition(".")[0]
+
+        for root in sorted(roots):
+            reach(root)
+        while queue:
+            for target in self.imports_of(queue.popleft()):
+                reach(target)
+        return seen
+
+    def scripts(self) -> List[str]:
+        """Modules with a `if __name__ == "__main__":` guard, sorted."""
+        return sorted(module_name(path) for path, record in self.files.items() if record["main_guard"])
+
+    def module_for_path(self, path: str) -> Optional[str]:
+        """Module name for a workspace-relative path, if it is in the graph."""
+        return module_name(path) if path in self.files else None
+
+
+def get_import_graph(workspace: Path = None) -> ImportGraph:
+    """Load the stored graph, update it for changed files and persist it."""
+    workspace = Path(workspace).resolve() if workspace is not None else get_workspace_root()
+    graph = ImportGraph.load(workspace)
+    counts = graph.update()
+    if counts["changed"] or counts["removed"]:
+        graph.save()
+    return graph
+
+
+if __name__ == "__main__":
+    graph = get_import_graph()
+    print(json.dumps({
+        "modules": len(graph.modules),
+        "edges": sum(len(targets) for targets in graph.edges.values()),
+        "graph": {module: graph.imports_of(module) for module in sorted(graph.modules)}
+    }, indent=2, sort_keys=True))
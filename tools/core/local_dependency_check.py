@@ -11,6 +11,9 @@ import time
 from datetime import datetime, timezone
 from pathlib import Path
 
+sys.path.append(str(Path(__file__).parent))
+from base_tool_contract import get_workspace_root
+
 def _get_timestamp():
     """Return ISO 8601 timestamp with timezone"""
     return datetime.now(timezone.utc).astimezone().isoformat()
@@ -64,7 +67,7 @@ def check_required_modules():
 
 def check_filesystem_writable():
     """Test write permissions to workspace"""
-    workspace_root = Path(__file__).resolve().parents[2]
+    workspace_root = get_workspace_root()
     test_file = workspace_root / '.tmp' / 'dependency_test.txt'
     
     try:
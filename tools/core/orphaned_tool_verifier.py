@@ -2,29 +2,44 @@
 import sys
 import json
 import time
-import ast
 from datetime import datetime, timezone
 from pathlib import Path
 
-def get_workspace_root() -> Path:
-    return Path(__file__).resolve().parents[2]
+sys.path.append(str(Path(__file__).parent))
+import ast_store
+from import_graph import get_import_graph
+from workspace_index import get_index
+from base_tool_contract import get_workspace_root
+
+# Modules started directly; with every registered tool and every module
+# that has a __main__ guard, the roots of the reachability analysis
+ENTRY_POINTS = ("cli/main.py", "navigation/orchestrator/verification_orchestrator.py")
+
+# Layers checked for modules nothing reaches
+DEAD_MODULE_SCOPE = ("tools/", "navigation/", "cli/")
+
+def get_registered_paths(orchestrator_path: Path) -> set:
+    """Workspace-relative .py paths named by string literals in the orchestrator."""
+    with ast_store.consumer("orphaned_tools", [orchestrator_path]) as store:
+        strings = store.summary(orchestrator_path).strings
+    return {value for value in strings if value.endswith(".py")}
 
 def get_registered_tools(orchestrator_path: Path) -> set:
-    registered = set()
-    try:
-        with open(orchestrator_path, 'r', encoding='utf-8') as f:
-            tree = ast.parse(f.read())
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Constant) and isinstance(node.value, str):
-                if node.value.endswith(".py"):
-                    registered.add(node.value.split("/")[-1])
-            # Fallback for Python versions prior to 3.8
-            elif isinstance(node, getattr(ast, 'Str', type(None))):
-                if node.s.endswith(".py"):
-                    registered.add(node.s.split("/")[-1])
-    except Exception:
-        pass
-    return registered
+    return {path.split("/")[-1] for path in get_registered_paths(orchestrator_path)}
+
+def find_reachable(graph, registered_paths: set) -> tuple:
+    """
+    Breadth-first reachability over the import graph.
+
+    Returns:
+        (imported, reached): modules reached from the entry points and
+        registered tools, and those plus everything reached from modules
+        that can run as scripts
+    """
+    roots = [graph.module_for_path(path) for path in (*ENTRY_POINTS, *sorted(registered_paths))]
+    imported = graph.reachable_from(root for root in roots if root)
+    reached = imported | graph.reachable_from(graph.scripts())
+    return imported, reached
 
 def run_check():
     start_time = time.perf_counter_ns()
@@ -34,26 +49,56 @@ def run_check():
     tools_dir = workspace / "tools" / "core"
     
     violations = []
+    dead_modules = []
+    reached = set()
     
     if orchestrator_path.exists() and tools_dir.exists():
-        actual_tools = {p.name for p in tools_dir.glob("*.py") if p.name != "__init__.py"}
-        registered_tools = get_registered_tools(orchestrator_path)
+        actual_tools = {
+            entry.path.rsplit("/", 1)[-1] for entry in get_index(workspace).children("tools/core")
+            if not entry.is_dir and entry.path.endswith(".py") and not entry.path.endswith("/__init__.py")
+        }
+        registered_paths = get_registered_paths(orchestrator_path)
+        registered_tools = {path.split("/")[-1] for path in registered_paths}
+
+        graph = get_import_graph(workspace)
+        imported, reached = find_reachable(graph, registered_paths)
+
+        # Libraries live tools import need no registration
+        libraries = {
+            Path(graph.modules[module]).name for module in imported
+            if graph.modules[module].startswith("tools/core/")
+        }
         
-        # Tools permitted to exist without explicit verification orchestration:
-        # e.g., validator.py (used as a stub import)
-        whitelist = {"validator.py", "diagnostics.py", "json_contract_validator.py", "base_tool_contract.py"}
+        # Tools permitted to exist without explicit verification orchestration
+        # or an importer: json_contract_validator.py is run by hand
+        whitelist = {"json_contract_validator.py"}
         
-        orphans = actual_tools - registered_tools - whitelist
+        orphans = actual_tools - registered_tools - libraries - whitelist
         
-        for orphan in orphans:
+        for orphan in sorted(orphans):
             violations.append({
                 "file": orphan,
                 "reason": "Present in tools/core/ but not registered in verification_orchestrator.py list"
             })
+
+        # An orphaned tool is reported once, as an orphan
+        orphan_paths = {f"tools/core/{orphan}" for orphan in orphans}
+        for module, path in sorted(graph.modules.items()):
+            if path.startswith(DEAD_MODULE_SCOPE) and module not in reached and path not in orphan_paths:
+                dead_modules.append({
+                    "file": path,
+                    "reason": "Not imported from any entry point, registered tool or __main__ module"
+                })
+        violations.extend(dead_modules)
             
     duration_ms = (time.perf_counter_ns() - start_time) // 1_000_000
     status = "ready" if not violations else "error"
-    message = "All tools registered" if not violations else f"{len(violations)} orphaned tools detected"
+    if not violations:
+        message = "All tools registered"
+    elif not dead_modules:
+        message = f"{len(violations)} orphaned tools detected"
+    else:
+        message = f"{len(violations) - len(dead_modules)} orphaned tools and {len(dead_modules)} unreachable modules detected"
     
     report = {
         "category": "orphaned_tools",
@@ -61,12 +106,13 @@ def run_check():
         "timestamp": datetime.now(timezone.utc).isoformat(),
         "message": message,
         "actionable": bool(violations),
-        "remediation": "Add orphaned tools to verification_orchestrator.py or remove them to maintain integrity" if violations else None,
+        "remediation": "Add orphaned tools to verification_orchestrator.py or remove them and any unreachable modules to maintain integrity" if violations else None,
         "results": {
             "violations": violations
         },
         "metrics": {
-            "duration_ms": duration_ms
+            "duration_ms": duration_ms,
+            "modules_reached": len(reached)
         }
     }
     
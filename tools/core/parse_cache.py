@@ -0,0 +1,395 @@
+"""
+Tool: Parse Cache
+Purpose: Persist per-file parse facts so unchanged files are never re-parsed
+Category: core
+
+What the static analysis tools need from a Python file is small: whether
+it parses (and where it does not), its imports, the directories it adds
+to sys.path, its top-level string constants and the symbols it defines.
+summarize() extracts those facts into a FileSummary; ParseCache stores
+them under .glaido/parse_cache/, keyed by absolute path and validated
+against (mtime_ns, size).
+
+Each verified workspace gets its own file per interpreter version, since
+both ast and marshal may change between releases. Entries for files that
+no longer exist are dropped whenever the file is rewritten. Entries are marshalled plain tuples, which
+load several times faster than the files they describe could be parsed.
+
+Files modified within RACY_WINDOW_NS of being summarized are not
+persisted: a second edit in the same mtime tick that keeps the size
+would otherwise go unnoticed.
+"""
+
+import os
+import ast
+import sys
+import time
+import marshal
+import posixpath
+import threading
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional, Tuple
+
+sys.path.append(str(Path(__file__).parent))
+from base_tool_contract import get_workspace_root, workspace_key
+
+CACHE_FORMAT_VERSION = 4
+RACY_WINDOW_NS = 2_000_000_000
+
+
+class ParseError(NamedTuple):
+    kind: str               # "syntax", "decode" or "other"
+    line: Optional[int]
+    column: Optional[int]
+    message: str
+    text: Optional[str]
+
+
+class ImportRecord(NamedTuple):
+    module: str             # "" for "from . import x"
+    line: int
+    level: Optional[int]    # None for "import x"; relative depth for "from"
+    names: Optional[Tuple[str, ...]]  # Imported names of a "from" import
+    deferred: bool = False  # Not run on import: inside a function or the __main__ guard
+
+
+class FileSummary(NamedTuple):
+    error: Optional[ParseError]
+    imports: Tuple[ImportRecord, ...]   # ast.walk order
+    strings: Tuple[str, ...]            # Top-level string constants, first-seen order
+    symbols: Tuple[str, ...]            # Top-level names; class members as "Class.member"
+    search_paths: Tuple[str, ...] = ()  # sys.path additions, relative to the file's directory
+    main_guard: bool = False            # Has a module-level `if __name__ == "__main__":`
+
+
+def describe_error(error: Exception) -> ParseError:
+    """Reduce a parse failure to what reports need."""
+    if isinstance(error, SyntaxError):
+        return ParseError("syntax", error.lineno, error.offset, error.msg, error.text)
+    if isinstance(error, UnicodeDecodeError):
+        return ParseError("decode", 0, 0, str(error), None)
+    return ParseError("other", 0, 0, str(error), None)
+
+
+def failed(error: Exception) -> FileSummary:
+    return FileSummary(describe_error(error), (), (), ())
+
+
+def parse_file(path: Path) -> ast.Module:
+    """Read a UTF-8 source file and parse it."""
+    with open(path, "r", encoding="utf-8") as f:
+        return ast.parse(f.read(), filename=str(path))
+
+
+def summarize_file(path: Path) -> Tuple[Optional[os.stat_result], FileSummary]:
+    """Parse one file; the stat it was read under validates a cache entry."""
+    try:
+        stat = os.stat(path)
+    except OSError as e:
+        return None, failed(e)
+    try:
+        return stat, summarize(parse_file(path))
+    except Exception as e:
+        return stat, failed(e)
+
+
+def summarize_batch(paths: list) -> list:
+    """summarize_file() for each path; the unit of work of a parallel parse."""
+    return [summarize_file(path) for path in paths]
+
+
+def _top_level_nodes(tree: ast.Module):
+    """Every node outside function and class bodies."""
+    stack = list(reversed(tree.body))
+    while stack:
+        node = stack.pop()
+        yield node
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Lambda)):
+            continue
+        stack.extend(reversed(list(ast.iter_child_nodes(node))))
+
+
+def _target_names(target):
+    if isinstance(target, ast.Name):
+        yield target.id
+    elif isinstance(target, (ast.Tuple, ast.List)):
+        for element in target.elts:
+            yield from _target_names(element)
+
+
+def _defined_names(body):
+    for node in body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            yield node.name, node
+        elif isinstance(node, ast.Assign):
+            for target in node.targets:
+                for name in _target_names(target):
+                    yield name, node
+        elif isinstance(node, ast.AnnAssign):
+            for name in _target_names(node.target):
+                yield name, node
+
+
+# Stands for the file itself while evaluating path expressions
+_FILE = "<file>"
+
+
+def _parent(path: Optional[str]) -> Optional[str]:
+    if path is None:
+        return None
+    return "." if path == _FILE else posixpath.normpath(f"{path}/..")
+
+
+def _join(path: Optional[str], *parts) -> Optional[str]:
+    if path is None or path == _FILE or not all(isinstance(part, str) for part in parts):
+        return None
+    return posixpath.normpath(posixpath.join(path, *parts))
+
+
+def _path_value(node, names: Dict[str, str]) -> Optional[str]:
+    """
+    Statically evaluate the usual sys.path expressions: Path(__file__),
+    .parent, .parents[n], .resolve(), / "dir", str(), os.path.dirname(),
+    os.path.abspath(), os.path.join(), names bound to such expressions
+    and calls to argument-less functions returning one.
+    """
+    if isinstance(node, ast.Name):
+        return _FILE if node.id == "__file__" else names.get(node.id)
+    if isinstance(node, ast.Attribute) and node.attr == "parent":
+        return _parent(_path_value(node.value, names))
+    if isinstance(node, ast.Subscript):
+        if (isinstance(node.value, ast.Attribute) and node.value.attr == "parents"
+                and isinstance(node.slice, ast.Constant) and isinstance(node.slice.value, int)):
+            path = _parent(_path_value(node.value.value, names))
+            for _ in range(node.slice.value):
+                path = _parent(path)
+            return path
+        return None
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Div):
+        if isinstance(node.right, ast.Constant):
+            return _join(_path_value(node.left, names), node.right.value)
+        return None
+    if not isinstance(node, ast.Call):
+        return None
+
+    func = node.func
+    if isinstance(func, ast.Name):
+        if func.id in ("str", "Path") and len(node.args) == 1:
+            return _path_value(node.args[0], names)
+        if not node.args:
+            return names.get(f"{func.id}()")
+        return None
+    if not isinstance(func, ast.Attribute):
+        return None
+    if func.attr in ("resolve", "absolute") and not node.args:
+        return _path_value(func.value, names)
+    if ast.unparse(func) == "pathlib.Path" and len(node.args) == 1:
+        return _path_value(node.args[0], names)
+    if ast.unparse(func.value) == "os.path" and node.args:
+        if func.attr in ("abspath", "realpath", "normpath") and len(node.args) == 1:
+            return _path_value(node.args[0], names)
+        if func.attr == "dirname" and len(node.args) == 1:
+            return _parent(_path_value(node.args[0], names))
+        if func.attr == "join":
+            parts = [arg.value if isinstance(arg, ast.Constant) else None for arg in node.args[1:]]
+            return _join(_path_value(node.args[0], names), *parts)
+    return None
+
+
+def _search_paths(body, names: Dict[str, str], found: Dict[str, None]):
+    """Collect sys.path.append/insert targets, following assignments in statement order."""
+    for node in body:
+        if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+            value = _path_value(node.value, names)
+            if value is not None:
+                names[node.targets[0].id] = value
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            statements = [s for s in node.body if not (isinstance(s, ast.Expr) and isinstance(s.value, ast.Constant))]
+            if len(statements) == 1 and isinstance(statements[0], ast.Return) and statements[0].value is not None:
+                value = _path_value(statements[0].value, names)
+                if value is not None:
+                    names[f"{node.name}()"] = value
+            _search_paths(node.body, dict(names), found)
+        elif isinstance(node, ast.Expr) and isinstance(node.value, ast.Call):
+            call = node.value
+            target = ast.unparse(call.func)
+            if target == "sys.path.append" and len(call.args) == 1:
+                value = _path_value(call.args[0], names)
+            elif target == "sys.path.insert" and len(call.args) == 2:
+                value = _path_value(call.args[1], names)
+            else:
+                value = None
+            if value is not None and value != _FILE:
+                found.setdefault(value)
+
+        for field in ("body", "orelse", "finalbody", "handlers"):
+            nested = getattr(node, field, None)
+            if isinstance(nested, list) and not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                _search_paths(nested, names, found)
+
+
+def _is_main_guard(node: ast.AST) -> bool:
+    """if __name__ == "__main__": at module level."""
+    return (
+        isinstance(node, ast.If)
+        and isinstance(node.test, ast.Compare)
+        and ast.unparse(node.test) in ('__name__ == "__main__"', "__name__ == '__main__'")
+    )
+
+
+def summarize(tree: ast.Module) -> FileSummary:
+    """Extract the cached facts from a parsed module."""
+    deferred = set()
+    scopes = [node for node in ast.walk(tree) if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))]
+    main_guards = [node for node in tree.body if _is_main_guard(node)]
+    scopes.extend(main_guards)
+    for scope in scopes:
+        for statement in scope.body:
+            deferred.update(id(inner) for inner in ast.walk(statement) if isinstance(inner, (ast.Import, ast.ImportFrom)))
+
+    imports = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                imports.append(ImportRecord(alias.name, node.lineno, None, None, id(node) in deferred))
+        elif isinstance(node, ast.ImportFrom):
+            names = tuple(alias.name for alias in node.names)
+            imports.append(ImportRecord(node.module or "", node.lineno, node.level, names, id(node) in deferred))
+
+    strings = {}
+    for node in _top_level_nodes(tree):
+        if isinstance(node, ast.Constant) and isinstance(node.value, str):
+            strings.setdefault(node.value)
+
+    symbols = {}
+    for name, node in _defined_names(tree.body):
+        symbols.setdefault(name)
+        if isinstance(node, ast.ClassDef):
+            for member, _ in _defined_names(node.body):
+                symbols.setdefault(f"{name}.{member}")
+
+    search_paths = {}
+    _search_paths(tree.body, {}, search_paths)
+
+    return FileSummary(None, tuple(imports), tuple(strings), tuple(symbols), tuple(search_paths), bool(main_guards))
+
+
+def _encode(summary: FileSummary) -> tuple:
+    return (
+        tuple(summary.error) if summary.error else None,
+        tuple(tuple(record) for record in summary.imports),
+        summary.strings,
+        summary.symbols,
+        summary.search_paths,
+        summary.main_guard,
+    )
+
+
+def _decode(entry: tuple) -> FileSummary:
+    error, imports, strings, symbols, search_paths, main_guard = entry
+    return FileSummary(
+        ParseError(*error) if error else None,
+        tuple(ImportRecord(*record) for record in imports),
+        strings,
+        symbols,
+        search_paths,
+        main_guard,
+    )
+
+
+def get_cache_path(workspace: Path) -> Path:
+    """Cache file for this interpreter and workspace, under the tools' own tree."""
+    version = ".".join(str(part) for part in sys.version_info[:3])
+    interpreter = f"{sys.implementation.name}-{version}-v{CACHE_FORMAT_VERSION}"
+    return (Path(__file__).resolve().parents[2] / ".glaido" / "parse_cache" / interpreter
+            / f"{workspace_key(workspace)}.marshal")
+
+
+class ParseCache:
+    """Summaries keyed by absolute path, validated by (mtime_ns, size)."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.entries: Dict[str, tuple] = None   # path -> (mtime_ns, size, encoded summary)
+        self.dirty: Dict[str, tuple] = {}
+        self.lock = threading.Lock()
+
+    def _read(self) -> Dict[str, tuple]:
+        try:
+            with open(self.path, "rb") as f:
+                entries = marshal.load(f)
+            return entries if isinstance(entries, dict) else {}
+        except (OSError, EOFError, ValueError, TypeError):
+            return {}
+
+    def get(self, key: str, stat: os.stat_result) -> Optional[FileSummary]:
+        with self.lock:
+            if self.entries is None:
+                self.entries = self._read()
+            entry = self.entries.get(key)
+        if entry is None or entry[0] != stat.st_mtime_ns or entry[1] != stat.st_size:
+            return None
+        try:
+            return _decode(entry[2])
+        except (TypeError, ValueError):
+            return None  # Entry from an incompatible writer
+
+    def put(self, key: str, stat: os.stat_result, summary: FileSummary):
+        # Environment failures (permissions, ...) are not properties of the file
+        if summary.error is not None and summary.error.kind == "other":
+            return
+        if time.time_ns() - stat.st_mtime_ns < RACY_WINDOW_NS:
+            return
+        entry = (stat.st_mtime_ns, stat.st_size, _encode(summary))
+        with self.lock:
+            if self.entries is None:
+                self.entries = self._read()
+            self.entries[key] = entry
+            self.dirty[key] = entry
+
+    def flush(self):
+        """Merge new entries into the file; concurrent writers keep each other's work."""
+        with self.lock:
+            if not self.dirty:
+                return
+            entries = self._read()
+            entries.update(self.dirty)
+            entries = {key: entry for key, entry in entries.items() if os.path.exists(key)}
+            self.dirty = {}
+            self.entries = entries
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            partial = self.path.with_name(f"{self.path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(partial, "wb") as f:
+                marshal.dump(entries, f)
+            os.replace(partial, self.path)
+        except OSError:
+            pass  # The cache is advisory; a read-only checkout simply re-parses
+
+
+_lock = threading.Lock()
+_caches: Dict[Path, ParseCache] = {}
+
+
+def get_cache() -> ParseCache:
+    """Process-wide cache for the workspace under verification."""
+    workspace = get_workspace_root()
+    with _lock:
+        if workspace not in _caches:
+            _caches[workspace] = ParseCache(get_cache_path(workspace))
+        return _caches[workspace]
+
+
+def cached_summary(path: Path) -> FileSummary:
+    """Summary for one file through the process-wide cache; the caller flushes."""
+    cache = get_cache()
+    try:
+        stat = os.stat(path)
+    except OSError as e:
+        return failed(e)
+    summary = cache.get(os.fspath(path), stat)
+    if summary is None:
+        stat, summary = summarize_file(path)
+        if stat is not None:
+            cache.put(os.fspath(path), stat, summary)
+    return summary
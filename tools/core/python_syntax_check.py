@@ -13,11 +13,20 @@ Invariant Compliance:
 import sys
 import os
 import json
-import ast
 import time
+import struct
+import importlib.util
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from datetime import datetime, timezone
 
+sys.path.append(str(Path(__file__).parent))
+from workspace_index import get_index
+import ast_store
+import parse_cache
+from base_tool_contract import ScanProgress, collect_violations, describe_total, get_max_violations, get_workspace_root
+
 # ------------------------------------------------------------------------------
 # Configuration
 # ------------------------------------------------------------------------------
@@ -46,6 +55,17 @@ IGNORE_DIRS = {
     ".venv"
 }
 
+# Parse in worker processes once at least this many files miss the parse
+# cache; below it, process start-up costs more than it saves
+PARALLEL_MIN_FILES = 256
+
+# Batches per worker: enough to even out uneven file sizes
+BATCHES_PER_WORKER = 4
+
+# Count files whose __pycache__ bytecode is current as valid without
+# parsing them (see compiled_cleanly())
+TRUST_BYTECODE = True
+
 # ------------------------------------------------------------------------------
 # Core Logic
 # ------------------------------------------------------------------------------
@@ -54,106 +74,176 @@ def _get_timestamp():
     """Return ISO 8601 timestamp with timezone"""
     return datetime.now(timezone.utc).astimezone().isoformat()
 
-def get_workspace_root():
+def scan_file(file_path, store=None):
     """
-    Resolve workspace root.
-    Assumes this script is in tools/core/ and root is ../../
+    Check a single file, using the persistent parse cache.
+    Returns error dict or None.
+
+    store: optional ast_store.consumer session covering file_path.
     """
-    return Path(__file__).resolve().parents[2]
+    if store is None:
+        with ast_store.consumer(TOOL_CATEGORY, [file_path]) as store:
+            return scan_file(file_path, store)
 
-def scan_file(file_path):
+    error = store.summary(file_path).error
+    if error is None:
+        return None
+
+    violation = {
+        "file": str(file_path.relative_to(get_workspace_root())),
+        "line": error.line,
+        "column": error.column,
+        "message": error.message,
+        "code_snippet": error.text.strip() if error.text else ""
+    }
+    if error.kind == "decode":
+        violation["message"] = "UnicodeDecodeError: File must be UTF-8 encoded"
+    elif error.kind == "other":
+        violation["message"] = f"Unexpected error: {error.message}"
+    return violation
+
+def collect_files(root):
     """
-    Parse a single file using ast.
-    Returns error dict or None.
+    Every file run_check() scans, in scan order.
+    """
+    index = get_index(root)
+    files = []
+    for dir_name in TARGET_DIRECTORIES:
+        for entry in index.files(dir_name, suffix=".py"):
+            # Check ignored directories
+            if any(part in IGNORE_DIRS for part in entry.path.split("/")):
+                continue
+            files.append(root / entry.path)
+
+    # specific root files
+    for file_name in TARGET_FILES:
+        if index.get(file_name) is not None:
+            files.append(root / file_name)
+    return files
+
+def compiled_cleanly(file_path):
+    """
+    True when this interpreter's __pycache__ bytecode for the file is
+    current, which proves the source compiles (and so parses).
+
+    Only the 16-byte header is read: magic number, flags (0 for
+    timestamp-based pyc), source mtime in whole seconds and source size.
+    Header mtimes have one-second resolution, so the pyc must also have
+    been written after that second ended; an edit in the same second could
+    otherwise keep both fields unchanged. Anything else means "unknown"
+    and the file is parsed.
     """
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
-            ast.parse(content, filename=str(file_path))
-            return None
-    except SyntaxError as e:
-        return {
-            "file": str(file_path.relative_to(get_workspace_root())),
-            "line": e.lineno,
-            "column": e.offset,
-            "message": e.msg,
-            "code_snippet": e.text.strip() if e.text else ""
-        }
-    except IndentationError as e:
-        return {
-            "file": str(file_path.relative_to(get_workspace_root())),
-            "line": e.lineno,
-            "column": e.offset,
-            "message": f"IndentationError: {e.msg}",
-            "code_snippet": e.text.strip() if e.text else ""
-        }
-    except UnicodeDecodeError:
-        return {
-            "file": str(file_path.relative_to(get_workspace_root())),
-            "line": 0,
-            "column": 0,
-            "message": "UnicodeDecodeError: File must be UTF-8 encoded",
-            "code_snippet": ""
-        }
-    except Exception as e:
-        return {
-            "file": str(file_path.relative_to(get_workspace_root())),
-            "line": 0,
-            "column": 0,
-            "message": f"Unexpected error: {str(e)}",
-            "code_snippet": ""
-        }
+        pyc_path = importlib.util.cache_from_source(str(file_path))
+        source = os.stat(file_path)
+        with open(pyc_path, "rb") as f:
+            header = f.read(16)
+            written_ns = os.fstat(f.fileno()).st_mtime_ns
+    except (OSError, NotImplementedError, ValueError):
+        return False
+    if len(header) != 16 or header[:4] != importlib.util.MAGIC_NUMBER:
+        return False
+
+    flags, mtime, size = struct.unpack("<3I", header[4:])
+    source_seconds = source.st_mtime_ns // 1_000_000_000
+    return (
+        flags == 0
+        and mtime == source_seconds & 0xFFFFFFFF
+        and size == source.st_size & 0xFFFFFFFF
+        and written_ns >= (source_seconds + 1) * 1_000_000_000
+    )
+
+def summarize_in_parallel(store, missing, workers):
+    """
+    Parse the given files (parse cache misses) on a process pool and
+    prime the session with their summaries. Workers return compact
+    summaries, never trees; results are taken in submission order, so the
+    report is identical to a sequential scan. Any pool failure leaves the
+    remaining files to the sequential path.
+    """
+    if workers < 2 or len(missing) < PARALLEL_MIN_FILES:
+        return 0
+
+    size = -(-len(missing) // (workers * BATCHES_PER_WORKER))
+    batches = [missing[i:i + size] for i in range(0, len(missing), size)]
+    primed = 0
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for batch, outcomes in zip(batches, executor.map(parse_cache.summarize_batch, batches)):
+                for path, (stat, summary) in zip(batch, outcomes):
+                    store.prime(path, stat, summary)
+                    primed += 1
+    except (OSError, BrokenProcessPool):
+        pass
+    return primed
+
+def iter_violations(paths, store, progress, proven=frozenset()):
+    """
+    Yield syntax violations file by file, counting files in progress.
+    Files in proven are valid without a look.
+    """
+    for path in paths:
+        error = None if path in proven else scan_file(path, store)
+        progress.scanned += 1
+        if error:
+            yield error
 
-def run_check():
+def run_check(files=None, workers=None, trust_bytecode=TRUST_BYTECODE):
     """
     Main execution logic.
+
+    files: optional workspace-relative paths to scan instead of the full
+    set (one shard of a distributed run; see merge_shards()).
+    workers: processes for parsing cache misses (default: one per CPU).
+    trust_bytecode: skip cache misses whose __pycache__ bytecode proves
+    they compile (compiled_cleanly()).
+    Under a violation cap (GLAIDO_MAX_VIOLATIONS) files are parsed
+    sequentially, so the scan can stop as soon as the cap is reached.
     """
     start_time = time.time()
     root = get_workspace_root()
-    files_checked = 0
-    violations = []
-    
-    # scan directories
-    for dir_name in TARGET_DIRECTORIES:
-        target_dir = root / dir_name
-        if not target_dir.exists():
-            continue
-            
-        for path in target_dir.rglob("*.py"):
-            # Check ignored directories
-            if any(part in IGNORE_DIRS for part in path.parts):
-                continue
-                
-            files_checked += 1
-            error = scan_file(path)
-            if error:
-                violations.append(error)
+    if files is None:
+        paths = collect_files(root)
+    else:
+        paths = [root / f for f in files]
+    limit = get_max_violations()
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if limit is not None:
+        workers = 1
 
-    # scan specific root files
-    for file_name in TARGET_FILES:
-        target_file = root / file_name
-        if target_file.exists():
-            files_checked += 1
-            error = scan_file(target_file)
-            if error:
-                violations.append(error)
+    progress = ScanProgress(len(paths))
+    with ast_store.consumer(TOOL_CATEGORY, paths) as store:
+        missing = store.missing(paths)
+        proven = set()
+        if trust_bytecode:
+            proven = {path for path in missing if compiled_cleanly(path)}
+            for path in proven:
+                store.release(path)
+            missing = [path for path in missing if path not in proven]
+        parsed_in_parallel = summarize_in_parallel(store, missing, workers)
+        violations, totals = collect_violations(iter_violations(paths, store, progress, proven), limit)
+    files_checked = progress.scanned
     
     # Prepare result
     status = "ready" if not violations else "error"
-    message = "Syntax valid" if status == "ready" else f"{len(violations)} syntax errors detected"
+    message = "Syntax valid" if status == "ready" else describe_total(totals, "syntax errors")
     
     report = {
         "category": TOOL_CATEGORY,
         "status": status,
         "timestamp": _get_timestamp(),
         "metrics": {
-            "duration_ms": round((time.time() - start_time) * 1000, 2)
+            "duration_ms": round((time.time() - start_time) * 1000, 2),
+            "parsed_in_parallel": parsed_in_parallel,
+            "trusted_bytecode": len(proven)
         },
         "results": {
             "files_checked": files_checked,
-            "syntax_errors": len(violations),
+            "syntax_errors": totals["total"],
             "scanned_directories": TARGET_DIRECTORIES,
-            "violations": violations
+            "violations": violations,
+            "violation_totals": totals
         },
         "message": message,
         "actionable": status == "error",
@@ -162,6 +252,46 @@ def run_check():
     
     return report
 
+def merge_shards(reports):
+    """
+    Combine run_check(files=...) reports for consecutive shards of
+    collect_files() into the report a single full run would produce.
+    """
+    files_checked = sum(r["results"]["files_checked"] for r in reports)
+    violations = [v for r in reports for v in r["results"]["violations"]]
+    limit = get_max_violations()
+    if limit is not None:
+        violations = violations[:limit]
+    shard_totals = [r["results"].get("violation_totals") or {"total": len(r["results"]["violations"]), "exact": True}
+                    for r in reports]
+    totals = {
+        "reported": len(violations),
+        "total": sum(t["total"] for t in shard_totals),
+        "exact": all(t["exact"] for t in shard_totals)
+    }
+    status = "ready" if not violations else "error"
+    message = "Syntax valid" if status == "ready" else describe_total(totals, "syntax errors")
+
+    return {
+        "category": TOOL_CATEGORY,
+        "status": status,
+        "timestamp": _get_timestamp(),
+        "metrics": {
+            "duration_ms": round(sum(r["metrics"]["duration_ms"] for r in reports), 2),
+            "shards": len(reports)
+        },
+        "results": {
+            "files_checked": files_checked,
+            "syntax_errors": totals["total"],
+            "scanned_directories": TARGET_DIRECTORIES,
+            "violations": violations,
+            "violation_totals": totals
+        },
+        "message": message,
+        "actionable": status == "error",
+        "remediation": "Fix syntax errors at reported lines." if status == "error" else None
+    }
+
 # ------------------------------------------------------------------------------
 # Entry Point
 # ------------------------------------------------------------------------------
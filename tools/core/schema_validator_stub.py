@@ -12,9 +12,13 @@ This tool checks that the validator is ready for use.
 import sys
 import json
 import time
+import importlib.util
 from datetime import datetime, timezone
 from pathlib import Path
 
+sys.path.append(str(Path(__file__).parent))
+from base_tool_contract import get_workspace_root
+
 def _get_timestamp():
     """Return ISO 8601 timestamp with timezone"""
     return datetime.now(timezone.utc).astimezone().isoformat()
@@ -22,7 +26,7 @@ def _get_timestamp():
 
 def check_validator_exists():
     """Verify validator.py exists"""
-    workspace = Path(__file__).resolve().parents[2]
+    workspace = get_workspace_root()
     validator_path = workspace / "tools" / "core" / "validator.py"
     
     return {
@@ -32,15 +36,13 @@ def check_validator_exists():
 
 
 def check_validator_importable():
-    """Test if validator can be imported"""
+    """Test if the verified workspace's validator can be imported"""
     try:
-        # Add workspace root to sys.path to allow absolute imports
-        workspace = Path(__file__).resolve().parents[2]
-        if str(workspace) not in sys.path:
-            sys.path.insert(0, str(workspace))
-
-        # Attempt import
-        import tools.core.validator as validator
+        # Load by path: another checkout's validator must not resolve to this tree's
+        validator_path = get_workspace_root() / "tools" / "core" / "validator.py"
+        spec = importlib.util.spec_from_file_location("_glaido_workspace_validator", validator_path)
+        validator = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(validator)
         
         # Check validate function exists
         has_validate = hasattr(validator, 'validate')
@@ -60,7 +62,7 @@ def check_validator_importable():
 
 def check_schema_documentation():
     """Verify schema documentation exists"""
-    workspace = Path(__file__).resolve().parents[2]
+    workspace = get_workspace_root()
     schema_doc = workspace / "architecture" / "specifications" / "data_schemas.md"
     
     exists = schema_doc.exists()
@@ -5,6 +5,10 @@ import time
 import pathlib
 import datetime
 
+sys.path.append(str(pathlib.Path(__file__).parent))
+from workspace_index import get_index
+from base_tool_contract import get_workspace_root
+
 # --- Configuration & Spec ---
 TOOL_CATEGORY = "workspace_hygiene"
 VERSION = "1.0.0"
@@ -41,11 +45,11 @@ def scan_root(root_path: pathlib.Path) -> list:
     violations = []
     
     # Iterate over all items in root
-    for item in root_path.iterdir():
-        name = item.name
+    for item in get_index(root_path).children(""):
+        name = item.path
         
         # 1. Directories
-        if item.is_dir():
+        if item.is_dir:
             if name not in ALLOWED_ROOT_DIRS:
                 # Check if it's a known benign directory?
                 # For now, strict enforcement based on spec.
@@ -57,11 +61,11 @@ def scan_root(root_path: pathlib.Path) -> list:
                 })
         
         # 2. Files
-        elif item.is_file():
+        else:
             if name in ALLOWED_ROOT_FILES:
                 continue
             
-            if item.suffix in ALLOWED_ROOT_EXTENSIONS:
+            if pathlib.PurePosixPath(name).suffix in ALLOWED_ROOT_EXTENSIONS:
                 continue
                 
             violations.append({
@@ -79,12 +83,12 @@ def scan_architecture(root_path: pathlib.Path) -> list:
     if not arch_path.exists():
         return [] # filesystem_integrity check handles missing dirs
         
-    for item in arch_path.iterdir():
-        if item.is_file():
-            if item.name not in ALLOWED_ARCH_FILES:
+    for item in get_index(root_path).children("architecture"):
+        if not item.is_dir:
+            if pathlib.PurePosixPath(item.path).name not in ALLOWED_ARCH_FILES:
                 violations.append({
                     "location": "architecture",
-                    "path": f"architecture/{item.name}",
+                    "path": item.path,
                     "rule": "Architecture root should contain directories only (Layer separation)."
                 })
     return violations
@@ -96,12 +100,12 @@ def scan_tools(root_path: pathlib.Path) -> list:
     if not tools_path.exists():
         return []
         
-    for item in tools_path.iterdir():
-        if item.is_file():
-            if item.suffix not in ALLOWED_TOOLS_EXTENSIONS:
+    for item in get_index(root_path).children("tools"):
+        if not item.is_dir:
+            if pathlib.PurePosixPath(item.path).suffix not in ALLOWED_TOOLS_EXTENSIONS:
                  violations.append({
                     "location": "tools",
-                    "path": f"tools/{item.name}",
+                    "path": item.path,
                     "rule": "Only .py script utilities allowed in tools root."
                 })
     return violations
@@ -110,7 +114,7 @@ def run_check():
     """Main execution logic."""
     try:
         start_time = time.time()
-        root_path = pathlib.Path.cwd()
+        root_path = get_workspace_root()
         timestamp = _get_timestamp()
         
         all_violations = []
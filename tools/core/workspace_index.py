@@ -0,0 +1,153 @@
+"""
+Tool: Workspace Index
+Purpose: Single-pass workspace listing shared by every scanner
+Category: core
+
+One os.scandir traversal records every file and directory under the
+workspace root with its size, mtime_ns and layer (first path component).
+Heavy directories in PRUNED_DIRS are recorded as entries but never
+descended into, so tools that only care about their names (hygiene)
+still see them.
+
+Within a verification run the orchestrator sets GLAIDO_RUN_ID; every tool
+in the same process then shares one index per workspace. Without a run
+id each get_index() call walks afresh, so a long-lived process can never
+read a stale listing.
+"""
+
+import os
+import re
+import sys
+import threading
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional
+
+sys.path.append(str(Path(__file__).parent))
+from base_tool_contract import get_setting
+
+# Never descended into
+PRUNED_DIRS = {".git", "__pycache__", ".glaido", ".tmp", "node_modules", "venv", ".venv"}
+
+RUN_ID_ENV = "GLAIDO_RUN_ID"
+
+
+def glob_to_regex(pattern: str) -> "re.Pattern":
+    """Translate a workspace-relative glob into a regex with pathlib '**' semantics."""
+    parts = []
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            parts.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            parts.append(".*")
+            i += 2
+        elif pattern[i] == "*":
+            parts.append("[^/]*")
+            i += 1
+        elif pattern[i] == "?":
+            parts.append("[^/]")
+            i += 1
+        else:
+            parts.append(re.escape(pattern[i]))
+            i += 1
+    return re.compile("".join(parts) + r"\Z")
+
+
+class IndexEntry(NamedTuple):
+    path: str               # Workspace-relative POSIX path
+    size: int
+    mtime_ns: int
+    layer: Optional[str]    # First path component; None for root entries
+    is_dir: bool
+    pruned: bool            # Directory whose contents were not indexed
+
+
+class WorkspaceIndex:
+    """Immutable listing of one workspace in a deterministic, name-sorted order."""
+
+    def __init__(self, root: Path, entries: List[IndexEntry]):
+        self.root = root
+        self.entries = entries
+        self._by_path = {entry.path: entry for entry in entries}
+        self._children: Dict[str, List[IndexEntry]] = {}
+        for entry in entries:
+            parent = entry.path.rpartition("/")[0]
+            self._children.setdefault(parent, []).append(entry)
+
+    @classmethod
+    def build(cls, root: Path, pruned=PRUNED_DIRS) -> "WorkspaceIndex":
+        """Walk the workspace once."""
+        root = Path(root)
+        entries = []
+        stack = [(str(root), "")]
+        while stack:
+            directory, prefix = stack.pop()
+            try:
+                with os.scandir(directory) as listing:
+                    children = sorted(listing, key=lambda entry: entry.name)
+            except OSError:
+                continue
+
+            subdirectories = []
+            for child in children:
+                relative = f"{prefix}{child.name}"
+                layer = prefix.split("/", 1)[0] if prefix else None
+                try:
+                    is_dir = child.is_dir(follow_symlinks=False)
+                    if not is_dir and not child.is_file():
+                        continue  # Sockets, broken links, ...
+                    stat = child.stat(follow_symlinks=False)
+                except OSError:
+                    continue  # Vanished between listing and stat
+
+                skip = is_dir and child.name in pruned
+                entries.append(IndexEntry(relative, stat.st_size, stat.st_mtime_ns, layer, is_dir, skip))
+                if is_dir and not skip:
+                    subdirectories.append((child.path, f"{relative}/"))
+
+            # Reversed so the stack pops them in name order
+            stack.extend(reversed(subdirectories))
+        return cls(root, entries)
+
+    def files(self, under: str = "", suffix: str = None) -> Iterator[IndexEntry]:
+        """File entries below a workspace-relative directory, optionally by suffix."""
+        prefix = f"{under.strip('/')}/" if under.strip("/") else ""
+        for entry in self.entries:
+            if entry.is_dir or not entry.path.startswith(prefix):
+                continue
+            if suffix is None or entry.path.endswith(suffix):
+                yield entry
+
+    def get(self, path: str) -> Optional[IndexEntry]:
+        """Entry for a workspace-relative path, if indexed."""
+        return self._by_path.get(path.strip("/"))
+
+    def children(self, directory: str = "") -> List[IndexEntry]:
+        """Immediate entries of a workspace-relative directory ("" is the root)."""
+        return self._children.get(directory.strip("/"), [])
+
+    def directories(self) -> List[IndexEntry]:
+        return [entry for entry in self.entries if entry.is_dir]
+
+
+_lock = threading.Lock()
+_cached: Dict[str, WorkspaceIndex] = {}
+_cached_run_id: Optional[str] = None
+
+
+def get_index(root: Path) -> WorkspaceIndex:
+    """Index for root, shared with every other caller in the current run."""
+    global _cached_run_id
+    run_id = get_setting(RUN_ID_ENV)
+    if run_id is None:
+        return WorkspaceIndex.build(root)
+
+    key = str(Path(root).resolve())
+    with _lock:
+        if run_id != _cached_run_id:
+            _cached.clear()
+            _cached_run_id = run_id
+        if key not in _cached:
+            _cached[key] = WorkspaceIndex.build(root)
+        return _cached[key]